@@ -0,0 +1,65 @@
+"""
+Benchmark scalar vs. array Doppler and free-space-loss calculations.
+
+Evaluates a link-budget sweep (frequencies x ranges) once with a Python loop
+over the scalar functions and once with a single broadcast call, and prints
+the throughput of each.
+
+Usage:
+    python benchmarks/bench_link_budget.py [--frequencies N] [--samples N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'utilities'))
+
+from satellite_tracker import calculate_doppler_shift, calculate_free_space_loss  # noqa: E402
+
+
+def best_of(func, repeats: int = 5) -> float:
+    """Return the fastest of several timed runs in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Link budget throughput benchmark')
+    parser.add_argument('--frequencies', type=int, default=16, help='Number of carrier frequencies')
+    parser.add_argument('--samples', type=int, default=6000, help='Range samples per frequency')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frequency = np.linspace(10.7e9, 12.7e9, args.frequencies)
+    distance = rng.uniform(550.0, 2500.0, args.samples)
+    range_rate = rng.uniform(-7.0, 7.0, args.samples)
+    count = args.frequencies * args.samples
+
+    def scalar():
+        for f in frequency.tolist():
+            for d, rr in zip(distance.tolist(), range_rate.tolist()):
+                calculate_doppler_shift(f, rr)
+                calculate_free_space_loss(f, d)
+
+    def vector():
+        calculate_doppler_shift(frequency[:, np.newaxis], range_rate)
+        calculate_free_space_loss(frequency[:, np.newaxis], distance)
+
+    scalar_time = best_of(scalar, repeats=1)
+    vector_time = best_of(vector)
+    print(f"{count} frequency x range points")
+    print(f"scalar loop : {scalar_time * 1e3:9.2f} ms  ({count / scalar_time / 1e6:8.2f} M points/s)")
+    print(f"broadcast   : {vector_time * 1e3:9.2f} ms  ({count / vector_time / 1e6:8.2f} M points/s)")
+    print(f"speedup     : {scalar_time / vector_time:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark ground station CLI startup.
+
+Runs `main.py --status`, in simulation and hardware mode, (and the other
+cheap modes) in fresh interpreters and compares the median wall time with a bare `python -c pass`.
+Exits with status 1 if the --status overhead exceeds the budget or it
+imports a heavy subsystem, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--budget SECONDS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent.parent / 'software' / 'ground-station' / 'main.py'
+EXAMPLE = MAIN.parent.parent / 'config.example.yaml'
+
+# Modules --status must not import
+HEAVY_MODULES = ('numpy', 'scipy', 'serial', 'flask', 'matplotlib', 'yaml',
+                 'antenna_link', 'telemetry', 'handover', 'slew', 'satellite_tracker')
+
+# Modes held to the budget and the import list
+STATUS_MODES = ('--status (no config)', '--status (cached config)', '--status (hardware)')
+
+# Run main() and report which heavy modules ended up loaded
+PROBE = """
+import os, runpy, sys
+sys.argv = [{main!r}] + {args!r}
+sys.path.insert(0, os.path.dirname({main!r}))
+try:
+    runpy.run_path({main!r}, run_name='__main__')
+except SystemExit:
+    pass
+print('LOADED', ','.join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def median_time(command, runs: int) -> float:
+    """Median wall time of a command over several runs, in seconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def loaded_modules(args) -> list:
+    """Heavy modules imported by one CLI invocation."""
+    probe = PROBE.format(main=str(MAIN), args=list(args), heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True).stdout
+    line = [line for line in output.splitlines() if line.startswith('LOADED')][-1]
+    return [name for name in line[len('LOADED '):].split(',') if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ground station CLI startup benchmark')
+    parser.add_argument('--runs', type=int, default=15, help='Runs per command (median is reported)')
+    parser.add_argument('--budget', type=float, default=0.15,
+                        help='Allowed --status time over a bare interpreter start, in seconds')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A config file exercises the loader; the first run fills the cache
+        config = Path(tmp) / 'config.yaml'
+        config.write_text(EXAMPLE.read_text())
+        modes = {
+            '--status (no config)': ['--simulate', '--status', '--config', str(Path(tmp) / 'missing.yaml')],
+            '--status (cached config)': ['--simulate', '--status', '--config', str(config)],
+            '--status (hardware)': ['--status', '--config', str(config)],
+            '--help': ['--help'],
+        }
+        subprocess.run([sys.executable, str(MAIN), *modes['--status (cached config)']],
+                       stdout=subprocess.DEVNULL, check=False)
+
+        baseline = median_time([sys.executable, '-c', 'pass'], args.runs)
+        results = {label: median_time([sys.executable, str(MAIN), *cli], args.runs)
+                   for label, cli in modes.items()}
+        heavy = {label: loaded_modules(modes[label]) for label in STATUS_MODES}
+        codes = {label: subprocess.run([sys.executable, str(MAIN), *modes[label]], stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL, check=False).returncode
+                 for label in STATUS_MODES}
+
+    print(f"{'python -c pass':28s}: {baseline * 1e3:7.1f} ms")
+    for label, elapsed in results.items():
+        print(f"{label:28s}: {elapsed * 1e3:7.1f} ms  (+{(elapsed - baseline) * 1e3:.1f} ms)")
+    overhead = max(results[label] for label in STATUS_MODES) - baseline
+    print(f"--status overhead {overhead * 1e3:.1f} ms, budget {args.budget * 1e3:.0f} ms")
+    failed = False
+    for label in STATUS_MODES:
+        if heavy[label]:
+            print(f"FAIL: {label} imports {', '.join(heavy[label])}")
+            failed = True
+        if codes[label]:
+            print(f"FAIL: {label} exits with status {codes[label]}")
+            failed = True
+    if overhead > args.budget:
+        print("FAIL: --status startup is over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
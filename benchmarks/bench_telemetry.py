@@ -0,0 +1,149 @@
+"""
+Benchmark telemetry sinks: row-by-row CSV and SQLite vs. batched writers.
+
+Writes the same synthetic per-tick records through each sink and prints the
+sustained throughput. The batched sinks are also run with an fsync (or
+synchronous=FULL commit) per batch to show what durability costs. Finally
+a month of 1 Hz records is written and queried through the memory-mapped
+reader.
+
+Usage:
+    python benchmarks/bench_telemetry.py [--records N] [--batch N] [--query-days N]
+"""
+
+import argparse
+import csv
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'ground-station'))
+
+from telemetry import TELEMETRY_DTYPE, TelemetryReader, TelemetryWriter  # noqa: E402
+
+
+def timed(func) -> float:
+    """Return the run time of func in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Telemetry sink throughput benchmark')
+    parser.add_argument('--records', type=int, default=200000, help='Records to write')
+    parser.add_argument('--batch', type=int, default=4096, help='Records per batch for the batched sinks')
+    parser.add_argument('--query-days', type=int, default=30, help='Days of 1 Hz data for the query benchmark')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    records = np.zeros(args.records, dtype=TELEMETRY_DTYPE)
+    records['timestamp'] = 1704110400.0 + np.arange(args.records) * 0.2
+    records['norad_id'] = 44713
+    for name in TELEMETRY_DTYPE.names[2:]:
+        records[name] = rng.normal(size=args.records)
+    rows = records.tolist()
+    columns = ', '.join(TELEMETRY_DTYPE.names)
+    insert = f"INSERT INTO telemetry VALUES ({', '.join('?' * len(TELEMETRY_DTYPE.names))})"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        def csv_rows(rows):
+            with open(tmp / 'telemetry.csv', 'w', newline='') as stream:
+                writer = csv.writer(stream)
+                for row in rows:
+                    writer.writerow(row)
+                    stream.flush()
+
+        def sqlite_connect(name, synchronous='NORMAL'):
+            db = sqlite3.connect(tmp / name)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(f'PRAGMA synchronous={synchronous}')
+            db.execute(f'CREATE TABLE telemetry ({columns})')
+            return db
+
+        def sqlite_rows(rows):
+            db = sqlite_connect('rows.db')
+            for row in rows:
+                db.execute(insert, row)
+                db.commit()
+            db.close()
+
+        def sqlite_batches(rows, synchronous='NORMAL'):
+            db = sqlite_connect(f'batches-{synchronous}.db', synchronous)
+            for first in range(0, len(rows), args.batch):
+                db.executemany(insert, rows[first:first + args.batch])
+                db.commit()
+            db.close()
+
+        def binary(rows, fsync=False):
+            writer = TelemetryWriter(tmp / f'telemetry-{fsync}.bin', max_size=0, batch_size=args.batch,
+                                     flush_interval=float('inf'), fsync=fsync)
+            for row in rows:
+                writer.append(*row)
+            writer.close()
+            return writer
+
+        def binary_extend():
+            with TelemetryWriter(tmp / 'telemetry-extend.bin', max_size=0, batch_size=args.batch,
+                                 flush_interval=float('inf')) as writer:
+                writer.extend(records)
+
+        # Row-by-row sinks are slow; time them on a slice and scale up
+        sample = rows[:20000]
+        scale = len(rows) / len(sample)
+        results = [
+            ('csv, flush per row', timed(lambda: csv_rows(sample)) * scale),
+            ('sqlite WAL, commit per row', timed(lambda: sqlite_rows(sample)) * scale),
+            ('sqlite WAL, executemany', timed(lambda: sqlite_batches(rows))),
+            ('sqlite WAL FULL, executemany', timed(lambda: sqlite_batches(rows, 'FULL'))),
+        ]
+        writers = {}
+        for fsync in (False, True):
+            elapsed = timed(lambda: writers.setdefault(fsync, binary(rows, fsync)))
+            results.append(('binary batches' + (', fsync' if fsync else ''), elapsed))
+        synced = writers[True]
+        results.append(('binary extend()', timed(binary_extend)))
+        fsync_share = synced.fsync_seconds / results[-2][1] * 100
+
+        # Query benchmark: a month of 1 Hz data, read through memory maps
+        month = np.zeros(args.query_days * 86400, dtype=TELEMETRY_DTYPE)
+        month['timestamp'] = 1704067200.0 + np.arange(len(month))
+        for name in ('pointing_error', 'signal_strength', 'doppler_shift'):
+            month[name] = rng.normal(size=len(month))
+        with TelemetryWriter(tmp / 'month.bin', max_size=0, batch_size=65536) as writer:
+            writer.extend(month)
+        del month
+        queries = []
+        reader = None
+
+        def open_reader():
+            nonlocal reader
+            reader = TelemetryReader(tmp / 'month.bin')
+        queries.append(('open (mmap)', timed(open_reader)))
+        middle = reader.start + 15 * 86400.0
+        queries.append(('slice one hour', timed(lambda: reader.slice(middle, middle + 3600.0)['pointing_error'].max())))
+        queries.append(('slice one day', timed(lambda: reader.slice(middle, middle + 86400.0)['pointing_error'].max())))
+        fields = ['pointing_error', 'signal_strength', 'doppler_shift']
+        queries.append(('downsample day, 1 min', timed(lambda: reader.downsample(fields, 60.0, middle,
+                                                                                  middle + 86400.0))))
+        queries.append(('downsample all, 1 h', timed(lambda: reader.downsample(fields, 3600.0))))
+        reader = None
+
+    print(f"{args.records} records, batches of {args.batch}")
+    for label, elapsed in results:
+        print(f"{label:30s}: {elapsed:8.3f} s  ({args.records / elapsed / 1e3:10.1f} k records/s)")
+    print(f"fsync: {synced.flushes} calls, {synced.fsync_seconds / max(synced.flushes, 1) * 1e3:.2f} ms each, "
+          f"{fsync_share:.0f}% of the fsync writer's time")
+    print(f"\n{args.query_days} days of 1 Hz telemetry ({args.query_days * 86400} records)")
+    for label, elapsed in queries:
+        print(f"{label:30s}: {elapsed * 1e3:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
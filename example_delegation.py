@@ -6,7 +6,7 @@ for satellite connectivity operations.
 """
 
 import os
-import time
+from concurrent.futures import wait
 from src.cloud_agent import CloudAgentClient, DelegationService, CloudAgentConfig
 from src.cloud_agent.delegation import TaskPriority
 
@@ -66,19 +66,20 @@ def main():
             for task in queue_status:
                 print(f"  - {task['task_type']} (ID: {task['task_id']}) [{task['status']}]")
             
-            # Simulate waiting for tasks to process
-            print("\nWaiting for tasks to process...")
-            time.sleep(2)
-            
-            # Refresh status of first task
-            print(f"\nRefreshing status for task {task_id1}...")
-            status1 = delegation_service.refresh_task_status(task_id1)
-            print(f"✓ Task {task_id1} status: {status1.get('status')}")
-            
-            # Refresh status of second task
-            print(f"\nRefreshing status for task {task_id2}...")
-            status2 = delegation_service.refresh_task_status(task_id2)
-            print(f"✓ Task {task_id2} status: {status2.get('status')}")
+            # Wait for both tasks to finish; the service follows the cloud
+            # agent's task events instead of polling each task
+            print("\nWaiting for tasks to finish...")
+            futures = {
+                task_id: delegation_service.wait_for_task(
+                    task_id,
+                    callback=lambda status: print(f"✓ Task {status['task_id']} finished: {status['status']}")
+                )
+                for task_id in (task_id1, task_id2)
+            }
+            done, not_done = wait(futures.values(), timeout=60)
+            for task_id, future in futures.items():
+                if future in not_done:
+                    print(f"  - Task {task_id} still running after 60 s")
             
             # Get updated queue status
             queue_status = delegation_service.get_queue_status()
@@ -98,7 +99,8 @@ def main():
         except Exception as e:
             print(f"\n✗ Error during task delegation: {e}")
         finally:
-            # Disconnect when done
+            # Stop watching for task completions and disconnect when done
+            delegation_service.shutdown()
             client.disconnect()
             print("\n✓ Disconnected from cloud agent")
     else:
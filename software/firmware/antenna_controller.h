@@ -41,6 +41,16 @@
 
 #define COMMAND_TIMEOUT_MS    5000      // Command timeout in milliseconds
 
+// Binary protocol (see software/ground-station/protocol.py)
+#define FRAME_SYNC_0          0xA5      // First sync byte
+#define FRAME_SYNC_1          0x5A      // Second sync byte
+#define FRAME_PAYLOAD_SIZE    12        // Bytes of payload per frame
+#define FRAME_SIZE            18        // Sync + type + sequence + payload + CRC
+#define FRAME_CRC_INIT        0xFFFF    // CRC-16/CCITT-FALSE, polynomial 0x1021
+
+#define TRAJECTORY_MAX_KNOTS  64        // Knots per trajectory segment buffer
+#define TRAJECTORY_MAX_SEGMENTS 4       // Segment buffers (active + queued)
+
 // Error codes
 typedef enum {
     ERROR_NONE = 0,
@@ -80,6 +90,58 @@ typedef struct {
     float speed_factor;      // Speed multiplier (0.1 to 1.0)
 } Command;
 
+// Binary frame types (host -> controller below 0x80)
+typedef enum {
+    FRAME_GOTO = 0x01,         // Payload: Command
+    FRAME_STOP = 0x02,         // No payload (zero filled)
+    FRAME_HOME = 0x03,         // No payload (zero filled)
+    FRAME_TRAJECTORY_BEGIN = 0x04, // Payload: TrajectoryHeader
+    FRAME_TRAJECTORY_KNOT = 0x05,  // Payload: TrajectoryKnot
+    FRAME_POSITION = 0x81,     // Payload: Position
+    FRAME_ERROR = 0x82         // Payload: uint32_t ErrorCode
+} FrameType;
+
+// Trajectory segment header: knots follow in FRAME_TRAJECTORY_KNOT frames
+typedef struct __attribute__((packed)) {
+    uint32_t segment_id;       // Echoed in error reports
+    uint32_t start_ms;         // Controller time (millis) of the first knot
+    uint16_t interval_ms;      // Time between knots
+    uint16_t knot_count;       // 2 to TRAJECTORY_MAX_KNOTS
+} TrajectoryHeader;
+
+// Cubic Hermite knot
+typedef struct __attribute__((packed)) {
+    float azimuth;             // Degrees, unwrapped (may leave 0-360)
+    float elevation;           // Degrees
+    int16_t azimuth_rate;      // Millidegrees per second
+    int16_t elevation_rate;    // Millidegrees per second
+} TrajectoryKnot;
+
+// Binary frame, little-endian, packed to exactly FRAME_SIZE bytes
+typedef struct __attribute__((packed)) {
+    uint8_t sync[2];           // FRAME_SYNC_0, FRAME_SYNC_1
+    uint8_t type;              // FrameType
+    uint8_t sequence;          // Incremented per frame, wraps at 256
+    union {
+        Command command;
+        Position position;
+        TrajectoryHeader trajectory;
+        TrajectoryKnot knot;
+        uint32_t error;
+        uint8_t raw[FRAME_PAYLOAD_SIZE];
+    } payload;
+    uint16_t crc;              // CRC over type, sequence and payload
+} Frame;
+
+// Incremental frame parser state
+typedef struct {
+    uint8_t buffer[FRAME_SIZE];
+    uint8_t length;            // Bytes collected for the current frame
+    uint8_t last_sequence;
+    uint32_t crc_errors;
+    uint32_t sequence_gaps;
+} FrameParser;
+
 // Function prototypes
 
 /**
@@ -116,6 +178,10 @@ ErrorCode antenna_home(void);
 
 /**
  * Main control loop - call regularly from main()
+ *
+ * While a trajectory segment is active the target is interpolated from it
+ * every call (cubic Hermite between knots), so no host commands are needed
+ * until the segment ends.
  */
 void antenna_controller_update(void);
 
@@ -139,11 +205,83 @@ ErrorCode antenna_get_last_error(void);
 
 /**
  * Process serial command
+ *
+ * Text commands (newline terminated):
+ *   GOTO <azimuth> <elevation>   Same as antenna_set_position()
+ *   STOP                         Same as antenna_emergency_stop()
+ *   HOME                         Same as antenna_home()
+ *   BINARY                       Switch the link to binary frames until reset
+ *
  * @param command Command string
  * @return Error code
  */
 ErrorCode antenna_process_command(const char* command);
 
+/**
+ * Compute the frame CRC (CRC-16/CCITT-FALSE)
+ * @param data Bytes to checksum
+ * @param length Number of bytes
+ * @return CRC value
+ */
+uint16_t frame_crc16(const uint8_t* data, uint16_t length);
+
+/**
+ * Reset a frame parser
+ * @param parser Parser state
+ */
+void frame_parser_init(FrameParser* parser);
+
+/**
+ * Feed one received byte to the parser. Bytes before the sync pattern
+ * are skipped, and a frame with a bad CRC is dropped by resynchronizing
+ * on the next sync pattern.
+ * @param parser Parser state
+ * @param byte Received byte
+ * @param frame Filled with the frame when one completes
+ * @return true if a valid frame was completed
+ */
+bool frame_parser_feed(FrameParser* parser, uint8_t byte, Frame* frame);
+
+/**
+ * Build a position report frame
+ * @param frame Frame to fill (sync, type, sequence and CRC included)
+ * @param position Current position
+ * @param sequence Sequence number
+ */
+void frame_encode_position(Frame* frame, const Position* position, uint8_t sequence);
+
+/**
+ * Start loading a trajectory segment into a free buffer. Loaded segments
+ * queue behind the active one and each becomes active at its start_ms.
+ * @param header Segment header
+ * @return ERROR_INVALID_POSITION if knot_count is out of range,
+ *         ERROR_COMMUNICATION if all TRAJECTORY_MAX_SEGMENTS buffers are in use
+ */
+ErrorCode antenna_trajectory_begin(const TrajectoryHeader* header);
+
+/**
+ * Append the next knot to the segment being loaded
+ * @param knot Knot in upload order
+ * @return ERROR_COMMUNICATION if no segment is loading or it is full
+ */
+ErrorCode antenna_trajectory_add_knot(const TrajectoryKnot* knot);
+
+/**
+ * Interpolate the active trajectory
+ * @param now_ms Controller time in milliseconds
+ * @param azimuth Filled with the target azimuth (0-360)
+ * @param elevation Filled with the target elevation
+ * @return true if a segment covers now_ms
+ */
+bool antenna_trajectory_target(uint32_t now_ms, float* azimuth, float* elevation);
+
+/**
+ * Execute a binary command frame (GOTO, STOP, HOME or trajectory upload)
+ * @param frame Frame returned by frame_parser_feed
+ * @return Error code
+ */
+ErrorCode antenna_process_frame(const Frame* frame);
+
 #endif // ANTENNA_CONTROLLER_H
 
 /*
@@ -0,0 +1,388 @@
+"""
+Starlink DIY - Antenna Controller Serial Link
+
+This module talks to the antenna controller firmware over a serial port
+without blocking the tracking loop. A writer thread drains a command queue
+in which a new pointing target replaces any target still waiting to be
+sent, so the controller always receives the freshest position instead of a
+backlog. A reader thread parses the controller's position reports and error
+messages as they arrive.
+
+Text protocol (one command per line):
+    GOTO <azimuth> <elevation>   Point the antenna (degrees)
+    STOP                         Emergency stop
+    HOME                         Return to the reference position
+Controller reports:
+    Position: Az=<azimuth> El=<elevation>
+    ERROR: <code>
+
+With protocol='binary' the link sends BINARY once after opening and then
+exchanges fixed-size frames (see protocol.py) in both directions.
+"""
+
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+import re
+import struct
+import threading
+import time
+
+import serial
+
+from protocol import (BINARY_MODE_COMMAND, FRAME_ERROR, FRAME_HOME, FRAME_POSITION, FRAME_STOP,
+                      FrameDecoder, FrameEncoder, decode_error, decode_position)
+from trajectory import ClockSync, TrajectorySegment, encode_segment
+
+READ_TIMEOUT_SEC = 0.05   # Reader wakes at least this often to check for shutdown
+MAX_LINE_LENGTH = 256     # Longer garbage lines are discarded
+ERROR_COMMUNICATION = 5   # Mirrors ErrorCode in firmware/antenna_controller.h
+
+PROTOCOL_TEXT = 'text'
+PROTOCOL_BINARY = 'binary'
+CONTROL_FRAMES = {'STOP': FRAME_STOP, 'HOME': FRAME_HOME}
+
+POSITION_PATTERN = re.compile(rb'Position:\s*Az=\s*(-?[\d.]+)\s+El=\s*(-?[\d.]+)')
+ERROR_PATTERN = re.compile(rb'ERROR:\s*(\d+)')
+
+
+class CommandQueue:
+    """
+    Outgoing command queue that coalesces pointing targets.
+
+    Control commands (stop, home, ...) are kept in order. At most one
+    pointing target is pending; setting a new one replaces it.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._commands = deque()
+        self._target = None
+        self._ready = threading.Condition()
+        self.coalesced = 0
+
+    def put_target(self, azimuth: float, elevation: float) -> None:
+        """
+        Queue a pointing target, replacing any target not yet sent.
+
+        Args:
+            azimuth: Target azimuth in degrees
+            elevation: Target elevation in degrees
+        """
+        with self._ready:
+            if self._target is not None:
+                self.coalesced += 1
+            self._target = (azimuth, elevation)
+            self._ready.notify()
+
+    def put_command(self, command: str, urgent: bool = False) -> None:
+        """
+        Queue a control command.
+
+        Args:
+            command: Command text without line terminator
+            urgent: Send before everything else and drop the pending target
+                and any queued trajectory uploads
+        """
+        with self._ready:
+            if urgent:
+                self._commands = deque(c for c in self._commands if not isinstance(c, tuple))
+                self._commands.appendleft(command)
+                self._target = None
+            else:
+                self._commands.append(command)
+            self._ready.notify()
+
+    def take(self, timeout: Optional[float] = None) -> Optional[Tuple]:
+        """
+        Remove the next command, waiting up to timeout for one.
+
+        Control commands go first, then the pending target.
+
+        Returns:
+            Tuple of command name and arguments, e.g. ('HOME',) or
+            ('GOTO', azimuth, elevation), or None on timeout
+        """
+        with self._ready:
+            if not self._commands and self._target is None:
+                self._ready.wait(timeout)
+            if self._commands:
+                command = self._commands.popleft()
+                return command if isinstance(command, tuple) else (command,)
+            if self._target is not None:
+                target = self._target
+                self._target = None
+                return ('GOTO',) + target
+            return None
+
+    def put_trajectory(self, segment) -> None:
+        """
+        Queue a trajectory segment upload behind earlier control commands.
+
+        Args:
+            segment: TrajectorySegment to upload
+        """
+        with self._ready:
+            self._commands.append(('TRAJECTORY', segment))
+            self._ready.notify()
+
+    def wake(self) -> None:
+        """Wake a waiting take() without queueing anything."""
+        with self._ready:
+            self._ready.notify_all()
+
+    def __len__(self) -> int:
+        with self._ready:
+            return len(self._commands) + (self._target is not None)
+
+
+def format_goto(azimuth: float, elevation: float) -> str:
+    """Format a text pointing command."""
+    return f"GOTO {azimuth:.3f} {elevation:.3f}"
+
+
+class AntennaLink:
+    """
+    Non-blocking serial link to the antenna controller.
+    """
+
+    def __init__(self, port: str, baud_rate: int = 115200, timeout: float = 1.0,
+                 on_position: Optional[Callable[[float, float], None]] = None,
+                 protocol: str = PROTOCOL_TEXT):
+        """
+        Initialize the link (the port is opened by open()).
+
+        Args:
+            port: Serial port device, e.g. /dev/ttyUSB0
+            baud_rate: Serial baud rate
+            timeout: Write timeout in seconds
+            on_position: Called from the reader thread with every position report
+            protocol: 'text' (newline-delimited commands) or 'binary' (frames)
+
+        Raises:
+            ValueError: If the protocol is unknown
+        """
+        if protocol not in (PROTOCOL_TEXT, PROTOCOL_BINARY):
+            raise ValueError(f"Unknown protocol: {protocol}")
+        self.protocol = protocol
+        self._encoder = FrameEncoder()
+        self._decoder = FrameDecoder(self.handle_frame)
+        self.port = port
+        self.baud_rate = baud_rate
+        self.timeout = timeout
+        self.on_position = on_position
+        self.queue = CommandQueue()
+        self.serial = None
+        self._running = False
+        self._threads = []
+
+        self.position: Optional[Tuple[float, float]] = None
+        self.position_time: Optional[float] = None  # time.monotonic() of the last report
+        self.clock_sync = ClockSync()
+        self.last_error: Optional[int] = None
+        self.sent = 0
+        self.reports = 0
+        self.discarded = 0
+        self.encode_errors = 0  # Commands dropped because they could not be encoded
+
+    def open(self) -> None:
+        """
+        Open the serial port and start the reader and writer threads.
+
+        Raises:
+            ConnectionError: If the port cannot be opened
+        """
+        try:
+            self.serial = serial.Serial(self.port, self.baud_rate, timeout=READ_TIMEOUT_SEC,
+                                        write_timeout=self.timeout)
+        except serial.SerialException as e:
+            raise ConnectionError(f"Failed to open {self.port}: {e}")
+        if self.protocol == PROTOCOL_BINARY:
+            self.serial.write(BINARY_MODE_COMMAND)
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._write_loop, name='antenna-writer', daemon=True),
+            threading.Thread(target=self._read_loop, name='antenna-reader', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def close(self) -> None:
+        """Stop the threads and close the port."""
+        self._running = False
+        self.queue.wake()
+        for thread in self._threads:
+            thread.join(1.0)
+        self._threads = []
+        if self.serial is not None:
+            self.serial.close()
+            self.serial = None
+
+    def is_open(self) -> bool:
+        """Check whether the link is running."""
+        return self._running
+
+    def set_target(self, azimuth: float, elevation: float) -> None:
+        """
+        Point the antenna. Returns immediately; a target that has not been
+        sent yet is replaced.
+
+        Args:
+            azimuth: Target azimuth in degrees
+            elevation: Target elevation in degrees
+        """
+        self.queue.put_target(azimuth, elevation)
+
+    def stop(self) -> None:
+        """Send an emergency stop ahead of any queued commands."""
+        self.queue.put_command("STOP", urgent=True)
+
+    def home(self) -> None:
+        """Send the antenna to its reference position."""
+        self.queue.put_command("HOME")
+
+    def upload_trajectory(self, segment: TrajectorySegment) -> None:
+        """
+        Upload a trajectory segment for the controller to follow on its own.
+
+        Args:
+            segment: Segment from trajectory.plan_trajectory()
+
+        Raises:
+            ValueError: If the link is not in binary mode or the controller
+                clock has not been synchronized from a position report yet
+        """
+        if self.protocol != PROTOCOL_BINARY:
+            raise ValueError("Trajectory upload requires the binary protocol")
+        if not self.clock_sync.synchronized:
+            raise ValueError("No position report received yet; controller clock unknown")
+        self.queue.put_trajectory(segment)
+
+    def encode(self, command: Tuple) -> bytes:
+        """
+        Encode a queued command for the configured protocol.
+
+        Args:
+            command: Tuple from CommandQueue.take()
+
+        Returns:
+            Bytes (or a reused frame buffer) to write to the port
+        """
+        name = command[0]
+        if self.protocol == PROTOCOL_BINARY:
+            if name == 'TRAJECTORY':
+                segment = command[1]
+                start_ms = self.clock_sync.to_controller_ms(segment.start)
+                return b''.join(bytes(frame) for frame in encode_segment(self._encoder, segment, start_ms))
+            if name == 'GOTO':
+                return self._encoder.goto(command[1], command[2])
+            return self._encoder.control(CONTROL_FRAMES[name])
+        if name == 'GOTO':
+            return format_goto(command[1], command[2]).encode('ascii') + b'\n'
+        return name.encode('ascii') + b'\n'
+
+    def _write_loop(self) -> None:
+        """Writer thread: send queued commands one at a time, dropping any that cannot be encoded."""
+        while self._running:
+            command = self.queue.take(timeout=READ_TIMEOUT_SEC)
+            if command is None:
+                continue
+            try:
+                data = self.encode(command)
+            except (struct.error, ValueError, OverflowError):
+                # e.g. trajectory rates outside the int16 frame field
+                self.encode_errors += 1
+                continue
+            try:
+                self.serial.write(data)
+                self.sent += 1
+            except serial.SerialException:
+                self.last_error = ERROR_COMMUNICATION
+
+    def _read_loop(self) -> None:
+        """Reader thread: decode frames, or split incoming bytes into lines."""
+        buffer = bytearray()
+        while self._running:
+            try:
+                data = self.serial.read(max(1, self.serial.in_waiting))
+            except (serial.SerialException, OSError):
+                if self._running:
+                    self.last_error = ERROR_COMMUNICATION
+                    time.sleep(READ_TIMEOUT_SEC)
+                continue
+            if not data:
+                continue
+            if self.protocol == PROTOCOL_BINARY:
+                self._decoder.feed(data)
+                continue
+            buffer += data
+            while True:
+                end = buffer.find(b'\n')
+                if end < 0:
+                    if len(buffer) > MAX_LINE_LENGTH:
+                        buffer.clear()
+                        self.discarded += 1
+                    break
+                self.handle_line(bytes(buffer[:end]).strip())
+                del buffer[:end + 1]
+
+    def handle_line(self, line: bytes) -> None:
+        """
+        Parse one line received from the controller.
+
+        Args:
+            line: Line without terminator
+        """
+        match = POSITION_PATTERN.match(line)
+        if match:
+            self._report_position(float(match.group(1)), float(match.group(2)))
+            return
+        match = ERROR_PATTERN.match(line)
+        if match:
+            self.last_error = int(match.group(1))
+        elif line:
+            self.discarded += 1
+
+    def handle_frame(self, frame_type: int, sequence: int, payload: memoryview) -> None:
+        """
+        Handle one binary frame received from the controller.
+
+        Args:
+            frame_type: FRAME_* type
+            sequence: Frame sequence number
+            payload: Frame payload
+        """
+        if frame_type == FRAME_POSITION:
+            azimuth, elevation, timestamp_ms = decode_position(payload)
+            self.clock_sync.observe(time.time(), timestamp_ms)
+            self._report_position(azimuth, elevation)
+        elif frame_type == FRAME_ERROR:
+            self.last_error = decode_error(payload)
+        else:
+            self.discarded += 1
+
+    def _report_position(self, azimuth: float, elevation: float) -> None:
+        self.position = (azimuth, elevation)
+        self.position_time = time.monotonic()
+        self.reports += 1
+        if self.on_position is not None:
+            self.on_position(azimuth, elevation)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get link counters.
+
+        Returns:
+            Dictionary with commands sent, targets coalesced, position
+            reports received, lines or frames discarded, frames failing
+            their CRC, commands dropped as unencodable and commands still
+            pending
+        """
+        return {
+            'sent': self.sent,
+            'coalesced': self.queue.coalesced,
+            'reports': self.reports,
+            'discarded': self.discarded,
+            'crc_errors': self._decoder.crc_errors,
+            'encode_errors': self.encode_errors,
+            'pending': len(self.queue),
+        }
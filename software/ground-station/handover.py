@@ -0,0 +1,400 @@
+"""
+Starlink DIY - Multi-Satellite Handover Scheduler
+
+The antenna can follow one satellite at a time. This module decides which
+one, over a rolling horizon, by dynamic programming over fixed time slots:
+
+* Passes from SatelliteTracker.predict_passes() select the satellites worth
+  considering; their look angles are sampled once on the slot grid.
+* In every slot the candidates are the up to max_satellites highest
+  satellites above the elevation mask that the mount can follow through the
+  whole slot (speed limit, azimuth wrap). An idle state covers slots with
+  no candidate.
+* Each slot earns its link seconds plus a bonus for its minimum elevation;
+  switching satellites costs the slew time from SlewPlanner as dead time,
+  and a switch whose slew does not fit in one slot is not allowed.
+  A Viterbi pass keeps the best score and back pointer per candidate and
+  slot, and the schedule is read back from the best final state.
+
+Because the tables are kept per slot, the plan is updated in place: the
+horizon is extended by computing only the new slots, and after a TLE
+refresh only satellites whose element epoch changed are re-sampled and the
+forward pass restarts at the first slot where their tracks moved.
+"""
+
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from slew import SlewPlanner
+
+SLOT_SEC = 10.0              # Planning resolution
+HORIZON_SEC = 3600.0         # Planned time ahead
+EXTEND_SEC = 600.0           # The horizon is extended in chunks of this length
+ELEVATION_WEIGHT = 0.05      # Link seconds credited per degree of slot elevation above the mask
+ANGLE_TOLERANCE_DEG = 0.05   # Re-sampled tracks closer than this leave the plan untouched
+DEFAULT_MAX_SATELLITES = 10  # tracking.max_satellites
+DEFAULT_MIN_ELEVATION = 25.0  # tracking.min_elevation
+IDLE = -1
+
+
+class Assignment(NamedTuple):
+    """One satellite tracked over a contiguous run of slots."""
+    norad_id: int
+    start: float                 # Unix seconds
+    end: float                   # Unix seconds
+    min_elevation: float         # Lowest elevation at the slot boundaries, degrees
+
+
+class HandoverScheduler:
+    """
+    Rolling-horizon satellite assignment that respects antenna slew limits.
+    """
+
+    def __init__(self, tracker, planner: SlewPlanner, max_satellites: int = DEFAULT_MAX_SATELLITES,
+                 min_elevation: float = DEFAULT_MIN_ELEVATION, horizon: float = HORIZON_SEC,
+                 slot: float = SLOT_SEC, elevation_weight: float = ELEVATION_WEIGHT):
+        """
+        Initialize the scheduler (the plan is built by plan() or advance()).
+
+        Args:
+            tracker: SatelliteTracker with the catalog loaded
+            planner: Slew planner for the antenna mount
+            max_satellites: Candidates considered per slot
+            min_elevation: Elevation mask in degrees
+            horizon: Seconds planned ahead
+            slot: Slot length in seconds
+            elevation_weight: Link seconds credited per degree above the mask
+
+        Raises:
+            ValueError: If a size or duration is not positive
+        """
+        if max_satellites < 1 or horizon <= 0 or slot <= 0:
+            raise ValueError("max_satellites, horizon and slot must be positive")
+        self.tracker = tracker
+        self.planner = planner
+        self.max_satellites = max_satellites
+        self.min_elevation = min_elevation
+        self.horizon = horizon
+        self.slot = slot
+        self.elevation_weight = elevation_weight
+
+        self.start: Optional[float] = None  # Time of the first grid point
+        self._ids = np.zeros(0, dtype=np.int64)     # Satellites with passes in the horizon
+        self._epochs = np.zeros(0)                  # Their element epochs when sampled
+        self._known = set()                         # Catalog searched for passes
+        self._az = np.zeros((0, 0))                 # (satellite, grid point) compass azimuth
+        self._el = np.zeros((0, 0))                 # (satellite, grid point) elevation
+        k = max_satellites
+        self._candidates = np.zeros((0, k), dtype=np.int64)  # (slot, k) rows of _ids, IDLE padded
+        self._elevation = np.zeros((0, k))                   # (slot, k) minimum elevation
+        self._score = np.zeros((0, k + 1))                   # (slot, state) best score; last state is idle
+        self._back = np.zeros((0, k + 1), dtype=np.int64)    # (slot, state) best previous state
+        self.last_replan = {'slots': 0, 'seconds': 0.0}
+        self._schedule = None  # schedule() result until the tables change
+
+    @property
+    def slots(self) -> int:
+        """Number of planned slots."""
+        return len(self._score)
+
+    @property
+    def end(self) -> Optional[float]:
+        """End of the planned horizon (Unix seconds)."""
+        return None if self.start is None else self.start + self.slot * self.slots
+
+    def _times(self, first: int, count: int) -> np.ndarray:
+        return self.start + self.slot * np.arange(first, first + count)
+
+    def _sample(self, ids: np.ndarray, times: np.ndarray):
+        if not len(ids):
+            return np.zeros((0, len(times))), np.zeros((0, len(times)))
+        angles = self.tracker.calculate_positions([int(i) for i in ids], times)
+        return angles['azimuth'], angles['elevation']
+
+    def _epochs_of(self, ids: np.ndarray) -> np.ndarray:
+        store = self.tracker.satellites
+        epoch = store.column('epoch')
+        rows = [store.find(int(i)) for i in ids]
+        return np.array([np.nan if row is None else epoch[row] for row in rows])
+
+    def _find_new(self, start: float, end: float, ids=None) -> np.ndarray:
+        """Satellites (not planned yet) with a pass overlapping [start, end]."""
+        passes = self.tracker.predict_passes(ids, start, end, self.min_elevation)
+        found = np.unique(passes['norad_id']).astype(np.int64)
+        return found[~np.isin(found, self._ids)]
+
+    def _add_satellites(self, ids: np.ndarray) -> None:
+        az, el = self._sample(ids, self._times(0, self.slots + 1))
+        self._ids = np.concatenate((self._ids, ids))
+        self._epochs = np.concatenate((self._epochs, self._epochs_of(ids)))
+        self._az = np.concatenate((self._az, az))
+        self._el = np.concatenate((self._el, el))
+
+    def plan(self, start: float) -> List[Assignment]:
+        """
+        Build a new plan from scratch.
+
+        Args:
+            start: Plan start (Unix seconds)
+
+        Returns:
+            The schedule, as from schedule()
+        """
+        began = time.perf_counter()
+        count = int(np.ceil(self.horizon / self.slot))
+        self.start = float(start)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._epochs = np.zeros(0)
+        self._az = np.zeros((0, count + 1))
+        self._el = np.zeros((0, count + 1))
+        self._score = np.zeros((count, self.max_satellites + 1))
+        self._back = np.zeros((count, self.max_satellites + 1), dtype=np.int64)
+        self._candidates = np.zeros((count, self.max_satellites), dtype=np.int64)
+        self._elevation = np.zeros((count, self.max_satellites))
+        self._known = set(int(n) for n in self.tracker.satellites.norad_id)
+        self._add_satellites(self._find_new(self.start, self.end))
+        self._replan(0, began)
+        return self.schedule()
+
+    def advance(self, now: float) -> List[Assignment]:
+        """
+        Roll the horizon forward: drop elapsed slots and plan new ones.
+
+        Only the slots added at the end are computed; the plan for the
+        slots already covered is kept.
+
+        Args:
+            now: Current time (Unix seconds)
+
+        Returns:
+            The schedule, as from schedule()
+        """
+        if self.start is None or now >= self.end:
+            return self.plan(now)
+        began = time.perf_counter()
+        elapsed = int((now - self.start) // self.slot)
+        if elapsed > 0:
+            self._schedule = None
+            self.start += elapsed * self.slot
+            self._az, self._el = self._az[:, elapsed:], self._el[:, elapsed:]
+            self._score, self._back = self._score[elapsed:], self._back[elapsed:]
+            self._candidates, self._elevation = self._candidates[elapsed:], self._elevation[elapsed:]
+        if self.end - now > self.horizon - EXTEND_SEC:
+            return self.schedule()
+
+        first = self.slots
+        old_end = self.end
+        added = int(np.ceil((now + self.horizon - old_end) / self.slot))
+        az, el = self._sample(self._ids, self._times(first + 1, added))
+        self._az = np.concatenate((self._az, az), axis=1)
+        self._el = np.concatenate((self._el, el), axis=1)
+        k = self.max_satellites
+        self._score = np.concatenate((self._score, np.zeros((added, k + 1))))
+        self._back = np.concatenate((self._back, np.zeros((added, k + 1), dtype=np.int64)))
+        self._candidates = np.concatenate((self._candidates, np.zeros((added, k), dtype=np.int64)))
+        self._elevation = np.concatenate((self._elevation, np.zeros((added, k))))
+
+        new = self._find_new(old_end, self.end)
+        if len(new):
+            self._add_satellites(new)
+            first = min(first, self._first_visible(self._el[-len(new):]))
+        self._replan(first, began)
+        return self.schedule()
+
+    def refresh(self) -> int:
+        """
+        Update the plan after the tracker's catalog was refreshed (update_tle).
+
+        Satellites whose element epoch changed are re-sampled, removed ones
+        are dropped, new ones are searched for passes, and the forward pass
+        restarts at the first slot whose candidates could have changed.
+
+        Returns:
+            Number of slots re-planned (0 if the plan was unaffected)
+        """
+        if self.start is None:
+            return 0
+        began = time.perf_counter()
+        first = self.slots
+        epochs = self._epochs_of(self._ids)
+        removed = np.isnan(epochs)
+        if removed.any():
+            # Re-plan from the first slot a removed satellite could take part in
+            columns = np.flatnonzero(np.any(self._el[removed] >= self.min_elevation, axis=0))
+            if len(columns):
+                first = min(first, max(int(columns[0]) - 1, 0))
+            slots = np.flatnonzero(np.any(np.isin(self._candidates, np.flatnonzero(removed)), axis=1))
+            if len(slots):
+                first = min(first, int(slots[0]))
+            self._drop(removed)
+            epochs = epochs[~removed]
+        changed = np.flatnonzero(epochs != self._epochs)
+        if len(changed):
+            az, el = self._sample(self._ids[changed], self._times(0, self.slots + 1))
+            moved = (np.abs((az - self._az[changed] + 180.0) % 360.0 - 180.0) > ANGLE_TOLERANCE_DEG) \
+                | (np.abs(el - self._el[changed]) > ANGLE_TOLERANCE_DEG)
+            # Only changes while the satellite could be a candidate matter
+            moved &= (el >= self.min_elevation) | (self._el[changed] >= self.min_elevation)
+            columns = np.flatnonzero(np.any(moved, axis=0))
+            if len(columns):
+                first = min(first, max(int(columns[0]) - 1, 0))
+            self._az[changed], self._el[changed] = az, el
+            self._epochs[changed] = epochs[changed]
+
+        catalog = set(int(n) for n in self.tracker.satellites.norad_id)
+        new_ids = sorted(catalog - self._known)
+        self._known = catalog
+        if new_ids:
+            new = self._find_new(self.start, self.end, new_ids)
+            if len(new):
+                self._add_satellites(new)
+                first = min(first, self._first_visible(self._el[-len(new):]))
+
+        if first < self.slots:
+            self._replan(first, began)
+            return self.slots - first
+        self.last_replan = {'slots': 0, 'seconds': time.perf_counter() - began}
+        return 0
+
+    def _drop(self, removed: np.ndarray) -> None:
+        """Remove satellites (boolean mask over _ids) and renumber the candidate rows."""
+        keep = ~removed
+        rows = np.where(keep, np.cumsum(keep) - 1, IDLE)
+        self._candidates = np.where(self._candidates >= 0, rows[np.maximum(self._candidates, 0)], IDLE)
+        self._ids, self._epochs = self._ids[keep], self._epochs[keep]
+        self._az, self._el = self._az[keep], self._el[keep]
+        self._schedule = None
+
+    def _first_visible(self, elevation: np.ndarray) -> int:
+        columns = np.flatnonzero(np.any(elevation >= self.min_elevation, axis=0))
+        return max(int(columns[0]) - 1, 0) if len(columns) else self.slots
+
+    def _build_candidates(self, first: int) -> None:
+        """Pick the per-slot candidates for slots first.. from the sampled tracks."""
+        k = self.max_satellites
+        count = self.slots - first
+        candidates = np.full((count, k), IDLE, dtype=np.int64)
+        elevation = np.full((count, k), -np.inf)
+        if len(self._ids):
+            az0, az1 = self._az[:, first:-1], self._az[:, first + 1:]
+            el0, el1 = self._el[:, first:-1], self._el[:, first + 1:]
+            low = np.minimum(el0, el1)
+            eligible = (low >= self.min_elevation) & self.planner.can_follow(az0, el0, az1, el1, self.slot)
+            low = np.where(eligible, low, -np.inf).T  # (slot, satellite)
+            take = min(k, low.shape[1])
+            order = np.argsort(-low, axis=1, kind='stable')[:, :take]
+            best = np.take_along_axis(low, order, axis=1)
+            candidates[:, :take] = np.where(np.isfinite(best), order, IDLE)
+            elevation[:, :take] = best
+        self._candidates[first:] = candidates
+        self._elevation[first:] = elevation
+
+    def _replan(self, first: int, began: float) -> None:
+        """Rebuild candidates and run the forward pass from slot first."""
+        self._build_candidates(first)
+        replanned = self.slots - first
+        k = self.max_satellites
+        candidates = self._candidates
+        reward = np.where(candidates >= 0,
+                          self.slot + self.elevation_weight * (self._elevation - self.min_elevation), -np.inf)
+        reward = np.concatenate((reward, np.zeros((self.slots, 1))), axis=1)
+
+        if first == 0 and self.slots:
+            self._score[0] = reward[0]
+            self._back[0] = IDLE
+            first = 1
+        if first < self.slots:
+            # Dead time for switching from the candidates of slot s-1 to
+            # those of slot s, evaluated at the boundary between them
+            slots = np.arange(first, self.slots)
+            prev = candidates[slots - 1]
+            cur = candidates[slots]
+            column = slots[:, np.newaxis]
+            if len(self._ids):
+                dead = self.planner.slew_times(self._az[np.maximum(prev, 0), column][:, :, np.newaxis],
+                                               self._el[np.maximum(prev, 0), column][:, :, np.newaxis],
+                                               self._az[np.maximum(cur, 0), column][:, np.newaxis, :],
+                                               self._el[np.maximum(cur, 0), column][:, np.newaxis, :])
+            else:
+                dead = np.zeros((len(slots), k, k))  # No satellite passes: every candidate is idle
+            dead = np.where(prev[:, :, np.newaxis] == cur[:, np.newaxis, :], 0.0, dead)
+            dead[dead > self.slot] = np.inf
+            # Idle row and column: entering or leaving idle costs nothing
+            dead = np.pad(dead, ((0, 0), (0, 1), (0, 1)))
+            for i, s in enumerate(slots):
+                total = self._score[s - 1][:, np.newaxis] - dead[i]
+                back = np.argmax(total, axis=0)
+                self._back[s] = back
+                self._score[s] = total[back, np.arange(k + 1)] + reward[s]
+        self._schedule = None
+        self.last_replan = {'slots': replanned, 'seconds': time.perf_counter() - began}
+
+    def schedule(self) -> List[Assignment]:
+        """
+        Read the best assignment back from the planning tables.
+
+        Returns:
+            Assignments in time order; gaps are idle time
+        """
+        if not self.slots:
+            return []
+        if self._schedule is not None:
+            return list(self._schedule)
+        states = np.empty(self.slots, dtype=np.int64)
+        states[-1] = int(np.argmax(self._score[-1]))
+        for s in range(self.slots - 1, 0, -1):
+            states[s - 1] = self._back[s, states[s]]
+        k = self.max_satellites
+        assignments = []
+        for s, state in enumerate(states):
+            row = self._candidates[s, state] if state < k else IDLE
+            if row == IDLE:
+                continue
+            norad_id = int(self._ids[row])
+            start = self.start + s * self.slot
+            elevation = float(self._elevation[s, state])
+            if assignments and assignments[-1].norad_id == norad_id and assignments[-1].end == start:
+                last = assignments[-1]
+                assignments[-1] = last._replace(end=start + self.slot,
+                                                min_elevation=min(last.min_elevation, elevation))
+            else:
+                assignments.append(Assignment(norad_id, start, start + self.slot, elevation))
+        self._schedule = assignments
+        return list(assignments)
+
+    def visible(self, now: float) -> bool:
+        """
+        Whether a planned-for satellite is above the mask around a time.
+
+        Satellites without a pass in the horizon are never sampled, so a
+        False here means nothing in the catalog is up (to the slot
+        sampling). Outside the plan the answer is True.
+
+        Args:
+            now: Unix seconds
+
+        Returns:
+            True if any sampled track is above min_elevation at either end
+            of the slot containing now
+        """
+        if self.start is None or not self.start <= now < self.end:
+            return True
+        s = int((now - self.start) // self.slot)
+        return bool(np.any(self._el[:, s:s + 2] >= self.min_elevation))
+
+    def target(self, now: float) -> Optional[int]:
+        """
+        Satellite planned for a time.
+
+        Args:
+            now: Unix seconds
+
+        Returns:
+            NORAD ID, or None when idle or outside the plan
+        """
+        for assignment in self.schedule():
+            if assignment.start <= now < assignment.end:
+                return assignment.norad_id
+        return None
@@ -3,13 +3,32 @@ Starlink DIY - Ground Station Main Application
 
 This is the main application for managing the satellite ground station.
 It provides a command-line interface for configuration, monitoring, and control.
+
+Only the standard library, the scheduler and the configuration loader are
+imported at startup. Subsystems (tracking math and NumPy, the serial link,
+telemetry storage) are imported by the methods that use them, so --status
+and --replay load only what they need.
 """
 
 import argparse
+import math
+import os
+import shutil
 import sys
+import tempfile
 import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from scheduler import RateScheduler
+from station_config import ConfigWatcher, GroundStationConfig, default_cache_dir, load_config
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'utilities'))
+
+if TYPE_CHECKING:
+    from slew import Handover, SlewPlanner
 
 
 class GroundStation:
@@ -18,6 +37,18 @@ class GroundStation:
     
     Manages satellite tracking, antenna control, and system monitoring.
     """
+
+    # Settings that are not in the configuration file; the rest live in self.config
+    COMMAND_LATENCY_TARGET_SEC = 0.05
+    CONFIG_CHECK_RATE_HZ = 1.0    # Configuration file polls for hot reload
+    SIMULATION_REPORT_SEC = 600.0  # Simulated seconds between console status lines
+    HANDOVER_CHECK_RATE_HZ = 1.0
+    HANDOVER_LOOKAHEAD_SEC = 300.0  # Candidate tracks sampled this far ahead
+    HANDOVER_STEP_SEC = 1.0
+    HANDOVER_HORIZON_SEC = 3600.0   # Rolling horizon of the handover plan
+    TRAJECTORY_CHECK_RATE_HZ = 1.0  # Top-ups of the controller's trajectory segment buffers
+    TLE_DOWNLOAD_TIMEOUT_SEC = 60.0
+    TLE_RETRY_SEC = 600.0           # Download retries while no catalog is loaded
     
     def __init__(self, config_file: str = "config.yaml", simulate: bool = False):
         """
@@ -30,62 +61,608 @@ class GroundStation:
         self.config_file = config_file
         self.simulate = simulate
         self.running = False
+        self.tracker = None      # SatelliteTracker with the loaded catalog
+        self.target = None       # Satellite currently being tracked
+        self.doppler = None      # DopplerCorrector for scheduled passes
+        self.pointing = None     # Latest (azimuth, elevation) in degrees
+        self.last_command = None  # Latest telemetry record from the command path
+        self.doppler_shift = None
+        self.scheduler = None
+        self.pipeline = None
+        self.antenna = None      # AntennaLink to the controller firmware
+        self.trajectory_end = 0.0  # Unix time the uploaded trajectory runs until
+        self.trajectory_pending = deque()  # Planned segments waiting for a free controller buffer
+        self._trajectory_ends = deque()    # End times of segments held by the controller
+        self.telemetry = None    # TelemetryWriter, opened once tracking starts
+        self.handover_plan = None  # HandoverScheduler, built once tracking starts
+        self.config = GroundStationConfig()  # Defaults until load_configuration()
+        self.config_cache = default_cache_dir()  # Parsed configuration cache (None to disable)
+        self.config_watcher = None  # ConfigWatcher for hot reload
+        self.clock = time.time   # Unix time source; a VirtualClock in simulation
+        self.signal_model = None  # SignalModel for simulated signal telemetry
+        self._slew = None        # SlewPlanner, built on first use
         
         print(f"Initializing Starlink DIY Ground Station...")
         print(f"Mode: {'SIMULATION' if simulate else 'HARDWARE'}")
         
     def load_configuration(self):
-        """Load configuration from file."""
-        # TODO: Implement YAML configuration loading
-        print(f"Loading configuration from {self.config_file}")
-        
+        """
+        Load and validate the configuration file.
+
+        A missing file keeps the defaults (those of config.example.yaml).
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        path = Path(self.config_file)
+        if not path.exists():
+            print(f"Configuration file {path} not found, using defaults")
+            return
+        config, cached = load_config(path, self.config_cache)
+        print(f"Loaded configuration from {path}{' (cached)' if cached else ''}")
+        self.apply_configuration(config, config.changed_sections(self.config))
+        self.config_watcher = ConfigWatcher(path, config, self.apply_configuration, self.config_cache)
+
+    @property
+    def slew(self) -> 'SlewPlanner':
+        """Slew planner for the configured motors and pointing limits."""
+        if self._slew is None:
+            self._slew = self.slew_planner()
+        return self._slew
+
+    def slew_planner(self) -> 'SlewPlanner':
+        """Build a slew planner for the configured motors and pointing limits."""
+        from slew import MotionLimits, SlewPlanner
+
+        motor, antenna = self.config.hardware.motor, self.config.antenna
+        return SlewPlanner(MotionLimits.from_motor(
+            motor.azimuth_steps_per_degree, motor.max_speed, motor.acceleration,
+            azimuth_min=antenna.azimuth_min, azimuth_max=antenna.azimuth_max,
+            elevation_min=antenna.elevation_min, elevation_max=antenna.elevation_max))
+
+    def apply_configuration(self, config: GroundStationConfig, changed: list):
+        """
+        Swap in a new configuration, touching only the changed sections.
+
+        Rates take effect in the running scheduler and pipeline; serial link
+        settings need a restart.
+
+        Args:
+            config: New configuration
+            changed: Names of the sections that differ from self.config
+        """
+        old, self.config = self.config, config
+        if 'station' in changed and self.tracker is not None:
+            station = config.station
+            self.tracker.set_observer(station.latitude, station.longitude, station.elevation)
+            self.handover_plan = None
+        if 'antenna' in changed or 'hardware' in changed:
+            self._slew = None
+            self.handover_plan = None
+        if 'tracking' in changed:
+            tracking = config.tracking
+            if self.pipeline is not None and tracking.update_rate != old.tracking.update_rate:
+                self.pipeline.set_rate(tracking.update_rate)
+                if self.clock is not time.time and self.scheduler is not None:
+                    self.scheduler.set_rate('tracking', tracking.update_rate)
+            if (tracking.min_elevation, tracking.max_satellites) != (old.tracking.min_elevation,
+                                                                     old.tracking.max_satellites):
+                self.handover_plan = None
+            if (tracking.tle_update_interval != old.tracking.tle_update_interval and self.tracker is not None
+                    and self.scheduler is not None and not self.simulate):
+                self.scheduler.set_rate('tle_refresh', 1.0 / tracking.tle_update_interval)
+        if 'signal' in changed and self.scheduler is not None:
+            self.scheduler.set_rate('doppler', config.signal.doppler_update_rate)
+        if 'logging' in changed:
+            interval = config.logging.telemetry.interval
+            if self.scheduler is not None and not self.simulate:
+                self.scheduler.set_rate('telemetry', 1.0 / interval)
+            if self.telemetry is not None:
+                self.telemetry.flush_interval = interval
+        if 'hardware' in changed and self.antenna is not None:
+            print("Serial link settings take effect after a restart")
+        if self.config_watcher is not None:
+            print(f"Configuration reloaded: {', '.join(changed)}")
+
     def initialize_hardware(self):
         """Initialize hardware connections."""
         if self.simulate:
-            print("Simulation mode - skipping hardware initialization")
+            print("Simulation mode - simulated hardware starts with tracking")
             return
         
-        # TODO: Initialize serial ports, antenna controllers, etc.
         print("Initializing hardware connections...")
+        from antenna_link import AntennaLink
+
+        hardware = self.config.hardware
+        self.antenna = AntennaLink(hardware.serial_port, hardware.baud_rate, hardware.timeout,
+                                   protocol=hardware.protocol)
+        self.antenna.open()
+        print(f"Antenna controller on {hardware.serial_port} ({hardware.baud_rate} baud)")
         
-    def start_tracking(self):
-        """Start satellite tracking loop."""
+    def initialize_simulation(self):
+        """
+        Set up the simulated hardware: a virtual clock, a synthetic catalog
+        (unless one is loaded), a simulated antenna and a synthetic receiver,
+        all seeded from the simulation section.
+        """
+        from simulation import SignalModel, SimulatedAntenna, VirtualClock, make_tracker
+
+        simulation, station, antenna = self.config.simulation, self.config.station, self.config.antenna
+        if self.tracker is None:
+            self.tracker = make_tracker(station.latitude, station.longitude, station.elevation,
+                                        simulation.simulated_satellites, simulation.seed)
+        self.clock = VirtualClock()
+        self.antenna = SimulatedAntenna(self.slew.limits, self.clock)
+        self.signal_model = SignalModel(self.config.signal.center_frequency, antenna.diameter, antenna.gain,
+                                        simulation.noise_level, simulation.seed)
+        print(f"Simulation mode - {len(self.tracker.satellites)} satellites, seed {simulation.seed}")
+
+    def start_tracking(self, duration: Optional[float] = None):
+        """
+        Start satellite tracking loop.
+
+        Args:
+            duration: Stop after this many seconds (simulated seconds in
+                simulation mode; default: run until stopped)
+        """
         print("\nStarting tracking system...")
+        from doppler_tables import DopplerCorrector
+        from pipeline import TrackingPipeline
+        from telemetry import TelemetryWriter
+
+        if self.simulate and self.antenna is None:
+            self.initialize_simulation()
+        signal = self.config.signal
+        if self.tracker is not None and signal.enable_doppler_correction:
+            self.doppler = DopplerCorrector(self.tracker, signal.center_frequency, signal.doppler_update_rate)
         self.running = True
+        end = self.clock() + duration if duration is not None else math.inf
+        # Propagation, antenna commands and command telemetry run in the
+        # pipeline threads; the scheduler keeps the remaining periodic stages.
+        # In simulation everything runs on this thread against the virtual clock.
+        self.pipeline = TrackingPipeline(self.tracker, self.send_pointing, self.record_command,
+                                         rate_hz=self.config.tracking.update_rate,
+                                         latency_target=self.COMMAND_LATENCY_TARGET_SEC,
+                                         clock=self.clock)
+        self.pipeline.set_target(self.target)
+        log_config = self.config.logging
+        if log_config.telemetry.enabled:
+            self.telemetry = TelemetryWriter(log_config.telemetry.file, log_config.max_size,
+                                             log_config.backup_count, flush_interval=log_config.telemetry.interval,
+                                             clock=self.clock)
+        if self.simulate:
+            self.scheduler = RateScheduler(self.clock, self.clock.sleep)
+            self.scheduler.add_stage('tracking', self.config.tracking.update_rate, self.pipeline.run_pending)
+            report_rate = 1.0 / self.SIMULATION_REPORT_SEC
+        else:
+            self.scheduler = RateScheduler()
+            # Runs first, so the catalog is loaded before the first handover check
+            self.scheduler.add_stage('tle_refresh', 1.0 / self.config.tracking.tle_update_interval,
+                                     self.refresh_catalog)
+            report_rate = 1.0 / log_config.telemetry.interval
+        self.scheduler.add_stage('doppler', self.config.signal.doppler_update_rate, self.update_signal)
+        self.scheduler.add_stage('telemetry', report_rate, self.log_telemetry)
+        self.scheduler.add_stage('handover', self.HANDOVER_CHECK_RATE_HZ, self.check_handover)
+        self.scheduler.add_stage('trajectory', self.TRAJECTORY_CHECK_RATE_HZ, self.feed_trajectory)
+        if self.config_watcher is not None:
+            self.scheduler.add_stage('config', self.CONFIG_CHECK_RATE_HZ, self.config_watcher.poll)
         
+        if not self.simulate:
+            self.pipeline.start()
         try:
-            while self.running:
-                # TODO: Implement tracking loop
-                # 1. Update satellite positions
-                # 2. Calculate pointing angles
-                # 3. Send commands to antenna
-                # 4. Monitor signal quality
-                # 5. Log telemetry
-                
-                timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-                print(f"[{timestamp}] Tracking... (Press Ctrl+C to stop)")
-                time.sleep(5)
-                
+            self.scheduler.run(lambda: not self.running or self.clock() >= end)
         except KeyboardInterrupt:
             print("\n\nStopping tracking system...")
             self.running = False
+        finally:
+            self.pipeline.stop()
+            if self.telemetry is not None:
+                self.telemetry.flush()
+
+    def track(self, satellite_id: str):
+        """
+        Switch the tracking target, cancelling a trajectory being followed.
+
+        Args:
+            satellite_id: Satellite to track (None to stop tracking)
+        """
+        if satellite_id != self.target and self.clock() <= self.trajectory_end:
+            self.cancel_trajectory()
+        self.target = satellite_id
+        if self.pipeline is not None:
+            self.pipeline.set_target(satellite_id)
+
+    def antenna_position(self):
+        """Best known (mechanical azimuth, elevation) of the antenna."""
+        if self.antenna is not None and self.antenna.position is not None:
+            return self.antenna.position
+        if self.pointing is not None:
+            return self.pointing
+        return self.slew.limits.azimuth_min, self.slew.limits.elevation_max
+
+    def handover(self, now: Optional[float] = None) -> Optional['Handover']:
+        """
+        Switch to the visible satellite the antenna can reach with the least dead time.
+
+        Candidates are the highest tracking.max_satellites satellites above
+        tracking.min_elevation; passes the mount cannot follow are skipped.
+
+        Args:
+            now: Current time (Unix seconds, default: now)
+
+        Returns:
+            The chosen Handover, or None if no satellite can be reached
+        """
+        if self.tracker is None:
+            return None
+        import numpy as np
+
+        now = self.clock() if now is None else now
+        tracking = self.config.tracking
+        visible = self.tracker.visible_satellites(now, tracking.min_elevation)
+        ids = [int(n) for n in visible['norad_id'] if int(n) != self.target][:tracking.max_satellites]
+        if not ids:
+            return None
+        times = now + np.arange(0.0, self.HANDOVER_LOOKAHEAD_SEC + self.HANDOVER_STEP_SEC, self.HANDOVER_STEP_SEC)
+        angles = self.tracker.calculate_positions(ids, times)
+        candidates = {sat: (times, angles['azimuth'][i], angles['elevation'][i]) for i, sat in enumerate(ids)}
+        azimuth, elevation = self.antenna_position()
+        choice = self.slew.choose_handover(azimuth, elevation, now, candidates)
+        if choice is not None:
+            self.track(choice.satellite_id)
+            if self.doppler is not None and self.doppler.table_for(choice.satellite_id, now) is None:
+                self.doppler.schedule_pass(choice.satellite_id, now, times[-1])
+        return choice
+
+    def check_handover(self):
+        """
+        Follow the handover plan (handover stage).
+
+        The plan's horizon is rolled forward on every call. When the plan
+        has nothing for now and the current target has set, the reachable
+        visible satellite with the least dead time is picked instead.
+        Doppler tables are built for assignments starting within the
+        handover lookahead and dropped once their pass has ended. With the
+        binary serial protocol each planned assignment is uploaded as a
+        trajectory, so the controller follows it without point commands.
+        """
+        if self.tracker is None:
+            return
+        now = self.clock()
+        tracking = self.config.tracking
+        if self.handover_plan is None:
+            from handover import HandoverScheduler
+
+            self.handover_plan = HandoverScheduler(self.tracker, self.slew, tracking.max_satellites,
+                                                   tracking.min_elevation, self.HANDOVER_HORIZON_SEC)
+        schedule = self.handover_plan.advance(now)
+        if self.doppler is not None:
+            self.doppler.evict(now)
+            for assignment in schedule:
+                if assignment.start > now + self.HANDOVER_LOOKAHEAD_SEC:
+                    break
+                if assignment.end > now and self.doppler.table_for(assignment.norad_id, assignment.end) is None:
+                    self.doppler.schedule_pass(assignment.norad_id, max(assignment.start, now), assignment.end)
+        planned = self.handover_plan.target(now)
+        if planned is not None:
+            if planned != self.target:
+                self.track(planned)
+            if self.config.hardware.protocol == 'binary' and self.antenna is not None and now > self.trajectory_end:
+                end = next(a.end for a in schedule if a.norad_id == planned and a.start <= now < a.end)
+                try:
+                    self.upload_trajectory(planned, now, end)
+                except ValueError:
+                    pass  # No position report yet: point commands continue until the next check
+        elif self.target is None or (self.pointing is not None and self.pointing[1] < tracking.min_elevation):
+            # The plan samples every satellite with a pass in its horizon, so
+            # the catalog is only searched when one of them is up
+            choice = self.handover(now) if self.handover_plan.visible(now) else None
+            if choice is None and self.target is not None:
+                self.track(None)  # Nothing reachable: stop following a satellite that has set
+
+    def update_tle(self, tle_file: str) -> dict:
+        """
+        Refresh the catalog from a new TLE file and re-plan handovers incrementally.
+
+        Args:
+            tle_file: Path to TLE or OMM CSV file
+
+        Returns:
+            Catalog change counts from SatelliteTracker.update_tle()
+        """
+        summary = self.tracker.update_tle(tle_file)
+        if self.handover_plan is not None:
+            self.handover_plan.refresh()
+        return summary
+
+    def refresh_catalog(self):
+        """
+        Load or refresh the catalog from tracking.tle_source (TLE refresh stage).
+
+        The source is a URL or a local file path. The first successful run
+        builds the tracker; later runs refresh it incrementally. While no
+        catalog is loaded the pipeline idles and a failed download is
+        retried every TLE_RETRY_SEC; a failed refresh keeps the loaded one.
+        """
+        tracking, station = self.config.tracking, self.config.station
+        source = tracking.tle_source
+        try:
+            tle_file = self.download_tle(source) if '://' in source else source
+            try:
+                if self.tracker is None:
+                    from satellite_tracker import SatelliteTracker
+
+                    tracker = SatelliteTracker(station.latitude, station.longitude, station.elevation)
+                    count = tracker.load_tle(tle_file)
+                    self.use_tracker(tracker)
+                    print(f"Loaded {count} satellites from {source}")
+                else:
+                    summary = self.update_tle(tle_file)
+                    print(f"Refreshed catalog from {source}: "
+                          + ', '.join(f"{count} {change}" for change, count in summary.items()))
+            finally:
+                if tle_file != source:
+                    os.unlink(tle_file)
+        except (OSError, ValueError) as e:
+            print(f"TLE update from {source} failed: {e}", file=sys.stderr)
+            if self.tracker is None and self.scheduler is not None:
+                self.scheduler.set_rate('tle_refresh', 1.0 / self.TLE_RETRY_SEC)
+            return
+        if self.scheduler is not None:
+            self.scheduler.set_rate('tle_refresh', 1.0 / tracking.tle_update_interval)
+
+    def download_tle(self, url: str) -> str:
+        """
+        Download a catalog to a temporary file.
+
+        Args:
+            url: TLE or OMM CSV URL
+
+        Returns:
+            Path of the temporary file; the caller deletes it
+
+        Raises:
+            OSError: If the download fails
+        """
+        import urllib.request
+
+        with urllib.request.urlopen(url, timeout=self.TLE_DOWNLOAD_TIMEOUT_SEC) as response:
+            fd, path = tempfile.mkstemp(suffix='.tle')
+            try:
+                with os.fdopen(fd, 'wb') as stream:
+                    shutil.copyfileobj(response, stream)
+            except BaseException:
+                os.unlink(path)
+                raise
+        return path
+
+    def use_tracker(self, tracker):
+        """
+        Track with a newly loaded catalog.
+
+        Args:
+            tracker: SatelliteTracker with the catalog loaded
+        """
+        self.tracker = tracker
+        self.handover_plan = None
+        if self.pipeline is None:
+            return
+        # Tracking started without a catalog: hand it to the idle stages
+        self.pipeline.set_tracker(tracker)
+        signal = self.config.signal
+        if self.doppler is None and signal.enable_doppler_correction:
+            from doppler_tables import DopplerCorrector
+
+            self.doppler = DopplerCorrector(tracker, signal.center_frequency, signal.doppler_update_rate)
+
+    def send_pointing(self, azimuth: float, elevation: float):
+        """Send one pointing command (called from the pipeline command sender)."""
+        self.pointing = (azimuth, elevation)
+        if self.antenna is not None and self.clock() > self.trajectory_end:
+            self.antenna.set_target(azimuth, elevation)
+
+    def upload_trajectory(self, satellite_id: str, start: float, end: float) -> int:
+        """
+        Upload a pass as trajectory segments so the controller tracks it locally.
+
+        The controller holds at most MAX_SEGMENTS segments (active and
+        queued), so only that many are sent now; feed_trajectory() sends
+        the rest as earlier segments complete. Point-by-point commands are
+        suppressed until the trajectory ends.
+
+        Args:
+            satellite_id: Satellite to follow
+            start: First time to cover (Unix seconds)
+            end: Last time to cover (Unix seconds)
+
+        Returns:
+            Number of segments planned
+
+        Raises:
+            ValueError: If there is no antenna link in binary mode, no
+                tracker, or the satellite is not loaded
+        """
+        if self.antenna is None or self.tracker is None:
+            raise ValueError("Trajectory upload needs an antenna link and a loaded catalog")
+        from trajectory import plan_trajectory
+
+        segments = plan_trajectory(self.tracker, satellite_id, start, end)
+        self.trajectory_pending = deque(segments)
+        self.feed_trajectory()
+        self.trajectory_end = end
+        return len(segments)
+
+    def cancel_trajectory(self):
+        """Stop following the uploaded trajectory and resume point commands."""
+        self.trajectory_pending.clear()
+        self._trajectory_ends.clear()
+        self.trajectory_end = 0.0
+        if self.antenna is not None:
+            self.antenna.stop()  # The controller drops its segments on STOP
+
+    def feed_trajectory(self) -> int:
+        """
+        Upload pending trajectory segments into free controller buffers (trajectory stage).
+
+        A segment's buffer frees once the controller has moved past its end.
+
+        Returns:
+            Number of segments uploaded
+        """
+        if not self.trajectory_pending:
+            return 0
+        from trajectory import MAX_SEGMENTS
+
+        now = self.clock()
+        while self._trajectory_ends and self._trajectory_ends[0] < now:
+            self._trajectory_ends.popleft()
+        uploaded = 0
+        while self.trajectory_pending and len(self._trajectory_ends) < MAX_SEGMENTS:
+            segment = self.trajectory_pending[0]
+            self.antenna.upload_trajectory(segment)
+            self.trajectory_pending.popleft()
+            self._trajectory_ends.append(segment.end)
+            uploaded += 1
+        return uploaded
+
+    def record_command(self, record: dict):
+        """Record telemetry for a sent command (called from the telemetry thread)."""
+        self.last_command = record
+        if self.telemetry is None:
+            return
+        record['doppler_shift'] = self.doppler_shift
+        reported = self.antenna.position if self.antenna is not None else None
+        if reported is not None:
+            d_az = (record['azimuth'] - reported[0] + 180.0) % 360.0 - 180.0
+            record['pointing_error'] = math.hypot(d_az * math.cos(math.radians(reported[1])),
+                                                  record['elevation'] - reported[1])
+        if self.signal_model is not None:
+            record['signal_strength'] = self.signal_model.signal_strength(record.get('pointing_error', 0.0))
+            if record['doppler_shift'] is None:
+                record['doppler_shift'] = self.signal_model.doppler_shift(record['range_rate'])
+        self.telemetry.append_record(record)
+
+    def update_signal(self):
+        """Update the Doppler correction for the current target (Doppler stage)."""
+        if self.doppler is None or self.target is None or not self.config.signal.enable_doppler_correction:
+            return
+        now = self.clock()
+        table = self.doppler.table_for(self.target, now)
+        self.doppler_shift = table.shift(now) if table is not None else None
+
+    def log_telemetry(self):
+        """Report tracking state and loop timing (telemetry stage)."""
+        timestamp = datetime.fromtimestamp(self.clock(), timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        latency = self.pipeline.stats()['latency_p99'] * 1000.0
+        pointing = "idle" if self.pointing is None else "Az={:.2f} El={:.2f}".format(*self.pointing)
+        print(f"[{timestamp}] Tracking {pointing} (p99 command latency {latency:.1f} ms, Ctrl+C to stop)")
             
+    REPLAY_FIELDS = ('pointing_error', 'signal_strength', 'doppler_shift')
+
+    def replay(self, start: Optional[float] = None, end: Optional[float] = None,
+               bucket: float = 60.0, path: Optional[str] = None) -> int:
+        """
+        Summarize recorded telemetry per time bucket.
+
+        Args:
+            start: First Unix time included (default: beginning of the log)
+            end: Unix time excluded (default: end of the log)
+            bucket: Bucket length in seconds
+            path: Telemetry file (default: logging.telemetry.file)
+
+        Returns:
+            Number of records in the range
+        """
+        import numpy as np
+        from telemetry import TelemetryReader
+
+        log_config = self.config.logging
+        reader = TelemetryReader(path or log_config.telemetry.file, log_config.backup_count)
+        summary = reader.downsample(self.REPLAY_FIELDS, bucket, start, end)
+        print(f"{'time (UTC)':19s} {'records':>8s} {'err mean':>9s} {'err max':>8s} "
+              f"{'sig mean':>9s} {'sig min':>8s} {'doppler min':>12s} {'doppler max':>12s}")
+        for i in np.flatnonzero(summary['count']):
+            when = datetime.fromtimestamp(summary['time'][i], timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{when} {summary['count'][i]:8d} "
+                  f"{summary['pointing_error_mean'][i]:9.3f} {summary['pointing_error_max'][i]:8.3f} "
+                  f"{summary['signal_strength_mean'][i]:9.1f} {summary['signal_strength_min'][i]:8.1f} "
+                  f"{summary['doppler_shift_min'][i]:12.1f} {summary['doppler_shift_max'][i]:12.1f}")
+        total = int(summary['count'].sum())
+        print(f"{total} records in {len(reader.files)} file(s)")
+        return total
+
     def status(self):
         """Display current system status."""
         print("\n=== Ground Station Status ===")
         print(f"Running: {self.running}")
         print(f"Mode: {'SIMULATION' if self.simulate else 'HARDWARE'}")
-        # TODO: Add more status information
+        if self.clock is not time.time:
+            now = datetime.fromtimestamp(self.clock(), timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"Simulated time: {now} UTC")
+        if self.config_watcher is not None:
+            error = self.config_watcher.last_error
+            print(f"Configuration: {self.config_file} (reloads={self.config_watcher.reloads}"
+                  f"{f', last error: {error}' if error else ''})")
+        if self.scheduler is not None:
+            for name, stats in self.scheduler.stats().items():
+                print(f"Stage {name}: runs={stats['runs']} overruns={stats['overruns']} "
+                      f"skipped={stats['skipped']} jitter max={stats['jitter_max'] * 1000.0:.1f} ms")
+        if self.pipeline is not None:
+            stats = self.pipeline.stats()
+            print(f"Commands: sent={stats['sent']} stale={stats['stale']} "
+                  f"latency p50={stats['latency_p50'] * 1000.0:.1f} ms p99={stats['latency_p99'] * 1000.0:.1f} ms "
+                  f"(target {stats['latency_target'] * 1000.0:.0f} ms, misses={stats['latency_misses']})")
+        if self.antenna is not None:
+            stats = self.antenna.stats()
+            print(f"Antenna link: sent={stats['sent']} coalesced={stats['coalesced']} "
+                  f"reports={stats['reports']} position={self.antenna.position}")
+        elif not self.simulate:
+            hardware = self.config.hardware
+            print(f"Antenna link: {hardware.serial_port} ({hardware.protocol}), not open")
+        if self.telemetry is not None:
+            stats = self.telemetry.stats()
+            print(f"Telemetry: records={stats['records']} buffered={stats['buffered']} "
+                  f"flushes={stats['flushes']} rotations={stats['rotations']}")
+        if self.handover_plan is not None:
+            plan = self.handover_plan
+            print(f"Handover plan: {len(plan.schedule())} assignments over {plan.slots} slots "
+                  f"(last re-plan {plan.last_replan['slots']} slots in "
+                  f"{plan.last_replan['seconds'] * 1000.0:.1f} ms)")
         print("============================\n")
         
     def shutdown(self):
         """Shutdown ground station gracefully."""
         print("Shutting down ground station...")
         self.running = False
-        # TODO: Close connections, save state, etc.
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        if self.telemetry is not None:
+            self.telemetry.close()
+            self.telemetry = None
+        if self.antenna is not None:
+            self.antenna.close()
+            self.antenna = None
         print("Shutdown complete.")
 
 
+def parse_time(text: str) -> float:
+    """
+    Parse a command-line time as Unix seconds or ISO 8601 (UTC if no zone).
+
+    Raises:
+        ValueError: If the text is neither
+    """
+    try:
+        return float(text)
+    except ValueError:
+        moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
 def main():
     """Main entry point for ground station application."""
     parser = argparse.ArgumentParser(
@@ -111,6 +688,39 @@ def main():
         help='Display status and exit'
     )
     
+    parser.add_argument(
+        '--replay',
+        nargs='?',
+        const='',
+        metavar='FILE',
+        help='Summarize recorded telemetry (default file: the telemetry log) and exit'
+    )
+
+    parser.add_argument(
+        '--start',
+        type=parse_time,
+        help='Replay start (ISO 8601 UTC or Unix seconds)'
+    )
+
+    parser.add_argument(
+        '--end',
+        type=parse_time,
+        help='Replay end (ISO 8601 UTC or Unix seconds)'
+    )
+
+    parser.add_argument(
+        '--duration',
+        type=float,
+        help='Stop tracking after this many seconds (simulated seconds with --simulate)'
+    )
+
+    parser.add_argument(
+        '--bucket',
+        type=float,
+        default=60.0,
+        help='Replay bucket length in seconds'
+    )
+
     args = parser.parse_args()
     
     # Initialize ground station
@@ -121,14 +731,19 @@ def main():
     
     try:
         station.load_configuration()
-        station.initialize_hardware()
-        
+        if args.replay is not None:
+            station.replay(args.start, args.end, args.bucket, args.replay or None)
+            return 0
         if args.status:
+            # Report without opening the serial link (or importing it)
             station.status()
             return 0
+        station.initialize_hardware()
         
         # Start tracking
-        station.start_tracking()
+        station.start_tracking(args.duration)
+        if args.duration is not None:
+            station.status()
         
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -0,0 +1,339 @@
+"""
+Starlink DIY - Tracking Pipeline
+
+This module splits the tracking loop into stages that run on their own
+threads so slow I/O in one stage cannot stall the others:
+
+1. Propagation worker: computes pointing samples for the target in batches,
+   running up to a lookahead ahead of real time.
+2. Command sender: waits for each sample's due time and sends it to the
+   antenna, measuring the command latency against a target.
+3. Telemetry writer: records every command off the hot path.
+
+Bounded queues connect the stages. The command queue holds exactly the
+lookahead, so the worker blocks instead of running arbitrarily far ahead.
+The telemetry queue drops records (and counts them) rather than ever
+blocking the command sender.
+
+run_pending() runs the same stages synchronously on the caller's thread,
+for a scheduler driven by a virtual clock in simulation.
+"""
+
+from collections import deque
+from typing import Callable, Dict, NamedTuple, Optional
+import queue
+import threading
+import time
+
+DEFAULT_RATE_HZ = 5.0              # tracking.update_rate
+DEFAULT_LOOKAHEAD_SEC = 2.0        # How far propagation runs ahead
+DEFAULT_LATENCY_TARGET_SEC = 0.05  # Due time to command sent
+TELEMETRY_QUEUE_SIZE = 1024
+LATENCY_WINDOW = 1000              # Recent commands kept for percentiles
+
+
+class PointingSample(NamedTuple):
+    """One antenna pointing command scheduled for a given time."""
+    timestamp: float    # Unix seconds the pointing is valid for
+    satellite_id: str
+    azimuth: float      # degrees
+    elevation: float    # degrees
+    range_rate: float   # km/s
+    generation: int     # Target generation the sample was computed for
+
+
+class TrackingPipeline:
+    """
+    Threaded propagation -> command -> telemetry pipeline for one target.
+    """
+
+    def __init__(self, tracker, send_command: Callable[[float, float], None],
+                 record_telemetry: Optional[Callable[[Dict], None]] = None,
+                 rate_hz: float = DEFAULT_RATE_HZ, lookahead: float = DEFAULT_LOOKAHEAD_SEC,
+                 latency_target: float = DEFAULT_LATENCY_TARGET_SEC,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize the pipeline.
+
+        Args:
+            tracker: SatelliteTracker used to compute pointing samples (None
+                idles the pipeline until a catalog is loaded)
+            send_command: Called with (azimuth, elevation) for every sample
+            record_telemetry: Called with a record dictionary per command
+            rate_hz: Command rate in Hz
+            lookahead: Seconds of samples computed ahead of time
+            latency_target: Allowed delay from due time to command sent
+            clock: Wall clock in Unix seconds
+
+        Raises:
+            ValueError: If the rate or lookahead is not positive
+        """
+        if rate_hz <= 0 or lookahead <= 0:
+            raise ValueError("rate_hz and lookahead must be positive")
+        self.tracker = tracker
+        self.send_command = send_command
+        self.record_telemetry = record_telemetry
+        self.period = 1.0 / rate_hz
+        self.batch_size = max(1, int(round(rate_hz)))  # About one second per propagation
+        self.latency_target = latency_target
+        self.clock = clock
+
+        self.commands = queue.Queue(maxsize=max(1, int(round(lookahead * rate_hz))))
+        self.telemetry = queue.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+        self._target = None
+        self._generation = 0
+        self._target_changed = threading.Condition()
+        self._stop = threading.Event()
+        self._threads = []
+        self._pending = deque()  # Synchronous mode: samples not yet due
+        self._pending_generation = None
+        self._next_tick = None
+
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.sent = 0
+        self.latency_misses = 0
+        self.stale = 0
+        self.telemetry_dropped = 0
+        self.last_error = None
+
+    @property
+    def target(self) -> Optional[str]:
+        """Satellite currently being tracked."""
+        return self._target
+
+    def set_target(self, satellite_id: Optional[str]) -> None:
+        """
+        Switch to a new target (or None to idle). Queued samples for the
+        previous target are discarded.
+
+        Args:
+            satellite_id: Satellite to track
+        """
+        with self._target_changed:
+            self._target = satellite_id
+            self._generation += 1
+            self._target_changed.notify_all()
+
+    def set_tracker(self, tracker) -> None:
+        """
+        Swap in a tracker, e.g. once a catalog is loaded. Queued samples are
+        discarded.
+
+        Args:
+            tracker: SatelliteTracker to propagate with (None to idle)
+        """
+        with self._target_changed:
+            self.tracker = tracker
+            self._generation += 1
+            self._target_changed.notify_all()
+
+    def set_rate(self, rate_hz: float) -> None:
+        """
+        Change the command rate without stopping the threads. Queued samples
+        on the old grid are discarded.
+
+        Args:
+            rate_hz: Command rate in Hz
+
+        Raises:
+            ValueError: If the rate is not positive
+        """
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        with self._target_changed:
+            self.period = 1.0 / rate_hz
+            self.batch_size = max(1, int(round(rate_hz)))
+            self._generation += 1
+            self._target_changed.notify_all()
+
+    def start(self) -> None:
+        """Start the worker, sender and telemetry threads."""
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._propagate, name='propagation', daemon=True),
+            threading.Thread(target=self._send, name='command-sender', daemon=True),
+            threading.Thread(target=self._write_telemetry, name='telemetry', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop all threads.
+
+        Args:
+            timeout: Seconds to wait for each thread
+        """
+        self._stop.set()
+        with self._target_changed:
+            self._target_changed.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _propagate(self) -> None:
+        """Propagation worker: keep the command queue filled ahead of time."""
+        next_tick = None
+        generation = None
+        while not self._stop.is_set():
+            with self._target_changed:
+                if self._target is None or self.tracker is None:
+                    self._target_changed.wait(0.5)
+                    continue
+                target = self._target
+                if generation != self._generation:
+                    generation = self._generation
+                    next_tick = None
+
+            samples, next_tick = self._batch(target, generation, next_tick)
+            for sample in samples:
+                while not self._stop.is_set() and generation == self._generation:
+                    try:
+                        self.commands.put(sample, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+    def _batch(self, target: str, generation: int, next_tick: Optional[int]):
+        """
+        Compute one batch of samples for the target.
+
+        Args:
+            target: Satellite to propagate
+            generation: Target generation the samples belong to
+            next_tick: Command grid index of the first sample (None to
+                start at the next tick)
+
+        Returns:
+            Tuple of (samples, grid index after the batch); no samples if
+            propagation failed, in which case the target is cleared
+        """
+        if next_tick is None:
+            # Align to the command grid starting at the next tick
+            next_tick = int(self.clock() / self.period) + 1
+        times = [(next_tick + i) * self.period for i in range(self.batch_size)]
+        try:
+            angles = self.tracker.calculate_positions([target], times)
+        except Exception as e:  # Unknown satellite, stale catalog, ...
+            self.last_error = e
+            self.set_target(None)
+            return [], None
+
+        azimuth, elevation = angles['azimuth'][0], angles['elevation'][0]
+        range_rate = angles['range_rate'][0]
+        samples = [PointingSample(timestamp, target, float(azimuth[i]), float(elevation[i]),
+                                  float(range_rate[i]), generation)
+                   for i, timestamp in enumerate(times)]
+        return samples, next_tick + self.batch_size
+
+    def _dispatch(self, sample: PointingSample) -> Dict:
+        """Send one due sample and return its telemetry record."""
+        self.send_command(sample.azimuth, sample.elevation)
+        latency = self.clock() - sample.timestamp
+        self._latencies.append(latency)
+        self.sent += 1
+        if latency > self.latency_target:
+            self.latency_misses += 1
+        record = sample._asdict()
+        record['latency'] = latency
+        return record
+
+    def run_pending(self) -> int:
+        """
+        Send every sample due by now on the calling thread (no worker threads).
+
+        Meant to run as a scheduler stage at the command rate. When more than
+        one sample is due only the latest is sent, as in the threaded sender.
+
+        Returns:
+            Number of commands sent
+        """
+        target, generation = self._target, self._generation
+        if target is None or self.tracker is None:
+            self._pending.clear()
+            return 0
+        if self._pending_generation != generation:
+            self._pending_generation = generation
+            self._pending.clear()
+            self._next_tick = None
+        now = self.clock()
+        due = now + 1e-6  # Grid times and the caller's deadlines round differently
+        if self._pending and self._pending[-1].timestamp < now - self.batch_size * self.period:
+            # Far behind (e.g. the clock jumped): restart on the grid
+            self._pending.clear()
+            self._next_tick = None
+        while not self._pending or self._pending[-1].timestamp <= due:
+            samples, self._next_tick = self._batch(target, generation, self._next_tick)
+            if not samples:
+                self._pending.clear()
+                return 0
+            self._pending.extend(samples)
+
+        sent = 0
+        while self._pending and self._pending[0].timestamp <= due:
+            sample = self._pending.popleft()
+            if self._pending and self._pending[0].timestamp <= due:
+                self.stale += 1
+                continue
+            record = self._dispatch(sample)
+            sent += 1
+            if self.record_telemetry is not None:
+                self.record_telemetry(record)
+        return sent
+
+    def _send(self) -> None:
+        """Command sender: send each sample at its due time."""
+        while not self._stop.is_set():
+            try:
+                sample = self.commands.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if sample.generation != self._generation:
+                continue
+            wait = sample.timestamp - self.clock()
+            if wait > 0 and self._stop.wait(wait):
+                break
+            if self.clock() - sample.timestamp > self.period and not self.commands.empty():
+                # A newer sample is already due; skip this stale one
+                self.stale += 1
+                continue
+
+            record = self._dispatch(sample)
+            try:
+                self.telemetry.put_nowait(record)
+            except queue.Full:
+                self.telemetry_dropped += 1
+
+    def _write_telemetry(self) -> None:
+        """Telemetry writer: hand records to the (possibly slow) sink."""
+        while not self._stop.is_set() or not self.telemetry.empty():
+            try:
+                record = self.telemetry.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if self.record_telemetry is not None:
+                self.record_telemetry(record)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get command path statistics.
+
+        Returns:
+            Dictionary with command counts, latency percentiles (seconds)
+            over the most recent commands, the latency target and misses,
+            stale samples skipped, telemetry records dropped and queue depths
+        """
+        latencies = sorted(self._latencies)
+        percentile = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else 0.0
+        return {
+            'sent': self.sent,
+            'latency_p50': percentile(0.5),
+            'latency_p99': percentile(0.99),
+            'latency_max': latencies[-1] if latencies else 0.0,
+            'latency_target': self.latency_target,
+            'latency_misses': self.latency_misses,
+            'stale': self.stale,
+            'telemetry_dropped': self.telemetry_dropped,
+            'command_queue': self.commands.qsize(),
+            'telemetry_queue': self.telemetry.qsize(),
+        }
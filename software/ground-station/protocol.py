@@ -0,0 +1,252 @@
+"""
+Starlink DIY - Antenna Controller Binary Protocol
+
+Fixed-size binary frames for the serial link to the antenna controller, as
+an alternative to the newline-delimited text commands. Every frame is 18
+bytes, little-endian, laid out to match ``Frame`` in
+firmware/antenna_controller.h:
+
+    offset  size  field
+    0       2     sync bytes 0xA5 0x5A
+    2       1     frame type (FRAME_*)
+    3       1     sequence number (wraps at 256)
+    4       12    payload: Command, Position or error code (zero padded)
+    16      2     CRC-16/CCITT-FALSE over bytes 2..15
+
+Encoding and decoding work in preallocated buffers through struct.pack_into
+and struct.unpack_from, so no buffers are allocated per frame.
+"""
+
+from typing import Callable, Tuple
+import binascii
+import struct
+
+SYNC = b'\xa5\x5a'
+FRAME_SIZE = 18
+PAYLOAD_SIZE = 12
+CRC_INIT = 0xFFFF
+
+# Frame types (host -> controller below 0x80, controller -> host above)
+FRAME_GOTO = 0x01
+FRAME_STOP = 0x02
+FRAME_HOME = 0x03
+FRAME_TRAJECTORY_BEGIN = 0x04  # Payload: TrajectoryHeader
+FRAME_TRAJECTORY_KNOT = 0x05   # Payload: TrajectoryKnot
+FRAME_POSITION = 0x81
+FRAME_ERROR = 0x82
+
+_HEADER = struct.Struct('<2sBB')
+_COMMAND = struct.Struct('<fff')      # Command: target az, target el, speed factor
+_POSITION = struct.Struct('<ffI')     # Position: az, el, timestamp (ms)
+_ERROR = struct.Struct('<I')
+_TRAJECTORY_HEADER = struct.Struct('<IIHH')  # segment id, start (controller ms), interval ms, knots
+_TRAJECTORY_KNOT = struct.Struct('<ffhh')    # az, el, az rate, el rate (millidegrees/s)
+_CRC = struct.Struct('<H')
+_CRC_OFFSET = FRAME_SIZE - _CRC.size
+_EMPTY_PAYLOAD = bytes(PAYLOAD_SIZE)
+
+# Text command that switches the firmware from text to binary framing
+BINARY_MODE_COMMAND = b'BINARY\n'
+
+
+class FrameEncoder:
+    """
+    Encodes host-to-controller frames into one reused buffer.
+
+    The returned memoryview is only valid until the next encode call.
+    """
+
+    def __init__(self):
+        """Initialize the encoder."""
+        self._buffer = bytearray(FRAME_SIZE)
+        self._view = memoryview(self._buffer)
+        self.sequence = 0
+
+    def _finish(self, frame_type: int) -> memoryview:
+        _HEADER.pack_into(self._buffer, 0, SYNC, frame_type, self.sequence)
+        _CRC.pack_into(self._buffer, _CRC_OFFSET, binascii.crc_hqx(self._view[2:_CRC_OFFSET], CRC_INIT))
+        self.sequence = (self.sequence + 1) & 0xFF
+        return self._view
+
+    def goto(self, azimuth: float, elevation: float, speed_factor: float = 1.0) -> memoryview:
+        """
+        Encode a pointing command.
+
+        Args:
+            azimuth: Target azimuth in degrees
+            elevation: Target elevation in degrees
+            speed_factor: Speed multiplier (0.1 to 1.0)
+
+        Returns:
+            The encoded frame
+        """
+        _COMMAND.pack_into(self._buffer, 4, azimuth, elevation, speed_factor)
+        return self._finish(FRAME_GOTO)
+
+    def control(self, frame_type: int) -> memoryview:
+        """
+        Encode a command without arguments (FRAME_STOP, FRAME_HOME).
+
+        Returns:
+            The encoded frame
+        """
+        self._buffer[4:_CRC_OFFSET] = _EMPTY_PAYLOAD
+        return self._finish(frame_type)
+
+    def trajectory_begin(self, segment_id: int, start_ms: int, interval_ms: int, knot_count: int) -> memoryview:
+        """
+        Encode the header of a trajectory segment upload.
+
+        Args:
+            segment_id: Identifier echoed in error reports
+            start_ms: Controller clock time of the first knot
+            interval_ms: Time between knots
+            knot_count: Number of FRAME_TRAJECTORY_KNOT frames that follow
+
+        Returns:
+            The encoded frame
+        """
+        _TRAJECTORY_HEADER.pack_into(self._buffer, 4, segment_id & 0xFFFFFFFF, start_ms & 0xFFFFFFFF,
+                                     interval_ms, knot_count)
+        return self._finish(FRAME_TRAJECTORY_BEGIN)
+
+    def trajectory_knot(self, azimuth: float, elevation: float,
+                        azimuth_rate_mdeg: int, elevation_rate_mdeg: int) -> memoryview:
+        """
+        Encode one trajectory knot.
+
+        Args:
+            azimuth: Azimuth in degrees (may leave 0-360 across a wrap)
+            elevation: Elevation in degrees
+            azimuth_rate_mdeg: Azimuth rate in millidegrees per second
+            elevation_rate_mdeg: Elevation rate in millidegrees per second
+
+        Returns:
+            The encoded frame
+        """
+        _TRAJECTORY_KNOT.pack_into(self._buffer, 4, azimuth, elevation, azimuth_rate_mdeg, elevation_rate_mdeg)
+        return self._finish(FRAME_TRAJECTORY_KNOT)
+
+    def position(self, azimuth: float, elevation: float, timestamp_ms: int) -> memoryview:
+        """
+        Encode a position report (controller side; used by simulators and tests).
+
+        Returns:
+            The encoded frame
+        """
+        _POSITION.pack_into(self._buffer, 4, azimuth, elevation, timestamp_ms & 0xFFFFFFFF)
+        return self._finish(FRAME_POSITION)
+
+    def error(self, code: int) -> memoryview:
+        """
+        Encode an error report (controller side).
+
+        Returns:
+            The encoded frame
+        """
+        self._buffer[4:_CRC_OFFSET] = _EMPTY_PAYLOAD
+        _ERROR.pack_into(self._buffer, 4, code)
+        return self._finish(FRAME_ERROR)
+
+
+class FrameDecoder:
+    """
+    Incremental decoder that finds frames in a byte stream.
+
+    Bytes are accumulated in a fixed buffer. The decoder resynchronizes on
+    the sync bytes after noise or a CRC failure.
+    """
+
+    def __init__(self, on_frame: Callable[[int, int, memoryview], None], capacity: int = 4096):
+        """
+        Initialize the decoder.
+
+        Args:
+            on_frame: Called with (frame_type, sequence, payload) for every
+                valid frame; the payload view is only valid during the call
+            capacity: Buffer size in bytes (at least two frames)
+        """
+        self.on_frame = on_frame
+        self._buffer = bytearray(max(capacity, 2 * FRAME_SIZE))
+        self._view = memoryview(self._buffer)
+        self._length = 0
+        self.frames = 0
+        self.crc_errors = 0
+        self.dropped_bytes = 0
+        self.sequence_gaps = 0
+        self._last_sequence = None
+
+    def feed(self, data: bytes) -> None:
+        """
+        Add received bytes and dispatch every complete frame.
+
+        Args:
+            data: Bytes read from the serial port
+        """
+        view = memoryview(data)
+        while len(view):
+            space = len(self._buffer) - self._length
+            chunk = view[:space]
+            self._view[self._length:self._length + len(chunk)] = chunk
+            self._length += len(chunk)
+            view = view[len(chunk):]
+            self._parse()
+
+    def _parse(self) -> None:
+        position = 0
+        buffer = self._buffer
+        while self._length - position >= FRAME_SIZE:
+            start = buffer.find(SYNC, position, self._length)
+            if start < 0:
+                # Keep a trailing first sync byte that may start a frame
+                keep = 1 if buffer[self._length - 1] == SYNC[0] else 0
+                self.dropped_bytes += self._length - keep - position
+                position = self._length - keep
+                break
+            self.dropped_bytes += start - position
+            position = start
+            if self._length - position < FRAME_SIZE:
+                break
+            end = position + FRAME_SIZE
+            crc, = _CRC.unpack_from(buffer, end - _CRC.size)
+            if binascii.crc_hqx(self._view[position + 2:end - _CRC.size], CRC_INIT) != crc:
+                self.crc_errors += 1
+                position += 1
+                continue
+            frame_type, sequence = buffer[position + 2], buffer[position + 3]
+            if self._last_sequence is not None and sequence != (self._last_sequence + 1) & 0xFF:
+                self.sequence_gaps += 1
+            self._last_sequence = sequence
+            self.frames += 1
+            self.on_frame(frame_type, sequence, self._view[position + 4:end - _CRC.size])
+            position = end
+
+        if position:
+            remaining = self._length - position
+            self._view[:remaining] = self._view[position:self._length]  # memmove
+            self._length = remaining
+
+
+def decode_position(payload: memoryview) -> Tuple[float, float, int]:
+    """Unpack a FRAME_POSITION payload into (azimuth, elevation, timestamp_ms)."""
+    return _POSITION.unpack_from(payload)
+
+
+def decode_command(payload: memoryview) -> Tuple[float, float, float]:
+    """Unpack a FRAME_GOTO payload into (azimuth, elevation, speed_factor)."""
+    return _COMMAND.unpack_from(payload)
+
+
+def decode_trajectory_header(payload: memoryview) -> Tuple[int, int, int, int]:
+    """Unpack a FRAME_TRAJECTORY_BEGIN payload into (segment_id, start_ms, interval_ms, knot_count)."""
+    return _TRAJECTORY_HEADER.unpack_from(payload)
+
+
+def decode_trajectory_knot(payload: memoryview) -> Tuple[float, float, int, int]:
+    """Unpack a FRAME_TRAJECTORY_KNOT payload into (azimuth, elevation, azimuth_rate, elevation_rate)."""
+    return _TRAJECTORY_KNOT.unpack_from(payload)
+
+
+def decode_error(payload: memoryview) -> int:
+    """Unpack a FRAME_ERROR payload into its error code."""
+    return _ERROR.unpack_from(payload)[0]
@@ -0,0 +1,198 @@
+"""
+Starlink DIY - Real-time Stage Scheduler
+
+This module runs the ground station's periodic stages (tracking, Doppler,
+telemetry, ...) at fixed rates on a monotonic clock. Each stage has its own
+deadline grid, so timing does not drift with the work done per tick. A stage
+that falls more than a period behind skips the stale ticks instead of
+running them back to back, and every stage keeps jitter and overrun
+statistics.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+import time
+
+
+@dataclass
+class StageStats:
+    """Timing statistics for one scheduled stage (seconds)."""
+    runs: int = 0
+    overruns: int = 0       # Runs that finished after the next deadline
+    skipped: int = 0        # Stale ticks dropped after falling behind
+    jitter_total: float = 0.0
+    jitter_max: float = 0.0
+    duration_max: float = 0.0
+
+    @property
+    def jitter_mean(self) -> float:
+        """Average start delay after the deadline."""
+        return self.jitter_total / self.runs if self.runs else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the statistics as a plain dictionary."""
+        return {
+            'runs': self.runs,
+            'overruns': self.overruns,
+            'skipped': self.skipped,
+            'jitter_mean': self.jitter_mean,
+            'jitter_max': self.jitter_max,
+            'duration_max': self.duration_max,
+        }
+
+
+class Stage:
+    """A callback run periodically by RateScheduler."""
+
+    def __init__(self, name: str, period: float, callback: Callable[[], None]):
+        """
+        Create a stage.
+
+        Args:
+            name: Stage name used in statistics
+            period: Seconds between runs
+            callback: Function called once per tick
+        """
+        self.name = name
+        self.period = period
+        self.callback = callback
+        self.deadline = 0.0
+        self.origin = 0.0  # Deadlines are origin + ticks * period, so they
+        self.ticks = 0     # do not accumulate rounding error at large clock values
+        self.stats = StageStats()
+
+
+class RateScheduler:
+    """
+    Deadline-based scheduler for periodic stages.
+
+    The clock and sleep functions are injectable so the same scheduler can
+    run against wall time or a simulated clock.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the scheduler.
+
+        Args:
+            clock: Monotonic time source in seconds
+            sleep: Function that blocks for a number of seconds
+        """
+        self.clock = clock
+        self.sleep = sleep
+        self.stages: List[Stage] = []
+        self.running = False
+
+    def add_stage(self, name: str, rate_hz: float, callback: Callable[[], None]) -> Stage:
+        """
+        Register a stage. Stages due at the same time run in the order added.
+
+        Args:
+            name: Stage name
+            rate_hz: Run rate in Hz
+            callback: Function called once per tick
+
+        Returns:
+            The new Stage
+
+        Raises:
+            ValueError: If the rate is not positive or the name is taken
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"Stage {name} rate must be positive")
+        if any(stage.name == name for stage in self.stages):
+            raise ValueError(f"Stage {name} already exists")
+        stage = Stage(name, 1.0 / rate_hz, callback)
+        stage.deadline = stage.origin = self.clock()
+        self.stages.append(stage)
+        return stage
+
+    def set_rate(self, name: str, rate_hz: float) -> None:
+        """
+        Change a stage's rate; the new period applies after its next run.
+
+        Args:
+            name: Stage name
+            rate_hz: New run rate in Hz
+
+        Raises:
+            ValueError: If the rate is not positive or there is no such stage
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"Stage {name} rate must be positive")
+        for stage in self.stages:
+            if stage.name == name:
+                stage.origin, stage.ticks = stage.deadline, 0
+                stage.period = 1.0 / rate_hz
+                return
+        raise ValueError(f"Stage {name} does not exist")
+
+    def reset(self) -> None:
+        """Make every stage due now, e.g. before (re)starting the loop."""
+        now = self.clock()
+        for stage in self.stages:
+            stage.deadline = stage.origin = now
+            stage.ticks = 0
+
+    def run_pending(self) -> float:
+        """
+        Run every stage whose deadline has passed.
+
+        Returns:
+            Seconds until the next deadline (0 or less if already due)
+        """
+        for stage in self.stages:
+            now = self.clock()
+            late = now - stage.deadline
+            if late < 0:
+                continue
+            stats = stage.stats
+            missed = int(late // stage.period)
+            if missed:
+                # Drop stale ticks and serve only the most recent one
+                stats.skipped += missed
+                late -= missed * stage.period
+
+            stage.callback()
+            finished = self.clock()
+            stats.runs += 1
+            stats.jitter_total += late
+            stats.jitter_max = max(stats.jitter_max, late)
+            stats.duration_max = max(stats.duration_max, finished - now)
+            stage.ticks += missed + 1
+            stage.deadline = stage.origin + stage.ticks * stage.period
+            if finished > stage.deadline:
+                stats.overruns += 1
+
+        if not self.stages:
+            return 0.0
+        return min(stage.deadline for stage in self.stages) - self.clock()
+
+    def run(self, should_stop: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Run stages until stop() is called or should_stop returns True.
+
+        Args:
+            should_stop: Optional predicate checked once per loop
+        """
+        self.running = True
+        self.reset()
+        while self.running and not (should_stop and should_stop()):
+            wait = self.run_pending()
+            if wait > 0:
+                self.sleep(wait)
+        self.running = False
+
+    def stop(self) -> None:
+        """Ask a running loop to exit after the current tick."""
+        self.running = False
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get timing statistics for every stage.
+
+        Returns:
+            Dictionary of stage name to statistics dictionary
+        """
+        return {stage.name: stage.stats.as_dict() for stage in self.stages}
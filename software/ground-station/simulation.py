@@ -0,0 +1,362 @@
+"""
+Starlink DIY - Simulation Backend
+
+Stand-ins for the hardware so the whole tracking loop can run without an
+antenna, faster than real time and deterministically:
+
+- VirtualClock: a clock whose sleep() advances time instantly. Passed to
+  RateScheduler, TrackingPipeline and TelemetryWriter in place of the
+  wall clock, it runs a day of tracking in seconds.
+- SimulatedAntenna: replaces AntennaLink. Each axis follows the firmware's
+  motion limits (speed and acceleration from the motor settings) and the
+  pointing limits; the time-optimal trapezoidal move toward the target
+  is evaluated in closed form at the clock's time whenever the position
+  is read or a new target is set. Uploaded trajectory segments are
+  interpolated by the firmware model (trajectory.TrajectoryInterpolator)
+  and steer the target while they cover the clock's time.
+- SignalModel: seeded synthetic received signal strength (beam pattern loss
+  from the pointing error plus receiver noise) and measured Doppler.
+- synthetic_catalog(): seeded Starlink-like TLEs when no catalog is loaded.
+"""
+
+import math
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from protocol import FrameDecoder, FrameEncoder
+from slew import MotionLimits
+from trajectory import ClockSync, TrajectoryInterpolator, TrajectorySegment, encode_segment
+
+SIMULATION_EPOCH = 1704110400.0  # 2024-01-01 12:00 UTC, epoch of the synthetic catalog
+SIMULATED_NORAD_BASE = 90000     # NORAD IDs of synthetic satellites start here
+SPEED_OF_LIGHT_MPS = 299792458.0
+BEAMWIDTH_FACTOR = 70.0          # Half-power beamwidth ~ 70 * wavelength / diameter degrees
+DOPPLER_NOISE_HZ = 1000.0        # Frequency error per unit of noise_level
+
+
+class VirtualClock:
+    """Manually advanced clock in Unix seconds; sleeping advances it instantly."""
+
+    def __init__(self, start: float = SIMULATION_EPOCH):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial time in Unix seconds
+        """
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock instead of blocking."""
+        if seconds > 0:
+            self.now += seconds
+
+
+class SimulatedAntenna:
+    """
+    Antenna controller stand-in with the firmware's motion and pointing limits.
+
+    Exposes the parts of the AntennaLink interface the ground station uses.
+    Elevation targets outside the limits are clamped (and counted) like the
+    firmware's limit enforcement; azimuth targets go to the mechanical angle
+    within the azimuth limits nearest the current position.
+    """
+
+    def __init__(self, limits: MotionLimits, clock: Callable[[], float],
+                 position: Optional[Tuple[float, float]] = None):
+        """
+        Initialize the antenna at rest.
+
+        Args:
+            limits: Motion and pointing limits
+            clock: Time source shared with the rest of the simulation
+            position: Initial (mechanical azimuth, elevation) (default: parked at zenith)
+        """
+        self.limits = limits
+        self.clock = clock
+        azimuth, elevation = position or (limits.azimuth_min, limits.elevation_max)
+        self._position = [azimuth, elevation]
+        self._velocity = [0.0, 0.0]
+        self._target = [azimuth, elevation]
+        self._time = clock()
+        self.clock_sync = ClockSync()
+        self.clock_sync.observe(self._time, 0)  # Controller clock starts with the simulation
+        self._encoder = FrameEncoder()
+        self._trajectory = TrajectoryInterpolator()
+        self._decoder = FrameDecoder(self._trajectory.handle_frame)
+        self.sent = 0
+        self.limited = 0
+        self.reports = 0
+
+    def open(self) -> None:
+        """Nothing to open; present for AntennaLink compatibility."""
+
+    def close(self) -> None:
+        """Stop where the antenna is."""
+        self.stop()
+
+    def is_open(self) -> bool:
+        """Always open; present for AntennaLink compatibility."""
+        return True
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """Current (mechanical azimuth, elevation) at the clock's time."""
+        self._advance()
+        self.reports += 1
+        return self._position[0], self._position[1]
+
+    @property
+    def moving(self) -> bool:
+        """Whether either axis is still moving toward its target."""
+        self._advance()
+        return any(self._velocity) or self._position != self._target
+
+    def set_target(self, azimuth: float, elevation: float) -> None:
+        """
+        Command a new target, abandoning any uploaded trajectory.
+
+        Args:
+            azimuth: Compass azimuth in degrees
+            elevation: Elevation in degrees
+        """
+        self._advance()
+        self._trajectory = TrajectoryInterpolator()
+        self._decoder = FrameDecoder(self._trajectory.handle_frame)
+        self._aim(azimuth, elevation)
+        self.sent += 1
+
+    def upload_trajectory(self, segment: TrajectorySegment) -> None:
+        """
+        Upload a trajectory segment, encoded as the link would send it.
+
+        Args:
+            segment: Segment from trajectory.plan_trajectory()
+        """
+        self._advance()
+        start_ms = self.clock_sync.to_controller_ms(segment.start)
+        for frame in encode_segment(self._encoder, segment, start_ms):
+            self._decoder.feed(bytes(frame))
+        self.sent += 1
+
+    def _aim(self, azimuth: float, elevation: float) -> None:
+        """Set the target within the pointing limits (see the class docstring)."""
+        limits = self.limits
+        clamped = min(max(elevation, limits.elevation_min), limits.elevation_max)
+        if clamped != elevation:
+            self.limited += 1
+        current = self._position[0]
+        options = [azimuth % 360.0 + turn * 360.0 for turn in range(-2, 3)]
+        options = [a for a in options if limits.azimuth_min <= a <= limits.azimuth_max] or [current]
+        self._target = [min(options, key=lambda a: abs(a - current)), clamped]
+
+    def stop(self) -> None:
+        """Brake both axes and hold wherever they come to rest."""
+        self._advance()
+        self._trajectory = TrajectoryInterpolator()
+        self._decoder = FrameDecoder(self._trajectory.handle_frame)
+        a = self.limits.acceleration
+        self._target = [p + v * abs(v) / (2.0 * a) for p, v in zip(self._position, self._velocity)]
+
+    def home(self) -> None:
+        """Return to the park position."""
+        self.set_target(self.limits.azimuth_min, self.limits.elevation_max)
+
+    def _advance(self) -> None:
+        """Move both axes along their profiles up to the clock's time, toward the trajectory if one covers it."""
+        now = self.clock()
+        elapsed = now - self._time
+        self._time = now
+        aim = self._trajectory.position(self.clock_sync.to_controller_ms(now))
+        if aim is not None:
+            self._aim(*aim)
+        if elapsed <= 0 or (not any(self._velocity) and self._position == self._target):
+            return
+        for axis in (0, 1):
+            self._position[axis], self._velocity[axis] = self._move(
+                self._position[axis], self._velocity[axis], self._target[axis], elapsed)
+
+    def _move(self, position: float, velocity: float, target: float, elapsed: float) -> Tuple[float, float]:
+        """
+        Follow the time-optimal move of one axis to rest at its target.
+
+        The move is a list of constant-acceleration phases: braking first if
+        the axis is heading away or cannot stop in time, then accelerate
+        (or slow down to max speed), cruise and decelerate.
+
+        Returns:
+            (position, velocity) after elapsed seconds
+        """
+        v_max, a = self.limits.max_speed, self.limits.acceleration
+        phases = []
+        start, speed = position, velocity
+        distance = target - start
+        if speed and (speed * distance < 0 or speed * speed / (2.0 * a) > abs(distance)):
+            brake = abs(speed) / a
+            phases.append((brake, -math.copysign(a, speed)))
+            start += speed * brake / 2.0
+            speed = 0.0
+            distance = target - start
+        if distance:
+            sign = math.copysign(1.0, distance)
+            toward = speed * sign
+            peak = min(v_max, math.sqrt(a * abs(distance) + toward * toward / 2.0))
+            ramp = abs(peak - toward) / a
+            stop = peak / a
+            cruise = abs(distance) - (peak + toward) / 2.0 * ramp - peak * stop / 2.0
+            phases += [(ramp, math.copysign(a, peak - toward) * sign),
+                       (max(cruise, 0.0) / peak, 0.0),
+                       (stop, -a * sign)]
+
+        for duration, acceleration in phases:
+            step = min(duration, elapsed)
+            position += velocity * step + 0.5 * acceleration * step * step
+            velocity += acceleration * step
+            elapsed -= step
+            if elapsed <= 0:
+                return position, velocity
+        return target, 0.0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get link counters: the keys of AntennaLink.stats() plus 'limited'.
+
+        Returns:
+            Dictionary with commands sent, position reads and clamped
+            targets; counters the simulation has no use for are zero
+        """
+        return {
+            'sent': self.sent,
+            'coalesced': 0,
+            'reports': self.reports,
+            'discarded': 0,
+            'crc_errors': 0,
+            'encode_errors': 0,
+            'pending': 0,
+            'limited': self.limited,
+        }
+
+
+class SignalModel:
+    """
+    Seeded synthetic receiver.
+
+    Signal strength is the antenna gain less the beam pattern loss for the
+    pointing error (12 dB at the edge of the half-power beamwidth, squared
+    law), with receiver noise: the signal amplitude is perturbed by complex
+    Gaussian noise of relative magnitude noise_level.
+    """
+
+    def __init__(self, center_frequency: float, diameter: float, gain: float,
+                 noise_level: float, seed: int = 0):
+        """
+        Initialize the model.
+
+        Args:
+            center_frequency: Downlink frequency in Hz
+            diameter: Antenna diameter in meters
+            gain: Antenna gain in dBi (on-axis signal strength without noise)
+            noise_level: Relative noise amplitude (0 for a noiseless signal)
+            seed: Random seed; equal seeds give identical noise sequences
+        """
+        self.center_frequency = center_frequency
+        self.beamwidth = BEAMWIDTH_FACTOR * SPEED_OF_LIGHT_MPS / center_frequency / diameter
+        self.gain = gain
+        self.noise_level = noise_level
+        self._random = random.Random(seed)
+
+    def signal_strength(self, pointing_error: float) -> float:
+        """
+        Received signal strength in dB for a pointing error.
+
+        Args:
+            pointing_error: Angle between antenna boresight and satellite in degrees
+
+        Returns:
+            Signal strength in dB
+        """
+        loss = 12.0 * (pointing_error / self.beamwidth) ** 2
+        gauss = self._random.gauss
+        scale = self.noise_level / math.sqrt(2.0)
+        amplitude = math.hypot(1.0 + gauss(0.0, scale), gauss(0.0, scale))
+        return self.gain - loss + 20.0 * math.log10(max(amplitude, 1e-6))
+
+    def doppler_shift(self, range_rate: float) -> float:
+        """
+        Measured Doppler shift in Hz for a range rate, with frequency noise.
+
+        Args:
+            range_rate: Range rate in km/s (positive when receding)
+
+        Returns:
+            Doppler shift in Hz
+        """
+        shift = -self.center_frequency * range_rate * 1000.0 / SPEED_OF_LIGHT_MPS
+        return shift + self._random.gauss(0.0, self.noise_level * DOPPLER_NOISE_HZ)
+
+
+def synthetic_catalog(count: int, seed: int = 0, epoch: float = SIMULATION_EPOCH,
+                      inclination: float = 53.0, mean_motion: float = 15.06) -> List[Tuple[str, str, str]]:
+    """
+    Seeded Starlink-like TLEs with random orbital planes and phases.
+
+    Args:
+        count: Number of satellites
+        seed: Random seed
+        epoch: Element epoch in Unix seconds (within 2000-2099)
+        inclination: Inclination in degrees
+        mean_motion: Revolutions per day
+
+    Returns:
+        List of (name, line1, line2)
+    """
+    rng = random.Random(seed)
+    year = 2000 + int((epoch - 946684800.0) // 31557600.0)
+    day = 1.0 + (epoch - _year_start(year)) / 86400.0
+    catalog = []
+    for i in range(count):
+        norad_id = SIMULATED_NORAD_BASE + i
+        raan, anomaly = rng.uniform(0.0, 360.0), rng.uniform(0.0, 360.0)
+        line1 = _checksum(f"1 {norad_id:05d}U 24001A   {year % 100:02d}{day:012.8f}  .00001234  00000-0  "
+                          f"10000-3 0  999")
+        line2 = _checksum(f"2 {norad_id:05d} {inclination:8.4f} {raan:8.4f} 0001400  90.0000 "
+                          f"{anomaly:8.4f} {mean_motion:11.8f}    1")
+        catalog.append((f"SIM-{i}", line1, line2))
+    return catalog
+
+
+def _year_start(year: int) -> float:
+    """Unix time of January 1 of a year, UTC."""
+    days = (year - 1970) * 365 + (year - 1969) // 4
+    return days * 86400.0
+
+
+def _checksum(line: str) -> str:
+    """Append the TLE modulo-10 checksum to a 68-character line."""
+    total = sum(int(c) if c.isdigit() else c == '-' for c in line)
+    return line + str(total % 10)
+
+
+def make_tracker(latitude: float, longitude: float, elevation: float, count: int, seed: int = 0):
+    """
+    SatelliteTracker loaded with a synthetic catalog.
+
+    Args:
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        elevation: Observer altitude in meters
+        count: Number of synthetic satellites
+        seed: Random seed for the orbits
+
+    Returns:
+        SatelliteTracker
+    """
+    from satellite_tracker import SatelliteTracker
+
+    tracker = SatelliteTracker(latitude, longitude, elevation)
+    for name, line1, line2 in synthetic_catalog(count, seed):
+        tracker.add_satellite(name, line1, line2)
+    return tracker
@@ -0,0 +1,294 @@
+"""
+Starlink DIY - Antenna Slew Planner
+
+This module models how fast the antenna can actually move. Each axis follows
+a trapezoidal velocity profile (accelerate, cruise at max speed, decelerate)
+derived from the motor settings, and the two axes move at the same time, so
+a slew takes as long as the slower axis.
+
+Azimuth is handled as a mechanical angle inside the configured limits. A
+compass azimuth may be reachable at several mechanical angles (a mount with
+more than 360 degrees of travel) or only one (the default 0-360 limits,
+where crossing north means going the long way around). The planner picks
+the wrap that is fastest and still lets the whole pass be followed, and
+flags passes the mount cannot follow at all, such as near-zenith passes whose
+azimuth rate exceeds the motor speed.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MotionLimits:
+    """Per-axis speed and acceleration limits and pointing limits (degrees)."""
+    max_speed: float = 10.0      # degrees per second
+    acceleration: float = 5.0    # degrees per second^2
+    azimuth_min: float = 0.0
+    azimuth_max: float = 360.0
+    elevation_min: float = 10.0
+    elevation_max: float = 90.0
+
+    def __post_init__(self):
+        """Validate limits."""
+        if self.max_speed <= 0 or self.acceleration <= 0:
+            raise ValueError("max_speed and acceleration must be positive")
+        if self.azimuth_max <= self.azimuth_min or self.elevation_max <= self.elevation_min:
+            raise ValueError("Pointing limits must have max greater than min")
+
+    @classmethod
+    def from_motor(cls, steps_per_degree: float, max_speed: float, acceleration: float,
+                   **limits) -> 'MotionLimits':
+        """
+        Build limits from motor settings in steps.
+
+        Args:
+            steps_per_degree: Motor steps per degree of rotation
+            max_speed: Maximum speed in steps per second
+            acceleration: Acceleration in steps per second^2
+            **limits: Pointing limits (azimuth_min, azimuth_max, ...)
+
+        Returns:
+            MotionLimits in degrees
+        """
+        return cls(max_speed / steps_per_degree, acceleration / steps_per_degree, **limits)
+
+
+class PassCheck(NamedTuple):
+    """Result of checking whether the antenna can follow a pass."""
+    reachable: bool
+    reason: str                  # Empty when reachable
+    azimuth_offset: float        # Add to compass azimuth to get mechanical azimuth
+    max_azimuth_rate: float      # degrees per second
+    max_elevation_rate: float    # degrees per second
+
+
+class Handover(NamedTuple):
+    """Chosen next target and when the antenna reaches it."""
+    satellite_id: Hashable       # Key from the candidates mapping
+    intercept_time: float        # Unix seconds when the antenna is on target
+    dead_time: float             # Seconds without a link
+    mechanical_azimuth: float    # Mechanical azimuth at intercept
+    elevation: float             # Elevation at intercept
+    azimuth_offset: float        # Wrap offset to use for the rest of the pass
+
+
+def move_time(distance, max_speed: float, acceleration: float):
+    """
+    Minimum time to move a distance from rest to rest with a trapezoidal profile.
+
+    Args:
+        distance: Distance in degrees (scalar or array)
+        max_speed: Maximum speed in degrees per second
+        acceleration: Acceleration in degrees per second^2
+
+    Returns:
+        Time in seconds (same shape as distance)
+    """
+    distance = np.abs(distance)
+    ramp = max_speed * max_speed / acceleration  # Distance to reach max speed and stop again
+    return np.where(distance <= ramp,
+                    2.0 * np.sqrt(distance / acceleration),
+                    distance / max_speed + max_speed / acceleration)
+
+
+class SlewPlanner:
+    """
+    Minimum-time slews and pass feasibility for one antenna mount.
+    """
+
+    def __init__(self, limits: MotionLimits = MotionLimits()):
+        """
+        Initialize the planner.
+
+        Args:
+            limits: Mount limits
+        """
+        self.limits = limits
+        # Whole turns that can be added to a compass azimuth inside the limits
+        self._turns = np.arange(np.floor(limits.azimuth_min / 360.0) - 1,
+                                np.ceil(limits.azimuth_max / 360.0) + 1) * 360.0
+
+    def axis_time(self, distance):
+        """Time for one axis to move a distance (degrees)."""
+        return move_time(distance, self.limits.max_speed, self.limits.acceleration)
+
+    def slew(self, from_azimuth: float, from_elevation: float,
+             to_azimuth: float, to_elevation: float) -> Tuple[float, float]:
+        """
+        Fastest move to a compass direction.
+
+        Args:
+            from_azimuth: Current mechanical azimuth in degrees
+            from_elevation: Current elevation in degrees
+            to_azimuth: Target compass azimuth in degrees
+            to_elevation: Target elevation in degrees
+
+        Returns:
+            Tuple of (duration in seconds, mechanical azimuth to move to)
+
+        Raises:
+            ValueError: If the target is outside the pointing limits
+        """
+        limits = self.limits
+        if not limits.elevation_min <= to_elevation <= limits.elevation_max:
+            raise ValueError(f"Elevation {to_elevation:.2f} outside limits")
+        options = (to_azimuth % 360.0) + self._turns
+        options = options[(options >= limits.azimuth_min) & (options <= limits.azimuth_max)]
+        azimuth = options[np.argmin(np.abs(options - from_azimuth))]
+        duration = max(float(self.axis_time(azimuth - from_azimuth)),
+                       float(self.axis_time(to_elevation - from_elevation)))
+        return duration, float(azimuth)
+
+    def slew_times(self, from_azimuth, from_elevation, to_azimuth, to_elevation) -> np.ndarray:
+        """
+        Vectorized slew() durations; arguments broadcast together.
+
+        Elevation limits are not checked. The start azimuth is taken as a
+        mechanical angle, which for the default 0-360 limits is the compass
+        azimuth itself.
+
+        Returns:
+            Durations in seconds
+        """
+        options = np.mod(to_azimuth, 360.0)[..., np.newaxis] + self._turns
+        valid = (options >= self.limits.azimuth_min) & (options <= self.limits.azimuth_max)
+        distance = np.min(np.where(valid, np.abs(options - np.asarray(from_azimuth)[..., np.newaxis]), np.inf),
+                          axis=-1)
+        return np.maximum(self.axis_time(distance), self.axis_time(np.subtract(to_elevation, from_elevation)))
+
+    def can_follow(self, azimuth0, elevation0, azimuth1, elevation1, duration: float) -> np.ndarray:
+        """
+        Vectorized check that a short track step can be followed continuously.
+
+        The step must fit the speed limit and must not cross an azimuth
+        limit (e.g. north on a 0-360 mount).
+
+        Args:
+            azimuth0, elevation0: Compass azimuth and elevation at the start
+            azimuth1, elevation1: Compass azimuth and elevation at the end
+            duration: Step length in seconds
+
+        Returns:
+            Boolean array
+        """
+        start = np.mod(azimuth0, 360.0)
+        end = start + (np.subtract(azimuth1, azimuth0) + 180.0) % 360.0 - 180.0
+        fast = np.maximum(np.abs(end - start), np.abs(np.subtract(elevation1, elevation0)))
+        low = np.minimum(start, end)[..., np.newaxis] + self._turns
+        high = np.maximum(start, end)[..., np.newaxis] + self._turns
+        inside = np.any((low >= self.limits.azimuth_min) & (high <= self.limits.azimuth_max), axis=-1)
+        return inside & (fast <= self.limits.max_speed * duration)
+
+    def _offsets(self, unwrapped: np.ndarray) -> np.ndarray:
+        """Wrap offsets that keep a whole unwrapped azimuth path inside the limits."""
+        low, high = np.min(unwrapped), np.max(unwrapped)
+        offsets = self._turns - 360.0 * np.floor(unwrapped[0] / 360.0)
+        return offsets[(low + offsets >= self.limits.azimuth_min) & (high + offsets <= self.limits.azimuth_max)]
+
+    def check_pass(self, times: np.ndarray, azimuth: np.ndarray, elevation: np.ndarray,
+                   from_azimuth: Optional[float] = None) -> PassCheck:
+        """
+        Check whether the antenna can follow a sampled pass.
+
+        Args:
+            times: Sample times (Unix seconds), increasing
+            azimuth: Compass azimuth samples in degrees
+            elevation: Elevation samples in degrees
+            from_azimuth: Current mechanical azimuth; among valid wraps the
+                one closest to it is chosen (default: the most centered)
+
+        Returns:
+            PassCheck with the wrap offset to use and the reason if unreachable
+        """
+        unwrapped = np.degrees(np.unwrap(np.radians(azimuth)))
+        dt = np.diff(times)
+        az_rate = np.diff(unwrapped) / dt if len(dt) else np.zeros(0)
+        el_rate = np.diff(elevation) / dt if len(dt) else np.zeros(0)
+        max_az_rate = float(np.max(np.abs(az_rate))) if len(az_rate) else 0.0
+        max_el_rate = float(np.max(np.abs(el_rate))) if len(el_rate) else 0.0
+        limits = self.limits
+
+        offsets = self._offsets(unwrapped)
+        if not len(offsets):
+            return PassCheck(False, "azimuth travel exceeds the mount's wrap range", 0.0, max_az_rate, max_el_rate)
+        if from_azimuth is None:
+            middle = 0.5 * (limits.azimuth_min + limits.azimuth_max)
+            offset = offsets[np.argmin(np.abs(0.5 * (unwrapped.min() + unwrapped.max()) + offsets - middle))]
+        else:
+            offset = offsets[np.argmin(np.abs(unwrapped[0] + offsets - from_azimuth))]
+
+        if max(max_az_rate, max_el_rate) > limits.max_speed:
+            return PassCheck(False, f"needs {max(max_az_rate, max_el_rate):.1f} deg/s, "
+                             f"limit {limits.max_speed:.1f} deg/s", float(offset), max_az_rate, max_el_rate)
+        if len(dt) > 1:
+            accel = np.max(np.abs(np.diff(np.stack((az_rate, el_rate)), axis=1)) / dt[1:])
+            if accel > limits.acceleration:
+                return PassCheck(False, f"needs {accel:.1f} deg/s^2, limit {limits.acceleration:.1f} deg/s^2",
+                                 float(offset), max_az_rate, max_el_rate)
+        return PassCheck(True, "", float(offset), max_az_rate, max_el_rate)
+
+    def intercept(self, from_azimuth: float, from_elevation: float, now: float,
+                  times: np.ndarray, azimuth: np.ndarray, elevation: np.ndarray,
+                  azimuth_offset: float) -> Optional[Tuple[int, float]]:
+        """
+        Earliest sample of a moving target the antenna can reach in time.
+
+        Args:
+            from_azimuth: Current mechanical azimuth in degrees
+            from_elevation: Current elevation in degrees
+            now: Current time (Unix seconds)
+            times: Target sample times (Unix seconds)
+            azimuth: Target compass azimuth samples
+            elevation: Target elevation samples
+            azimuth_offset: Wrap offset from check_pass()
+
+        Returns:
+            Tuple of (sample index, mechanical azimuth), or None if the
+            target cannot be reached above the elevation limit
+        """
+        mechanical = np.degrees(np.unwrap(np.radians(azimuth))) + azimuth_offset
+        needed = np.maximum(self.axis_time(mechanical - from_azimuth), self.axis_time(elevation - from_elevation))
+        ok = (needed <= times - now) & (elevation >= self.limits.elevation_min)
+        index = np.flatnonzero(ok)
+        if not len(index):
+            return None
+        return int(index[0]), float(mechanical[index[0]])
+
+    def choose_handover(self, from_azimuth: float, from_elevation: float, now: float,
+                        candidates: Dict[Hashable, Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> Optional[Handover]:
+        """
+        Pick the next satellite that minimizes dead time.
+
+        Candidates whose remaining pass the mount cannot follow are skipped.
+
+        Args:
+            from_azimuth: Current mechanical azimuth in degrees
+            from_elevation: Current elevation in degrees
+            now: Current time (Unix seconds)
+            candidates: Satellite ID to (times, azimuth, elevation) samples
+                of its track from now on
+
+        Returns:
+            Best Handover, or None if no candidate can be reached
+        """
+        best = None
+        for satellite_id, (times, azimuth, elevation) in candidates.items():
+            visible = elevation >= self.limits.elevation_min
+            if not np.any(visible):
+                continue
+            check = self.check_pass(times[visible], azimuth[visible], elevation[visible], from_azimuth)
+            if not check.reachable:
+                continue
+            hit = self.intercept(from_azimuth, from_elevation, now, times, azimuth, elevation,
+                                 check.azimuth_offset)
+            if hit is None:
+                continue
+            index, mechanical = hit
+            handover = Handover(satellite_id, float(times[index]), float(times[index] - now),
+                                mechanical, float(elevation[index]), check.azimuth_offset)
+            if best is None or handover.dead_time < best.dead_time:
+                best = handover
+        return best
@@ -0,0 +1,490 @@
+"""
+Ground station configuration.
+
+The YAML file (see config.example.yaml) is loaded into frozen dataclasses,
+one per top-level section, each validated in __post_init__. Parsing and
+the parsed values are cached on disk as JSON, keyed by the file's mtime, size
+and SHA-256, so a restart with an unchanged file skips YAML parsing. Cached
+values are validated again on load, so validation changes apply to them.
+The station caches under default_cache_dir(); STARLINK_DIY_CACHE_DIR
+overrides the directory.
+ConfigWatcher polls the file and reports which sections changed so a
+running station can apply just those.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+CACHE_FORMAT = 3  # Bump when the cache entry layout changes
+CACHE_DIR_ENV = 'STARLINK_DIY_CACHE_DIR'  # Cache directory override; empty disables caching
+
+ANTENNA_TYPES = ('parabolic', 'phased_array', 'helical')
+FREQUENCY_BANDS = ('Ku', 'Ka')
+SERIAL_PROTOCOLS = ('text', 'binary')
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+
+@dataclass(frozen=True)
+class StationConfig:
+    """Station location."""
+
+    name: str = "My Ground Station"
+    latitude: float = 45.0    # Degrees north
+    longitude: float = -93.0  # Degrees east
+    elevation: float = 300.0  # Meters above sea level
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if not -90.0 <= self.latitude <= 90.0:
+            raise ValueError("Latitude must be between -90 and 90 degrees")
+        if not -180.0 <= self.longitude <= 180.0:
+            raise ValueError("Longitude must be between -180 and 180 degrees")
+
+
+@dataclass(frozen=True)
+class AntennaConfig:
+    """Antenna type and pointing limits."""
+
+    type: str = "parabolic"
+    diameter: float = 0.9  # Meters
+    gain: float = 35.0     # dBi
+    frequency_band: str = "Ku"
+    azimuth_min: float = 0.0
+    azimuth_max: float = 360.0
+    elevation_min: float = 10.0
+    elevation_max: float = 90.0
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.type not in ANTENNA_TYPES:
+            raise ValueError(f"Antenna type must be one of {', '.join(ANTENNA_TYPES)}")
+        if self.frequency_band not in FREQUENCY_BANDS:
+            raise ValueError(f"Frequency band must be one of {', '.join(FREQUENCY_BANDS)}")
+        if self.diameter <= 0:
+            raise ValueError("Antenna diameter must be positive")
+        if self.azimuth_max <= self.azimuth_min:
+            raise ValueError("Azimuth max must be greater than azimuth min")
+        if not 0.0 <= self.elevation_min < self.elevation_max <= 90.0:
+            raise ValueError("Elevation limits must satisfy 0 <= min < max <= 90")
+
+
+@dataclass(frozen=True)
+class MotorConfig:
+    """Stepper motor controller settings."""
+
+    azimuth_steps_per_degree: float = 100.0
+    elevation_steps_per_degree: float = 100.0
+    max_speed: float = 1000.0    # Steps per second
+    acceleration: float = 500.0  # Steps per second^2
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.azimuth_steps_per_degree <= 0 or self.elevation_steps_per_degree <= 0:
+            raise ValueError("Steps per degree must be positive")
+        if self.max_speed <= 0 or self.acceleration <= 0:
+            raise ValueError("Motor speed and acceleration must be positive")
+
+
+@dataclass(frozen=True)
+class HardwareConfig:
+    """Serial link to the antenna controller."""
+
+    serial_port: str = "/dev/ttyUSB0"
+    baud_rate: int = 115200
+    timeout: float = 1.0  # Seconds
+    protocol: str = "text"
+    motor: MotorConfig = field(default_factory=MotorConfig)
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if not self.serial_port:
+            raise ValueError("Serial port must be provided")
+        if self.baud_rate <= 0:
+            raise ValueError("Baud rate must be positive")
+        if self.timeout <= 0:
+            raise ValueError("Timeout must be positive")
+        if self.protocol not in SERIAL_PROTOCOLS:
+            raise ValueError(f"Protocol must be one of {', '.join(SERIAL_PROTOCOLS)}")
+
+
+@dataclass(frozen=True)
+class TrackingConfig:
+    """Tracking loop and TLE source."""
+
+    update_rate: float = 5.0    # Hz
+    min_elevation: float = 25.0  # Degrees
+    max_satellites: int = 10
+    tle_source: str = "https://celestrak.org/NORAD/elements/gp.php?GROUP=starlink&FORMAT=tle"  # URL or local path
+    tle_update_interval: float = 86400.0  # Seconds
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.update_rate <= 0:
+            raise ValueError("Update rate must be positive")
+        if not 0.0 <= self.min_elevation < 90.0:
+            raise ValueError("Min elevation must be between 0 and 90 degrees")
+        if self.max_satellites < 1:
+            raise ValueError("Max satellites must be at least 1")
+        if self.tle_update_interval <= 0:
+            raise ValueError("TLE update interval must be positive")
+
+
+@dataclass(frozen=True)
+class SignalConfig:
+    """Signal processing and Doppler correction."""
+
+    center_frequency: float = 12.5e9  # Hz
+    bandwidth: float = 250e6          # Hz
+    enable_doppler_correction: bool = True
+    doppler_update_rate: float = 10.0  # Hz
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.center_frequency <= 0 or self.bandwidth <= 0:
+            raise ValueError("Center frequency and bandwidth must be positive")
+        if self.doppler_update_rate <= 0:
+            raise ValueError("Doppler update rate must be positive")
+
+
+@dataclass(frozen=True)
+class TelemetryConfig:
+    """Binary telemetry log."""
+
+    enabled: bool = True
+    file: str = "logs/telemetry.bin"
+    interval: float = 1.0  # Seconds between batch writes
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if not self.file:
+            raise ValueError("Telemetry file must be provided")
+        if self.interval <= 0:
+            raise ValueError("Telemetry interval must be positive")
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    """Log files and rotation."""
+
+    level: str = "INFO"
+    file: str = "logs/ground_station.log"
+    max_size: int = 10485760  # Bytes
+    backup_count: int = 5
+    telemetry: TelemetryConfig = field(default_factory=TelemetryConfig)
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.level not in LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {', '.join(LOG_LEVELS)}")
+        if self.max_size < 0:
+            raise ValueError("Max size cannot be negative")
+        if self.backup_count < 0:
+            raise ValueError("Backup count cannot be negative")
+
+
+@dataclass(frozen=True)
+class WebConfig:
+    """Optional web interface."""
+
+    enabled: bool = False
+    host: str = "0.0.0.0"
+    port: int = 8080
+    debug: bool = False
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if not 0 < self.port < 65536:
+            raise ValueError("Port must be between 1 and 65535")
+
+
+@dataclass(frozen=True)
+class SafetyConfig:
+    """Safety limits."""
+
+    watchdog_timeout: float = 10.0  # Seconds
+    enforce_limits: bool = True
+    max_transmit_power: float = 10.0  # Watts
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.watchdog_timeout <= 0:
+            raise ValueError("Watchdog timeout must be positive")
+        if self.max_transmit_power < 0:
+            raise ValueError("Max transmit power cannot be negative")
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Simulation mode."""
+
+    enabled: bool = False
+    simulated_satellites: int = 5
+    noise_level: float = 0.1
+    seed: int = 0  # Seeds the synthetic catalog and signal noise
+
+    def __post_init__(self):
+        """Validate configuration parameters."""
+        if self.simulated_satellites < 0:
+            raise ValueError("Simulated satellites cannot be negative")
+        if self.noise_level < 0:
+            raise ValueError("Noise level cannot be negative")
+        if self.seed < 0:
+            raise ValueError("Seed cannot be negative")
+
+
+@dataclass(frozen=True)
+class GroundStationConfig:
+    """Complete ground station configuration, one field per YAML section."""
+
+    station: StationConfig = field(default_factory=StationConfig)
+    antenna: AntennaConfig = field(default_factory=AntennaConfig)
+    hardware: HardwareConfig = field(default_factory=HardwareConfig)
+    tracking: TrackingConfig = field(default_factory=TrackingConfig)
+    signal: SignalConfig = field(default_factory=SignalConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    web: WebConfig = field(default_factory=WebConfig)
+    safety: SafetyConfig = field(default_factory=SafetyConfig)
+    simulation: SimulationConfig = field(default_factory=SimulationConfig)
+
+    def changed_sections(self, other: 'GroundStationConfig') -> List[str]:
+        """
+        Names of the sections that differ from another configuration.
+
+        Args:
+            other: Configuration to compare with
+
+        Returns:
+            Section names in declaration order
+        """
+        return [f.name for f in dataclasses.fields(self) if getattr(self, f.name) != getattr(other, f.name)]
+
+
+def _coerce(value: Any, kind: type, key: str) -> Any:
+    """Convert one YAML value to a field type, rejecting mismatches."""
+    if dataclasses.is_dataclass(kind):
+        return _build(kind, value, key)
+    if kind is bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"{key} must be true or false")
+        return value
+    if kind in (int, float):
+        # YAML 1.1 reads exponents without a sign (12.5e9) as strings
+        if isinstance(value, bool):
+            raise ValueError(f"{key} must be a number")
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} must be a number") from None
+        if kind is int:
+            if not number.is_integer():
+                raise ValueError(f"{key} must be an integer")
+            return int(number)
+        return number
+    if not isinstance(value, str):
+        raise ValueError(f"{key} must be a string")
+    return value
+
+
+def _build(cls: type, data: Optional[Dict[str, Any]], prefix: str = '') -> Any:
+    """Build a config dataclass from a parsed YAML mapping."""
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ValueError(f"{prefix or 'Configuration'} must be a mapping")
+    fields = {f.name: f for f in dataclasses.fields(cls)}
+    unknown = sorted(set(data) - set(fields))
+    if unknown:
+        raise ValueError(f"Unknown configuration key {'.'.join(filter(None, [prefix, str(unknown[0])]))}")
+    values = {name: _coerce(value, fields[name].type, f"{prefix}.{name}" if prefix else name)
+              for name, value in data.items()}
+    try:
+        return cls(**values)
+    except ValueError as e:
+        raise ValueError(f"{prefix}: {e}" if prefix else str(e)) from None
+
+
+def parse_config(text: Union[str, bytes]) -> GroundStationConfig:
+    """
+    Parse and validate configuration YAML.
+
+    Args:
+        text: YAML document
+
+    Returns:
+        Validated GroundStationConfig; missing sections and keys take the
+        defaults from config.example.yaml
+
+    Raises:
+        ValueError: If the YAML is malformed, a key is unknown or a value
+            fails validation
+    """
+    import yaml
+
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML: {e}") from None
+    return _build(GroundStationConfig, data)
+
+
+def default_cache_dir() -> Optional[Path]:
+    """
+    Configuration cache directory for the station.
+
+    Returns:
+        STARLINK_DIY_CACHE_DIR if set (None if it is empty), otherwise
+        starlink-diy in the user cache directory
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override is not None:
+        return Path(override) if override else None
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'starlink-diy'
+
+
+def _cache_path(path: Path, cache_dir: Path) -> Path:
+    """Cache file for a configuration file."""
+    key = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / f"{path.stem}-{key}.json"
+
+
+def _read_cache(cache: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a cache entry, or None if it is missing, unreadable, stale or invalid.
+
+    The cached values go through the same validation as a parsed file, so
+    an entry written before a validation rule changed is not trusted.
+    """
+    try:
+        with open(cache, 'rb') as stream:
+            entry = json.load(stream)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get('format') != CACHE_FORMAT:
+        return None
+    try:
+        entry['config'] = _build(GroundStationConfig, entry.get('config'))
+    except ValueError:
+        return None
+    return entry
+
+
+def _write_cache(cache: Path, entry: Dict[str, Any]) -> None:
+    """Atomically replace a cache entry; failures only cost the next start."""
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=cache.name, suffix='.tmp')
+        with os.fdopen(fd, 'w') as stream:
+            json.dump(entry, stream)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+
+
+def load_config(path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None
+                ) -> Tuple[GroundStationConfig, bool]:
+    """
+    Load a configuration file through the on-disk cache.
+
+    An unchanged mtime and size return the cached result without reading
+    the file. Otherwise the file is hashed; a matching hash (e.g. after a
+    touch or checkout) also skips parsing and validation. An empty file
+    gives the defaults and is not cached.
+
+    Args:
+        path: YAML configuration file
+        cache_dir: Cache directory (default: no caching)
+
+    Returns:
+        Tuple of (configuration, whether it came from the cache)
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the configuration is invalid
+    """
+    path = Path(path)
+    info = path.stat()
+    cache = _cache_path(path, Path(cache_dir)) if cache_dir is not None else None
+    entry = _read_cache(cache) if cache is not None else None
+    if entry is not None and entry['mtime_ns'] == info.st_mtime_ns and entry['size'] == info.st_size:
+        return entry['config'], True
+
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if entry is not None and entry['sha256'] == digest:
+        config, cached = entry['config'], True
+    else:
+        config, cached = parse_config(data), False
+    if cache is not None and data.strip():
+        _write_cache(cache, {'format': CACHE_FORMAT, 'mtime_ns': info.st_mtime_ns, 'size': info.st_size,
+                             'sha256': digest, 'config': dataclasses.asdict(config)})
+    return config, cached
+
+
+class ConfigWatcher:
+    """
+    Poll a configuration file and report changed sections.
+
+    poll() is cheap (one stat) and meant to run as a scheduler stage. When
+    the file changes it is re-loaded; if the new file is invalid the
+    current configuration stays in effect and the error is kept in
+    last_error.
+    """
+
+    def __init__(self, path: Union[str, Path], config: GroundStationConfig,
+                 on_change: Callable[[GroundStationConfig, List[str]], None],
+                 cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the watcher.
+
+        Args:
+            path: Configuration file
+            config: Configuration currently in effect
+            on_change: Called with (new configuration, changed section names)
+            cache_dir: Cache directory passed to load_config()
+        """
+        self.path = Path(path)
+        self.config = config
+        self.on_change = on_change
+        self.cache_dir = cache_dir
+        self.reloads = 0
+        self.last_error = None
+        self._signature = self._stat()
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """File (mtime_ns, size), or None if it is missing."""
+        try:
+            info = self.path.stat()
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def poll(self) -> List[str]:
+        """
+        Reload the file if it changed since the last poll.
+
+        Returns:
+            Names of the sections that changed (empty if none did)
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return []
+        self._signature = signature
+        try:
+            config, _ = load_config(self.path, self.cache_dir)
+        except (OSError, ValueError) as e:
+            self.last_error = e
+            return []
+        self.last_error = None
+        changed = config.changed_sections(self.config)
+        self.config = config
+        if changed:
+            self.reloads += 1
+            self.on_change(config, changed)
+        return changed
+
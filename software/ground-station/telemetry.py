@@ -0,0 +1,429 @@
+"""
+Starlink DIY - Telemetry Storage
+
+Per-tick pointing and signal telemetry is buffered in a preallocated NumPy
+structured array and written in batches to an append-only binary file of
+fixed-size records. A flush is a single write() of the filled part of the
+buffer, instead of one formatted CSV line or one SQLite insert per record.
+
+File layout (little-endian):
+
+    offset  size  field
+    0       4     magic b'SDTL'
+    4       2     format version
+    6       2     record size in bytes
+    8       8     reserved (zero)
+    16      ...   records with TELEMETRY_DTYPE
+
+Files rotate like logging.handlers.RotatingFileHandler: when a batch would
+push the file past max_size it is renamed to <name>.1 (older backups shift
+up, and the one beyond backup_count is deleted) and a new file is started.
+Records never straddle two files.
+
+TelemetryReader memory-maps the live file and its backups so weeks of data
+can be sliced by time and downsampled without reading it all into RAM.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+import math
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+MAGIC = b'SDTL'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHH8x')
+
+TELEMETRY_DTYPE = np.dtype([
+    ('timestamp', '<f8'),        # Unix seconds
+    ('norad_id', '<i4'),         # -1 when unknown
+    ('azimuth', '<f4'),          # Commanded azimuth, degrees
+    ('elevation', '<f4'),        # Commanded elevation, degrees
+    ('range_rate', '<f4'),       # km/s
+    ('pointing_error', '<f4'),   # Commanded vs. reported position, degrees
+    ('signal_strength', '<f4'),  # dBm
+    ('doppler_shift', '<f4'),    # Hz
+    ('latency', '<f4'),          # Command latency, seconds
+])
+
+DEFAULT_MAX_SIZE = 10485760      # logging.max_size
+DEFAULT_BACKUP_COUNT = 5         # logging.backup_count
+DEFAULT_BATCH_SIZE = 4096        # Records buffered before a flush
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0  # logging.telemetry.interval
+QUERY_CHUNK_RECORDS = 1 << 20     # Records per chunk when downsampling
+
+
+def backup_path(path: Path, index: int) -> Path:
+    """Path of the index-th rotated backup (0 is the live file)."""
+    return path if index == 0 else path.with_name(f"{path.name}.{index}")
+
+
+class TelemetryWriter:
+    """
+    Buffered, rotating writer for telemetry records.
+
+    Thread-safe: the pipeline's telemetry thread and the scheduler stages
+    may append concurrently.
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL_SEC, fsync: bool = False,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the writer and open (or continue) the live file.
+
+        Args:
+            path: Live telemetry file
+            max_size: Rotate before the file would exceed this many bytes
+                (0 disables rotation)
+            backup_count: Rotated files to keep
+            batch_size: Records buffered before a flush
+            flush_interval: Flush at least this often while appending (seconds)
+            fsync: fsync() after every flush
+            clock: Time source for the flush interval
+
+        Raises:
+            ValueError: If batch_size is not positive, max_size cannot hold
+                one batch, or an existing file has a different format
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if max_size and max_size < HEADER.size + batch_size * TELEMETRY_DTYPE.itemsize:
+            raise ValueError("max_size must hold at least one batch")
+        self.path = Path(path)
+        self.max_size = max_size
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.clock = clock
+        self._buffer = np.zeros(batch_size, dtype=TELEMETRY_DTYPE)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._last_flush = clock()
+        self._file = None
+        self._size = 0
+
+        self.records = 0
+        self.flushes = 0
+        self.rotations = 0
+        self.bytes_written = 0
+        self.flush_seconds = 0.0
+        self.fsync_seconds = 0.0
+        self._open()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._size = self._file.seek(0, os.SEEK_END)
+        if self._size == 0:
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, TELEMETRY_DTYPE.itemsize))
+            self._size = HEADER.size
+        else:
+            with open(self.path, 'rb') as stream:
+                magic, version, record_size = HEADER.unpack(stream.read(HEADER.size))
+            if magic != MAGIC or version != FORMAT_VERSION or record_size != TELEMETRY_DTYPE.itemsize:
+                self._file.close()
+                raise ValueError(f"{self.path} is not a telemetry file of this format")
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            oldest = backup_path(self.path, self.backup_count)
+            if oldest.exists():
+                oldest.unlink()
+            for index in range(self.backup_count - 1, -1, -1):
+                source = backup_path(self.path, index)
+                if source.exists():
+                    source.rename(backup_path(self.path, index + 1))
+        else:
+            self.path.unlink()
+        self.rotations += 1
+        self._open()
+
+    def append(self, timestamp: float, norad_id: int = -1, azimuth: float = math.nan,
+               elevation: float = math.nan, range_rate: float = math.nan,
+               pointing_error: float = math.nan, signal_strength: float = math.nan,
+               doppler_shift: float = math.nan, latency: float = math.nan) -> None:
+        """
+        Buffer one record; flushes when the buffer is full or the flush
+        interval has passed.
+
+        Args:
+            timestamp: Unix seconds
+            norad_id: Satellite NORAD ID (-1 when unknown)
+            azimuth: Commanded azimuth in degrees
+            elevation: Commanded elevation in degrees
+            range_rate: Range rate in km/s
+            pointing_error: Commanded vs. reported position in degrees
+            signal_strength: Signal strength in dBm
+            doppler_shift: Doppler shift in Hz
+            latency: Command latency in seconds
+        """
+        with self._lock:
+            self._buffer[self._count] = (timestamp, norad_id, azimuth, elevation, range_rate,
+                                         pointing_error, signal_strength, doppler_shift, latency)
+            self._count += 1
+            if self._count == len(self._buffer) or self.clock() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def append_record(self, record: Dict) -> None:
+        """
+        Buffer a record dictionary (e.g. from TrackingPipeline telemetry).
+
+        The satellite_id key is stored as norad_id when it is numeric;
+        fields missing from the dictionary are stored as NaN.
+
+        Args:
+            record: Dictionary with a timestamp and any TELEMETRY_DTYPE fields
+        """
+        fields = {name: record[name] for name in TELEMETRY_DTYPE.names
+                  if name in record and record[name] is not None}
+        if 'norad_id' not in fields:
+            try:
+                fields['norad_id'] = int(record.get('satellite_id'))
+            except (TypeError, ValueError):
+                pass
+        self.append(**fields)
+
+    def extend(self, records: np.ndarray) -> None:
+        """
+        Buffer many records at once (e.g. a simulated run).
+
+        Args:
+            records: Array with TELEMETRY_DTYPE
+        """
+        with self._lock:
+            position = 0
+            while position < len(records):
+                take = min(len(self._buffer) - self._count, len(records) - position)
+                self._buffer[self._count:self._count + take] = records[position:position + take]
+                self._count += take
+                position += take
+                if self._count == len(self._buffer):
+                    self._flush()
+            if self.clock() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._last_flush = self.clock()
+        if not self._count:
+            return
+        started = time.perf_counter()
+        data = memoryview(self._buffer[:self._count]).cast('B')
+        if self.max_size and self._size + len(data) > self.max_size:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            synced = time.perf_counter()
+            os.fsync(self._file.fileno())
+            self.fsync_seconds += time.perf_counter() - synced
+        self._size += len(data)
+        self.bytes_written += len(data)
+        self.records += self._count
+        self.flushes += 1
+        self._count = 0
+        self.flush_seconds += time.perf_counter() - started
+
+    def close(self) -> None:
+        """Flush and close the live file."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'TelemetryWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get writer counters.
+
+        Returns:
+            Dictionary with records written, records still buffered, flushes,
+            rotations, bytes written and the time spent flushing and in fsync
+        """
+        return {
+            'records': self.records,
+            'buffered': self._count,
+            'flushes': self.flushes,
+            'rotations': self.rotations,
+            'bytes_written': self.bytes_written,
+            'flush_seconds': self.flush_seconds,
+            'fsync_seconds': self.fsync_seconds,
+        }
+
+
+class TelemetryReader:
+    """
+    Read-only, memory-mapped view of a telemetry file and its backups.
+
+    Files are mapped when the reader is created; records appended later
+    are not seen until refresh(). Timestamps are assumed to increase within
+    and across files, as the writer produces them.
+    """
+
+    def __init__(self, path: Union[str, Path], backup_count: int = DEFAULT_BACKUP_COUNT):
+        """
+        Map the live file and any backups.
+
+        Args:
+            path: Live telemetry file
+            backup_count: Highest backup index to look for
+
+        Raises:
+            ValueError: If a file is not a telemetry file of this format
+        """
+        self.path = Path(path)
+        self.backup_count = backup_count
+        self.files: List[np.ndarray] = []
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-map the files to pick up appended records and rotations."""
+        files = []
+        for index in range(self.backup_count, -1, -1):
+            path = backup_path(self.path, index)
+            if not path.exists():
+                continue
+            with open(path, 'rb') as stream:
+                header = stream.read(HEADER.size)
+            if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, FORMAT_VERSION,
+                                                                     TELEMETRY_DTYPE.itemsize):
+                raise ValueError(f"{path} is not a telemetry file of this format")
+            count = (path.stat().st_size - HEADER.size) // TELEMETRY_DTYPE.itemsize
+            if count:
+                files.append(np.memmap(path, dtype=TELEMETRY_DTYPE, mode='r', offset=HEADER.size,
+                                       shape=(count,)))
+        self.files = files
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self.files)
+
+    @property
+    def start(self) -> Optional[float]:
+        """Timestamp of the first record."""
+        return float(self.files[0]['timestamp'][0]) if self.files else None
+
+    @property
+    def end(self) -> Optional[float]:
+        """Timestamp of the last record."""
+        return float(self.files[-1]['timestamp'][-1]) if self.files else None
+
+    def segments(self, start: Optional[float] = None, end: Optional[float] = None) -> List[np.ndarray]:
+        """
+        Records in [start, end) as one view per file (no data is copied).
+
+        Args:
+            start: First Unix time included (default: beginning)
+            end: Unix time excluded (default: end)
+
+        Returns:
+            List of memory-mapped record views, oldest first
+        """
+        views = []
+        for records in self.files:
+            timestamps = records['timestamp']
+            first = 0 if start is None else int(np.searchsorted(timestamps, start, 'left'))
+            last = len(records) if end is None else int(np.searchsorted(timestamps, end, 'left'))
+            if first < last:
+                views.append(records[first:last])
+        return views
+
+    def slice(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """
+        Records in [start, end).
+
+        Returns:
+            A memory-mapped view when the range lies in one file, otherwise
+            a copy joined from the per-file views
+        """
+        views = self.segments(start, end)
+        if len(views) == 1:
+            return views[0]
+        if not views:
+            return np.zeros(0, dtype=TELEMETRY_DTYPE)
+        return np.concatenate(views)
+
+    def downsample(self, fields: Sequence[str], bucket: float, start: Optional[float] = None,
+                   end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Per-bucket minimum, maximum and mean of fields, ignoring NaN.
+
+        Buckets are aligned to multiples of the bucket length. The mapped
+        files are reduced in chunks with ufunc.reduceat, so memory use is
+        bounded by the chunk size and the bucket tables.
+
+        Args:
+            fields: TELEMETRY_DTYPE field names
+            bucket: Bucket length in seconds
+            start: First Unix time included (default: beginning)
+            end: Unix time excluded (default: end)
+
+        Returns:
+            Dictionary with 'time' (bucket starts) and 'count' (records per
+            bucket), plus '<field>_min', '<field>_max' and '<field>_mean'
+            per field; empty buckets have count 0 and NaN statistics
+
+        Raises:
+            ValueError: If the bucket length is not positive or a field is unknown
+        """
+        if bucket <= 0:
+            raise ValueError("Bucket length must be positive")
+        for field in fields:
+            if field not in TELEMETRY_DTYPE.names:
+                raise ValueError(f"Unknown telemetry field: {field}")
+        views = self.segments(start, end)
+        if not views:
+            return {'time': np.zeros(0), 'count': np.zeros(0, dtype=np.int64)}
+        origin = np.floor(float(views[0]['timestamp'][0]) / bucket) * bucket
+        buckets = int((float(views[-1]['timestamp'][-1]) - origin) // bucket) + 1
+        edges = origin + bucket * np.arange(buckets + 1)
+
+        count = np.zeros(buckets, dtype=np.int64)
+        minimum = {field: np.full(buckets, np.inf) for field in fields}
+        maximum = {field: np.full(buckets, -np.inf) for field in fields}
+        total = {field: np.zeros(buckets) for field in fields}
+        valid = {field: np.zeros(buckets, dtype=np.int64) for field in fields}
+
+        for view in views:
+            for first in range(0, len(view), QUERY_CHUNK_RECORDS):
+                records = view[first:first + QUERY_CHUNK_RECORDS]
+                bounds = np.searchsorted(records['timestamp'], edges, 'left')
+                filled = np.flatnonzero(bounds[1:] > bounds[:-1])
+                offsets = bounds[filled]
+                count[filled] += bounds[filled + 1] - offsets
+                for field in fields:
+                    # One contiguous copy per chunk; reductions over the
+                    # strided record field would be several times slower
+                    values = np.array(records[field])
+                    missing = np.isnan(values)
+                    minimum[field][filled] = np.fmin(minimum[field][filled], np.fmin.reduceat(values, offsets))
+                    maximum[field][filled] = np.fmax(maximum[field][filled], np.fmax.reduceat(values, offsets))
+                    values[missing] = 0.0
+                    total[field][filled] += np.add.reduceat(values, offsets, dtype=np.float64)
+                    valid[field][filled] += (bounds[filled + 1] - offsets) - np.add.reduceat(missing, offsets)
+
+        result = {'time': edges[:-1], 'count': count}
+        for field in fields:
+            empty = valid[field] == 0
+            result[f'{field}_min'] = np.where(empty, np.nan, minimum[field])
+            result[f'{field}_max'] = np.where(empty, np.nan, maximum[field])
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[f'{field}_mean'] = np.where(empty, np.nan, total[field] / valid[field])
+        return result
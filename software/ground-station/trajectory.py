@@ -0,0 +1,296 @@
+"""
+Starlink DIY - Antenna Trajectory Upload
+
+Instead of sending a new pointing target every tick, the ground station can
+upload a pass as time-tagged cubic Hermite segments: knots at a fixed
+interval, each with azimuth, elevation and their rates. The controller
+interpolates locally in antenna_controller_update(), so the host only talks
+to it once per segment and tracking stays smooth if the host stalls.
+
+The knot interval is chosen per pass: it starts at KNOT_INTERVAL_SEC and is
+halved until the interpolated track stays within FIT_TOLERANCE_DEG of the
+propagated one (checked at the midpoints between knots, with the same
+float32/int16 quantization the frames use).
+
+TrajectoryInterpolator is a Python model of the firmware side, used to test
+uploads without hardware.
+"""
+
+from collections import deque
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from protocol import (FRAME_STOP, FRAME_TRAJECTORY_BEGIN, FRAME_TRAJECTORY_KNOT, FrameEncoder,
+                      decode_trajectory_header, decode_trajectory_knot)
+
+KNOT_INTERVAL_SEC = 4.0        # Initial knot spacing
+MIN_KNOT_INTERVAL_SEC = 0.25   # Refinement stops here
+FIT_TOLERANCE_DEG = 0.05       # Allowed interpolation error (POSITION_TOLERANCE is 0.5)
+MAX_KNOTS = 64                 # TRAJECTORY_MAX_KNOTS in the firmware
+MAX_SEGMENTS = 4               # TRAJECTORY_MAX_SEGMENTS in the firmware
+RATE_SCALE = 1000.0            # Rates travel as int16 millidegrees per second
+DERIVATIVE_STEP_SEC = 0.5      # Central difference step for knot rates
+CLOCK_SYNC_WINDOW = 32         # Position reports used for the clock offset
+
+
+class TrajectorySegment(NamedTuple):
+    """Uniform cubic Hermite segment, quantized as it is sent to the controller."""
+    segment_id: int
+    start: float                 # Unix seconds of the first knot
+    interval: float              # Seconds between knots
+    azimuth: np.ndarray          # Unwrapped degrees (float32)
+    elevation: np.ndarray        # Degrees (float32)
+    azimuth_rate: np.ndarray     # Degrees per second (int16 millidegree steps)
+    elevation_rate: np.ndarray   # Degrees per second
+
+    @property
+    def end(self) -> float:
+        """Unix seconds of the last knot."""
+        return self.start + self.interval * (len(self.azimuth) - 1)
+
+
+def hermite(p0, p1, m0, m1, u, h):
+    """
+    Evaluate a cubic Hermite interpolant.
+
+    Args:
+        p0, p1: Values at the interval ends
+        m0, m1: Derivatives at the interval ends (per second)
+        u: Position within the interval (0 to 1)
+        h: Interval length in seconds
+
+    Returns:
+        Interpolated value
+    """
+    u2 = u * u
+    u3 = u2 * u
+    return ((2 * u3 - 3 * u2 + 1) * p0 + (u3 - 2 * u2 + u) * h * m0
+            + (-2 * u3 + 3 * u2) * p1 + (u3 - u2) * h * m1)
+
+
+def evaluate(segment: TrajectorySegment, times) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate a segment at times inside it (the firmware computation, vectorized).
+
+    Args:
+        segment: Segment to evaluate
+        times: Unix seconds between segment.start and segment.end
+
+    Returns:
+        Tuple of azimuth (0-360) and elevation arrays in degrees
+    """
+    position = (np.asarray(times, dtype=np.float64) - segment.start) / segment.interval
+    index = np.clip(np.floor(position).astype(int), 0, len(segment.azimuth) - 2)
+    u = position - index
+    h = segment.interval
+    az = hermite(segment.azimuth[index], segment.azimuth[index + 1],
+                 segment.azimuth_rate[index], segment.azimuth_rate[index + 1], u, h)
+    el = hermite(segment.elevation[index], segment.elevation[index + 1],
+                 segment.elevation_rate[index], segment.elevation_rate[index + 1], u, h)
+    return np.mod(az, 360.0), el
+
+
+def _unwrap_degrees(azimuth: np.ndarray) -> np.ndarray:
+    return np.degrees(np.unwrap(np.radians(azimuth)))
+
+
+def _angle_error(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+def _quantize(azimuth, elevation, azimuth_rate, elevation_rate):
+    limit = 32767 / RATE_SCALE
+    quantize_rate = lambda r: np.round(np.clip(r, -limit, limit) * RATE_SCALE) / RATE_SCALE
+    return (azimuth.astype(np.float32).astype(np.float64), elevation.astype(np.float32).astype(np.float64),
+            quantize_rate(azimuth_rate), quantize_rate(elevation_rate))
+
+
+def plan_trajectory(tracker, satellite_id: str, start: float, end: float,
+                    interval: float = KNOT_INTERVAL_SEC, tolerance: float = FIT_TOLERANCE_DEG,
+                    max_knots: int = MAX_KNOTS, first_segment_id: int = 0) -> List[TrajectorySegment]:
+    """
+    Fit Hermite segments to a satellite's track.
+
+    Args:
+        tracker: SatelliteTracker with the satellite loaded
+        satellite_id: Satellite to follow
+        start: First time to cover (Unix seconds)
+        end: Last time to cover (Unix seconds)
+        interval: Initial knot spacing in seconds
+        tolerance: Allowed interpolation error in degrees
+        max_knots: Maximum knots per segment
+        first_segment_id: Identifier of the first segment
+
+    Returns:
+        Consecutive segments covering [start, end]; each shares its first
+        knot with the previous segment's last knot
+
+    Raises:
+        ValueError: If the window is empty or the satellite is not loaded
+    """
+    if end <= start:
+        raise ValueError("Trajectory end must be after start")
+    while True:
+        count = int(np.ceil((end - start) / interval)) + 1
+        knots = start + interval * np.arange(count)
+        mids = knots[:-1] + 0.5 * interval
+        dt = min(DERIVATIVE_STEP_SEC, 0.25 * interval)
+        times = np.concatenate((knots, knots - dt, knots + dt, mids))
+        angles = tracker.calculate_positions([satellite_id], times)
+        az = angles['azimuth'][0]
+        el = angles['elevation'][0]
+        az_knots = _unwrap_degrees(az[:count])
+        az_rate = ((az[2 * count:3 * count] - az[count:2 * count] + 180.0) % 360.0 - 180.0) / (2 * dt)
+        el_rate = (el[2 * count:3 * count] - el[count:2 * count]) / (2 * dt)
+        az_q, el_q, az_rate_q, el_rate_q = _quantize(az_knots, el[:count], az_rate, el_rate)
+
+        trial = TrajectorySegment(0, start, interval, az_q, el_q, az_rate_q, el_rate_q)
+        fit_az, fit_el = evaluate(trial, mids)
+        error = max(np.max(_angle_error(fit_az, az[3 * count:])), np.max(np.abs(fit_el - el[3 * count:])))
+        if error <= tolerance or interval / 2 < MIN_KNOT_INTERVAL_SEC:
+            break
+        interval /= 2
+
+    segments = []
+    step = max_knots - 1
+    for i, first in enumerate(range(0, count - 1, step)):
+        last = min(first + max_knots, count)
+        segments.append(TrajectorySegment(first_segment_id + i, float(knots[first]), interval,
+                                          az_q[first:last], el_q[first:last],
+                                          az_rate_q[first:last], el_rate_q[first:last]))
+    return segments
+
+
+class ClockSync:
+    """
+    Estimates the controller clock from the timestamps in its position reports.
+
+    Reports arrive after a variable delay, so the report with the smallest
+    delay (the largest controller-minus-host offset) in a recent window is
+    the best estimate.
+    """
+
+    def __init__(self, window: int = CLOCK_SYNC_WINDOW):
+        """
+        Initialize the estimator.
+
+        Args:
+            window: Number of recent reports considered
+        """
+        self._offsets = deque(maxlen=window)
+
+    def observe(self, host_time: float, controller_ms: int) -> None:
+        """
+        Record a position report.
+
+        Args:
+            host_time: Unix seconds when the report was received
+            controller_ms: Timestamp in the report (controller milliseconds)
+        """
+        self._offsets.append(controller_ms - host_time * 1000.0)
+
+    @property
+    def synchronized(self) -> bool:
+        """True once at least one report has been seen."""
+        return bool(self._offsets)
+
+    def to_controller_ms(self, unix_seconds: float) -> int:
+        """
+        Convert a host time to the controller clock.
+
+        Raises:
+            ValueError: If no report has been observed yet
+        """
+        if not self._offsets:
+            raise ValueError("Controller clock not synchronized")
+        return int(round(unix_seconds * 1000.0 + max(self._offsets))) & 0xFFFFFFFF
+
+
+def encode_segment(encoder: FrameEncoder, segment: TrajectorySegment, start_ms: int) -> Iterator[memoryview]:
+    """
+    Encode a segment as a header frame followed by one frame per knot.
+
+    Each yielded view reuses the encoder buffer and must be written before
+    the next one is requested.
+
+    Args:
+        encoder: Frame encoder
+        segment: Segment to send
+        start_ms: Controller clock time of the first knot
+    """
+    yield encoder.trajectory_begin(segment.segment_id, start_ms, int(round(segment.interval * 1000.0)),
+                                   len(segment.azimuth))
+    for az, el, az_rate, el_rate in zip(segment.azimuth, segment.elevation,
+                                        segment.azimuth_rate, segment.elevation_rate):
+        yield encoder.trajectory_knot(float(az), float(el), int(round(az_rate * RATE_SCALE)),
+                                      int(round(el_rate * RATE_SCALE)))
+
+
+class TrajectoryInterpolator:
+    """
+    Python model of the firmware trajectory interpolator.
+
+    Like the firmware's segment buffers, it holds the active segment and a
+    queue of uploaded ones; each queued segment takes over once its start
+    time is reached. Uploads beyond MAX_SEGMENTS buffers are rejected.
+    """
+
+    def __init__(self):
+        """Initialize with no trajectory."""
+        self.active: Optional[TrajectorySegment] = None
+        self.pending = deque()
+        self._loading = None
+        self._knots = []
+        self.rejected = 0
+
+    def handle_frame(self, frame_type: int, sequence: int, payload: memoryview) -> None:
+        """
+        Process a frame as antenna_process_frame() would.
+
+        Args:
+            frame_type: FRAME_* type
+            sequence: Frame sequence number
+            payload: Frame payload
+        """
+        if frame_type == FRAME_STOP:
+            self.active = self._loading = None
+            self.pending.clear()
+        elif frame_type == FRAME_TRAJECTORY_BEGIN:
+            self._loading = decode_trajectory_header(payload)
+            self._knots = []
+        elif frame_type == FRAME_TRAJECTORY_KNOT:
+            if self._loading is None:
+                self.rejected += 1
+                return
+            self._knots.append(decode_trajectory_knot(payload))
+            segment_id, start_ms, interval_ms, knot_count = self._loading
+            if len(self._knots) == knot_count:
+                self._loading = None
+                if len(self.pending) + (self.active is not None) >= MAX_SEGMENTS:
+                    self.rejected += 1
+                    return
+                az, el, az_rate, el_rate = (np.array(column, dtype=np.float64) for column in zip(*self._knots))
+                self.pending.append(TrajectorySegment(segment_id, start_ms / 1000.0, interval_ms / 1000.0,
+                                                      az, el, az_rate / RATE_SCALE, el_rate / RATE_SCALE))
+
+    def position(self, controller_ms: float) -> Optional[Tuple[float, float]]:
+        """
+        Interpolated target at a controller time.
+
+        Args:
+            controller_ms: Controller clock in milliseconds
+
+        Returns:
+            (azimuth, elevation) in degrees, or None when no segment covers
+            the time (the firmware then holds its last target)
+        """
+        t = controller_ms / 1000.0
+        while self.pending and t >= self.pending[0].start:
+            self.active = self.pending.popleft()
+        if self.active is not None and t > self.active.end:
+            self.active = None
+        if self.active is None or not self.active.start <= t <= self.active.end:
+            return None
+        az, el = evaluate(self.active, t)
+        return float(az), float(el)
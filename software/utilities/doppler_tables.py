@@ -0,0 +1,224 @@
+"""
+Starlink DIY - Precomputed Doppler Correction Tables
+
+This module precomputes the Doppler offset of each scheduled pass on a dense,
+uniform time grid when the pass is scheduled. During the pass the receiver
+looks up the offset with a constant-time linear interpolation instead of
+propagating the orbit at the Doppler update rate. Tables are stored as
+float32, keyed by NORAD ID, and dropped once their pass has ended.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from propagator import TimeLike, to_unix_seconds
+from satellite_tracker import SatelliteTracker, calculate_doppler_shift
+
+DEFAULT_UPDATE_RATE_HZ = 10.0  # Matches signal.doppler_update_rate
+TABLE_MARGIN_SEC = 5.0         # Extra coverage before AOS and after LOS
+
+
+class DopplerTable:
+    """
+    Doppler offsets for one pass sampled on a uniform time grid.
+    """
+
+    def __init__(self, satellite_id: int, start: float, step: float, offsets: np.ndarray):
+        """
+        Wrap a precomputed table.
+
+        Args:
+            satellite_id: NORAD ID of the satellite the table belongs to
+            start: Time of the first sample (Unix seconds)
+            step: Sample spacing in seconds
+            offsets: Doppler shift in Hz for each sample
+        """
+        self.satellite_id = satellite_id
+        self.start = float(start)
+        self.step = float(step)
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.float32)
+        self.end = self.start + self.step * (len(self.offsets) - 1)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the offsets in bytes."""
+        return self.offsets.nbytes
+
+    def covers(self, timestamp: float) -> bool:
+        """Check whether a time lies inside the table."""
+        return self.start <= timestamp <= self.end
+
+    def shift(self, timestamp: float) -> float:
+        """
+        Interpolate the Doppler shift at a time.
+
+        Times outside the table are clamped to its first or last sample.
+
+        Args:
+            timestamp: Time as Unix seconds
+
+        Returns:
+            Doppler shift in Hz
+        """
+        position = (timestamp - self.start) / self.step
+        last = len(self.offsets) - 1
+        if position <= 0.0:
+            return float(self.offsets[0])
+        if position >= last:
+            return float(self.offsets[last])
+        index = int(position)
+        fraction = position - index
+        low = float(self.offsets[index])
+        return low + fraction * (float(self.offsets[index + 1]) - low)
+
+
+class DopplerCorrector:
+    """
+    Per-pass Doppler tables for the satellites the station will track.
+
+    Call ``schedule_pass`` when a pass is scheduled and ``shift`` at the
+    Doppler update rate while tracking it. Satellites may be given by name
+    or NORAD ID; tables are keyed by NORAD ID either way. Tables whose pass
+    has ended are evicted as ``shift`` moves past them.
+    """
+
+    def __init__(self, tracker: SatelliteTracker, center_frequency: float,
+                 update_rate: float = DEFAULT_UPDATE_RATE_HZ):
+        """
+        Initialize the corrector.
+
+        Args:
+            tracker: Tracker providing range rates for the loaded catalog
+            center_frequency: Carrier frequency in Hz
+            update_rate: Table sample rate in Hz
+
+        Raises:
+            ValueError: If the update rate is not positive
+        """
+        if update_rate <= 0:
+            raise ValueError("update_rate must be positive")
+        self.tracker = tracker
+        self.center_frequency = center_frequency
+        self.step = 1.0 / update_rate
+        self.tables: Dict[int, List[DopplerTable]] = {}
+        self._next_end = np.inf  # Earliest table end; shift() evicts once past it
+
+    def _key(self, satellite_id) -> int:
+        """
+        NORAD ID for a satellite name or NORAD ID.
+
+        Raises:
+            ValueError: If a name is not loaded
+        """
+        if isinstance(satellite_id, (int, np.integer)):
+            return int(satellite_id)
+        store = self.tracker.satellites
+        return int(store.norad_id[store.row_of(satellite_id)])
+
+    def schedule_pass(self, satellite_id, aos: TimeLike, los: TimeLike) -> DopplerTable:
+        """
+        Precompute the Doppler table for a pass.
+
+        Args:
+            satellite_id: Satellite name or NORAD ID
+            aos: Acquisition of signal (datetime or Unix seconds)
+            los: Loss of signal (datetime or Unix seconds)
+
+        Returns:
+            The new DopplerTable
+
+        Raises:
+            ValueError: If the satellite is not loaded or LOS precedes AOS
+        """
+        norad_id = self._key(satellite_id)
+        start = float(to_unix_seconds(aos)[0]) - TABLE_MARGIN_SEC
+        end = float(to_unix_seconds(los)[0]) + TABLE_MARGIN_SEC
+        if end <= start:
+            raise ValueError("LOS must be after AOS")
+        count = int(np.ceil((end - start) / self.step)) + 1
+        times = start + self.step * np.arange(count)
+        range_rate = self.tracker.calculate_positions([norad_id], times)['range_rate'][0]
+        table = DopplerTable(norad_id, start, self.step,
+                             calculate_doppler_shift(self.center_frequency, range_rate))
+
+        tables = self.tables.setdefault(norad_id, [])
+        tables.append(table)
+        tables.sort(key=lambda t: t.start)
+        self._next_end = min(self._next_end, table.end)
+        return table
+
+    def schedule_passes(self, passes: np.ndarray) -> int:
+        """
+        Precompute tables for passes returned by SatelliteTracker.predict_passes.
+
+        Args:
+            passes: Structured array with norad_id, aos and los fields
+
+        Returns:
+            Number of tables built
+        """
+        for record in passes:
+            self.schedule_pass(int(record['norad_id']), float(record['aos']), float(record['los']))
+        return len(passes)
+
+    def table_for(self, satellite_id, timestamp: float) -> Optional[DopplerTable]:
+        """Return the table covering a time, or None."""
+        try:
+            norad_id = self._key(satellite_id)
+        except ValueError:
+            return None
+        for table in self.tables.get(norad_id, ()):
+            if table.covers(timestamp):
+                return table
+        return None
+
+    def shift(self, satellite_id, timestamp: float) -> float:
+        """
+        Look up the Doppler shift for a satellite at a time.
+
+        Tables of passes that ended before the time are evicted first.
+
+        Args:
+            satellite_id: Satellite name or NORAD ID
+            timestamp: Time as Unix seconds
+
+        Returns:
+            Doppler shift in Hz
+
+        Raises:
+            ValueError: If no scheduled pass covers the time
+        """
+        if timestamp > self._next_end:
+            self.evict(timestamp)
+        table = self.table_for(satellite_id, timestamp)
+        if table is None:
+            raise ValueError(f"No Doppler table for {satellite_id} at {timestamp}")
+        return table.shift(timestamp)
+
+    def evict(self, now: float) -> int:
+        """
+        Drop tables whose pass has ended.
+
+        Args:
+            now: Current time as Unix seconds
+
+        Returns:
+            Number of tables removed
+        """
+        removed = 0
+        self._next_end = np.inf
+        for norad_id in list(self.tables):
+            tables = self.tables[norad_id]
+            kept = [table for table in tables if table.end >= now]
+            removed += len(tables) - len(kept)
+            if kept:
+                self.tables[norad_id] = kept
+                self._next_end = min(self._next_end, min(table.end for table in kept))
+            else:
+                del self.tables[norad_id]
+        return removed
+
+    def nbytes(self) -> int:
+        """Total memory used by all tables in bytes."""
+        return sum(table.nbytes for tables in self.tables.values() for table in tables)
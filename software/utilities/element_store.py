@@ -0,0 +1,425 @@
+"""
+Starlink DIY - Columnar Orbital Element Store
+
+This module keeps a satellite catalog as contiguous NumPy columns (one
+float64 array per orbital element) instead of one dictionary per
+satellite, and provides a streaming loader for CelesTrak TLE and OMM CSV
+files that writes parsed values straight into those columns.
+"""
+
+import csv
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from propagator import parse_tle_exponent
+
+# Element columns in TLE units (degrees, revolutions per day, Unix seconds)
+ELEMENT_COLUMNS = (
+    'epoch', 'bstar', 'inclination', 'raan', 'eccentricity',
+    'arg_perigee', 'mean_anomaly', 'mean_motion',
+)
+
+# CelesTrak OMM CSV header names for each element column
+OMM_FIELDS = {
+    'epoch': 'EPOCH',
+    'bstar': 'BSTAR',
+    'inclination': 'INCLINATION',
+    'raan': 'RA_OF_ASC_NODE',
+    'eccentricity': 'ECCENTRICITY',
+    'arg_perigee': 'ARG_OF_PERICENTER',
+    'mean_anomaly': 'MEAN_ANOMALY',
+    'mean_motion': 'MEAN_MOTION',
+}
+
+INITIAL_CAPACITY = 1024
+
+ElementRecord = Tuple[str, int, Tuple[float, ...]]
+
+
+class CatalogDiff(NamedTuple):
+    """Row-level difference between a loaded catalog and a fresh one."""
+
+    changed_rows: np.ndarray        # rows in the loaded store with a newer epoch available
+    changed_source_rows: np.ndarray  # matching rows in the fresh catalog
+    new_source_rows: np.ndarray     # rows in the fresh catalog not loaded yet
+    removed_rows: np.ndarray        # rows in the loaded store absent from the fresh catalog
+
+
+class ElementStore:
+    """
+    Array-backed store of mean orbital elements.
+
+    Rows are addressed by position; ``row_of`` resolves a satellite name
+    or NORAD catalog number to its row. Rows are identified by NORAD ID;
+    names need not be unique (debris pieces share one), and a name shared
+    by several rows resolves to the most recently added of them. Column accessors return views of
+    the filled part of each array, so they can be fed directly into the
+    vectorized propagator without copying.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        """
+        Initialize an empty element store.
+
+        Args:
+            capacity: Number of rows to preallocate
+        """
+        self._size = 0
+        self._norad = np.zeros(capacity, dtype=np.int32)
+        self._columns = {name: np.zeros(capacity, dtype=np.float64) for name in ELEMENT_COLUMNS}
+        self.names: List[str] = []
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_norad: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, satellite_id) -> bool:
+        return self.find(satellite_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    @property
+    def norad_id(self) -> np.ndarray:
+        """NORAD catalog numbers, one per row."""
+        return self._norad[:self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a view of one element column.
+
+        Args:
+            name: One of ELEMENT_COLUMNS
+
+        Returns:
+            Float64 view with one value per row
+        """
+        return self._columns[name][:self._size]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Get views of all element columns keyed by name."""
+        return {name: self.column(name) for name in ELEMENT_COLUMNS}
+
+    def nbytes(self) -> int:
+        """Total bytes held by the numeric column buffers."""
+        return self._norad.nbytes + sum(col.nbytes for col in self._columns.values())
+
+    def find(self, satellite_id) -> Optional[int]:
+        """
+        Resolve a satellite name or NORAD ID to a row.
+
+        Args:
+            satellite_id: Satellite name, NORAD ID, or NORAD ID string
+
+        Returns:
+            Row index, or None if the satellite is not loaded
+        """
+        rows = self._by_name.get(satellite_id) if isinstance(satellite_id, str) else None
+        row = rows[-1] if rows else None
+        if row is None:
+            try:
+                row = self._by_norad.get(int(satellite_id))
+            except (TypeError, ValueError):
+                return None
+        return row
+
+    def row_of(self, satellite_id) -> int:
+        """
+        Resolve a satellite name or NORAD ID to a row.
+
+        Raises:
+            ValueError: If the satellite is not loaded
+        """
+        row = self.find(satellite_id)
+        if row is None:
+            raise ValueError(f"Satellite {satellite_id} not loaded")
+        return row
+
+    def rows_of(self, satellite_ids: Sequence) -> np.ndarray:
+        """Resolve several satellite identifiers to an array of rows."""
+        return np.fromiter((self.row_of(sat_id) for sat_id in satellite_ids),
+                           dtype=np.intp, count=len(satellite_ids))
+
+    def _index_name(self, name: str, row: int) -> None:
+        """Add a row to the name index."""
+        self._by_name.setdefault(name, []).append(row)
+
+    def _unindex_name(self, name: str, row: int) -> None:
+        """Remove a row from the name index."""
+        rows = self._by_name[name]
+        rows.remove(row)
+        if not rows:
+            del self._by_name[name]
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        capacity = max(2 * len(self._norad), INITIAL_CAPACITY)
+        self._norad = np.resize(self._norad, capacity)
+        for name, col in self._columns.items():
+            self._columns[name] = np.resize(col, capacity)
+
+    def put(self, name: str, norad_id: int, values: Sequence[float]) -> int:
+        """
+        Insert a satellite, replacing any existing row with the same NORAD ID.
+
+        Args:
+            name: Satellite name
+            norad_id: NORAD catalog number
+            values: Element values in ELEMENT_COLUMNS order
+
+        Returns:
+            Row index written
+        """
+        row = self._by_norad.get(norad_id)
+        if row is None:
+            if self._size == len(self._norad):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self.names.append(name)
+        else:
+            self._unindex_name(self.names[row], row)
+            self.names[row] = name
+        self._norad[row] = norad_id
+        for col, value in zip(self._columns.values(), values):
+            col[row] = value
+        self._index_name(name, row)
+        self._by_norad[norad_id] = row
+        return row
+
+    def assign_rows(self, rows: np.ndarray, source: 'ElementStore', source_rows: np.ndarray) -> None:
+        """
+        Overwrite existing rows with elements from another store.
+
+        Columns are copied with one vectorized assignment each; the name
+        indexes are only touched for satellites that were renamed.
+
+        Args:
+            rows: Rows in this store to overwrite
+            source: Store to copy elements from
+            source_rows: Matching rows in the source store
+        """
+        for name, col in self._columns.items():
+            col[rows] = source.column(name)[source_rows]
+        for row, source_row in zip(rows.tolist(), source_rows.tolist()):
+            new_name = source.names[source_row]
+            old_name = self.names[row]
+            if new_name != old_name:
+                self._unindex_name(old_name, row)
+                self.names[row] = new_name
+                self._index_name(new_name, row)
+
+    def append_rows(self, source: 'ElementStore', source_rows: np.ndarray) -> None:
+        """
+        Append rows copied from another store.
+
+        Args:
+            source: Store to copy elements from
+            source_rows: Rows in the source store to append
+        """
+        count = len(source_rows)
+        while self._size + count > len(self._norad):
+            self._grow()
+        start, end = self._size, self._size + count
+        self._norad[start:end] = source.norad_id[source_rows]
+        for name, col in self._columns.items():
+            col[start:end] = source.column(name)[source_rows]
+        for row, source_row in enumerate(source_rows.tolist(), start):
+            name = source.names[source_row]
+            self.names.append(name)
+            self._index_name(name, row)
+            self._by_norad[int(self._norad[row])] = row
+        self._size = end
+
+    def remove_rows(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Delete rows, compacting the columns in place.
+
+        Args:
+            rows: Rows to delete
+
+        Returns:
+            Boolean mask over the old rows that were kept, so callers can
+            compact arrays aligned with this store the same way
+        """
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        kept = int(keep.sum())
+        self._norad[:kept] = self.norad_id[keep]
+        for col in self._columns.values():
+            col[:kept] = col[:self._size][keep]
+        self.names = [name for name, k in zip(self.names, keep.tolist()) if k]
+        self._size = kept
+        self._by_name = {}
+        for row, name in enumerate(self.names):
+            self._index_name(name, row)
+        self._by_norad = {norad: row for row, norad in enumerate(self.norad_id.tolist())}
+        return keep
+
+    def diff(self, source: 'ElementStore') -> CatalogDiff:
+        """
+        Compare this store against a freshly loaded catalog.
+
+        Satellites are matched by NORAD ID. A matched satellite counts as
+        changed only when the fresh element set has a newer epoch; loaded
+        satellites missing from the fresh catalog are reported as removed
+        (decayed or retired).
+
+        Args:
+            source: Freshly loaded catalog
+
+        Returns:
+            CatalogDiff describing the rows to update, add and remove
+        """
+        old_ids = self.norad_id
+        new_ids = source.norad_id
+        order = np.argsort(old_ids, kind='stable')
+        sorted_ids = old_ids[order]
+        pos = np.minimum(np.searchsorted(sorted_ids, new_ids), max(len(sorted_ids) - 1, 0))
+        if len(sorted_ids):
+            matched = sorted_ids[pos] == new_ids
+            old_rows = order[pos]
+        else:
+            matched = np.zeros(len(new_ids), dtype=bool)
+            old_rows = np.zeros(len(new_ids), dtype=np.intp)
+        newer = np.zeros(len(new_ids), dtype=bool)
+        newer[matched] = source.column('epoch')[matched] > self.column('epoch')[old_rows[matched]]
+        return CatalogDiff(
+            changed_rows=old_rows[newer],
+            changed_source_rows=np.flatnonzero(newer),
+            new_source_rows=np.flatnonzero(~matched),
+            removed_rows=np.flatnonzero(~np.isin(old_ids, new_ids)),
+        )
+
+    def extend(self, records: Iterable[ElementRecord]) -> int:
+        """
+        Insert records produced by one of the streaming parsers.
+
+        Args:
+            records: Iterable of (name, norad_id, values) tuples
+
+        Returns:
+            Number of records inserted
+        """
+        count = 0
+        for name, norad_id, values in records:
+            self.put(name, norad_id, values)
+            count += 1
+        return count
+
+
+class _EpochParser:
+    """TLE epoch parser that caches the start of each epoch year."""
+
+    def __init__(self):
+        self._year_start: Dict[str, float] = {}
+
+    def __call__(self, field: str) -> float:
+        yy = field[:2]
+        start = self._year_start.get(yy)
+        if start is None:
+            year = int(yy)
+            year += 2000 if year < 57 else 1900
+            start = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()
+            self._year_start[yy] = start
+        return start + (float(field[2:]) - 1.0) * 86400.0
+
+
+def iter_tle(stream: TextIO) -> Iterator[ElementRecord]:
+    """
+    Stream element records from a TLE file (2-line or 3-line format).
+
+    Args:
+        stream: Open text stream
+
+    Yields:
+        (name, norad_id, values) tuples with values in ELEMENT_COLUMNS order
+
+    Raises:
+        ValueError: If a line 2 does not follow its line 1
+    """
+    parse_epoch = _EpochParser()
+    name = None
+    line1 = None
+    for raw in stream:
+        line = raw.rstrip()
+        if not line:
+            continue
+        if line.startswith('1 ') and len(line) >= 64:
+            line1 = line
+        elif line.startswith('2 ') and len(line) >= 63:
+            if line1 is None or line1[2:7] != line[2:7]:
+                raise ValueError(f"TLE line 2 without matching line 1: {line[:7]}")
+            norad_id = int(line1[2:7])
+            values = (
+                parse_epoch(line1[18:32]),
+                parse_tle_exponent(line1[53:61]),
+                float(line[8:16]),
+                float(line[17:25]),
+                float('0.' + line[26:33].strip()),
+                float(line[34:42]),
+                float(line[43:51]),
+                float(line[52:63]),
+            )
+            yield (name or str(norad_id)), norad_id, values
+            name = None
+            line1 = None
+        else:
+            name = line[2:].strip() if line.startswith('0 ') else line.strip()
+
+
+def iter_omm_csv(stream: TextIO) -> Iterator[ElementRecord]:
+    """
+    Stream element records from a CelesTrak OMM CSV file.
+
+    Args:
+        stream: Open text stream positioned at the header row
+
+    Yields:
+        (name, norad_id, values) tuples with values in ELEMENT_COLUMNS order
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    reader = csv.reader(stream)
+    header = next(reader)
+    try:
+        name_col = header.index('OBJECT_NAME')
+        norad_col = header.index('NORAD_CAT_ID')
+        value_cols = [header.index(OMM_FIELDS[name]) for name in ELEMENT_COLUMNS]
+    except ValueError as e:
+        raise ValueError(f"OMM file is missing a required column: {e}") from None
+    epoch_col = value_cols[0]
+    for row in reader:
+        if not row:
+            continue
+        epoch = datetime.fromisoformat(row[epoch_col]).replace(tzinfo=timezone.utc).timestamp()
+        values = (epoch,) + tuple(float(row[col]) for col in value_cols[1:])
+        yield row[name_col].strip(), int(row[norad_col]), values
+
+
+def iter_elements(stream: TextIO) -> Iterator[ElementRecord]:
+    """
+    Stream element records from a TLE or OMM CSV file, detecting the format.
+
+    Args:
+        stream: Open text stream (or any iterable of lines)
+
+    Returns:
+        Iterator of (name, norad_id, values) tuples with values in
+        ELEMENT_COLUMNS order
+    """
+    stream = iter(stream)
+    first = next(stream, '')
+    if first.startswith('OBJECT_NAME') or first.startswith('"OBJECT_NAME'):
+        return iter_omm_csv(_chain_first(first, stream))
+    return iter_tle(_chain_first(first, stream))
+
+
+def _chain_first(first: str, stream: Iterator[str]) -> Iterator[str]:
+    """Re-attach an already consumed first line to a stream."""
+    yield first
+    yield from stream
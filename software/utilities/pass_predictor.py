@@ -0,0 +1,218 @@
+"""
+Starlink DIY - Pass Prediction
+
+This module finds satellite passes over an observer for a whole catalog at
+once. A coarse vectorized sweep locates every closest approach (the point
+where range rate changes sign from negative to positive), a geometric bound
+discards approaches that cannot reach the requested elevation, and the
+remaining candidates are refined with vectorized bisection: closest
+approach on range rate, then AOS and LOS on elevation.
+
+Because passes are anchored on closest approach rather than on coarse
+elevation samples, the coarse step can be several minutes without missing
+short, low passes.
+"""
+
+from typing import Callable, Dict
+
+import math
+
+import numpy as np
+
+from propagator import EARTH_MU, EARTH_RADIUS_KM, EARTH_ROTATION_RAD_PER_SEC, SGP4Propagator, WGS84_A_KM
+
+# Structured array layout returned by find_passes (times are Unix seconds)
+PASS_DTYPE = np.dtype([
+    ('norad_id', np.int32),
+    ('aos', np.float64),
+    ('tca', np.float64),
+    ('los', np.float64),
+    ('max_elevation', np.float64),
+    ('aos_azimuth', np.float64),
+    ('tca_azimuth', np.float64),
+    ('los_azimuth', np.float64),
+])
+
+COARSE_STEP_SEC = 600.0       # Coarse sweep step; clamped to a quarter orbit
+TIME_TOLERANCE_SEC = 0.1      # Bisection stops once brackets are this narrow
+MAX_SWEEP_POINTS = 250000     # Satellite x time samples evaluated per chunk
+PASS_DURATION_MARGIN = 1.2    # Safety factor on the analytic half-pass bound
+
+LookFunction = Callable[[SGP4Propagator, np.ndarray], Dict[str, np.ndarray]]
+
+
+def _orbit_radii(propagator: SGP4Propagator):
+    """Perigee and apogee radii in km."""
+    a = propagator.ao * EARTH_RADIUS_KM
+    return a * (1.0 - propagator.ecco), a * (1.0 + propagator.ecco)
+
+
+def visibility_half_angle(propagator: SGP4Propagator, min_elevation: float,
+                          observer_radius: float = WGS84_A_KM) -> np.ndarray:
+    """
+    Earth central angle within which each satellite can be above min_elevation.
+
+    Args:
+        propagator: Propagator for the satellites of interest
+        min_elevation: Minimum elevation in degrees
+        observer_radius: Observer distance from Earth's center in km
+
+    Returns:
+        Half-angle of the visibility cone in radians, evaluated at apogee
+    """
+    _, apogee = _orbit_radii(propagator)
+    el = math.radians(min_elevation)
+    return np.arccos(np.clip(observer_radius / apogee * math.cos(el), -1.0, 1.0)) - el
+
+
+def half_pass_bound(propagator: SGP4Propagator, min_elevation: float) -> np.ndarray:
+    """
+    Upper bound on the time from AOS (or LOS) to closest approach.
+
+    Args:
+        propagator: Propagator for the satellites of interest
+        min_elevation: Minimum elevation in degrees
+
+    Returns:
+        Bound in seconds for each satellite
+    """
+    relative_rate = propagator.no_unkozai / 60.0 - EARTH_ROTATION_RAD_PER_SEC
+    return PASS_DURATION_MARGIN * visibility_half_angle(propagator, min_elevation) / relative_rate
+
+
+def max_visible_range(propagator: SGP4Propagator, min_elevation: float) -> np.ndarray:
+    """
+    Largest slant range at which each satellite can be above min_elevation.
+
+    Args:
+        propagator: Propagator for the satellites of interest
+        min_elevation: Minimum elevation in degrees
+
+    Returns:
+        Slant range bound in km
+    """
+    _, apogee = _orbit_radii(propagator)
+    el = math.radians(min_elevation)
+    r_cos = WGS84_A_KM * math.cos(el)
+    return np.sqrt(apogee * apogee - r_cos * r_cos) - WGS84_A_KM * math.sin(el)
+
+
+def max_relative_speed(propagator: SGP4Propagator) -> np.ndarray:
+    """
+    Upper bound on each satellite's speed relative to a ground observer (km/s).
+    """
+    perigee, apogee = _orbit_radii(propagator)
+    a = propagator.ao * EARTH_RADIUS_KM
+    return np.sqrt(EARTH_MU * (2.0 / perigee - 1.0 / a)) + EARTH_ROTATION_RAD_PER_SEC * apogee
+
+
+def bisect(func: Callable[[np.ndarray], np.ndarray], lo: np.ndarray, hi: np.ndarray,
+           tolerance: float = TIME_TOLERANCE_SEC) -> np.ndarray:
+    """
+    Vectorized bisection for many independent sign changes at once.
+
+    Each bracket [lo[i], hi[i]] must contain a sign change of func. Every
+    iteration evaluates func once for all brackets.
+
+    Args:
+        func: Maps an array of times to function values (one per bracket)
+        lo: Lower bracket ends
+        hi: Upper bracket ends
+        tolerance: Final bracket width
+
+    Returns:
+        Midpoints of the final brackets
+    """
+    lo = np.array(lo, dtype=np.float64)
+    hi = np.array(hi, dtype=np.float64)
+    if not len(lo):
+        return lo
+    lo_positive = func(lo) > 0.0
+    iterations = int(math.ceil(math.log2(max(np.max(hi - lo), tolerance) / tolerance)))
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        same = (func(mid) > 0.0) == lo_positive
+        lo = np.where(same, mid, lo)
+        hi = np.where(same, hi, mid)
+    return 0.5 * (lo + hi)
+
+
+def find_passes(look: LookFunction, propagator: SGP4Propagator, norad_ids: np.ndarray,
+                start: float, end: float, min_elevation: float,
+                step: float = COARSE_STEP_SEC, tolerance: float = TIME_TOLERANCE_SEC) -> np.ndarray:
+    """
+    Find all passes above min_elevation that overlap [start, end].
+
+    Args:
+        look: Function returning look angles for a propagator at given
+            times (shared 1-D grid, or one time per satellite as (n, 1))
+        propagator: Propagator for the satellites to search
+        norad_ids: NORAD IDs matching the propagator rows
+        start: Window start (Unix seconds)
+        end: Window end (Unix seconds)
+        min_elevation: Minimum elevation in degrees
+        step: Coarse sweep step in seconds
+        tolerance: Time accuracy of AOS, TCA and LOS in seconds
+
+    Returns:
+        Structured array with PASS_DTYPE, sorted by AOS
+    """
+    n_sat = len(propagator)
+    if n_sat == 0 or end <= start:
+        return np.zeros(0, dtype=PASS_DTYPE)
+
+    half = half_pass_bound(propagator, min_elevation)
+    vis_range = max_visible_range(propagator, min_elevation)
+    speed = max_relative_speed(propagator)
+    period = 2.0 * math.pi * 60.0 / propagator.no_unkozai
+    step = min(step, float(np.nanmin(period)) / 4.0)
+    pad = float(np.nanmax(np.where(np.isfinite(half), half, 0.0))) + step
+    grid = np.arange(start - pad, end + pad + step, step)
+
+    # Coarse sweep: closest approaches that could reach min_elevation
+    chunk = max(1, MAX_SWEEP_POINTS // len(grid))
+    cand_rows, cand_idx = [], []
+    for first in range(0, n_sat, chunk):
+        rows = np.arange(first, min(first + chunk, n_sat))
+        angles = look(propagator.take(rows), grid)
+        rr = angles['range_rate']
+        rng = angles['range']
+        approach = (rr[:, :-1] < 0.0) & (rr[:, 1:] >= 0.0)
+        reach = 0.5 * (rng[:, :-1] + rng[:, 1:] - (speed[rows] * step)[:, np.newaxis])
+        r_i, t_i = np.nonzero(approach & (reach <= vis_range[rows][:, np.newaxis]))
+        cand_rows.append(rows[r_i])
+        cand_idx.append(t_i)
+    rows = np.concatenate(cand_rows)
+    idx = np.concatenate(cand_idx)
+    if not len(rows):
+        return np.zeros(0, dtype=PASS_DTYPE)
+
+    def at(selected_rows, key):
+        candidates = propagator.take(selected_rows)
+        return lambda times: look(candidates, times[:, np.newaxis])[key][:, 0]
+
+    # Refine closest approach on range rate and keep those above min_elevation
+    tca = bisect(at(rows, 'range_rate'), grid[idx], grid[idx + 1], tolerance)
+    max_el = at(rows, 'elevation')(tca)
+    keep = max_el >= min_elevation
+    rows, tca, max_el = rows[keep], tca[keep], max_el[keep]
+
+    # Refine AOS and LOS on elevation inside the analytic half-pass bound
+    elevation = at(rows, 'elevation')
+    above = lambda times: elevation(times) - min_elevation
+    aos = bisect(above, tca - half[rows], tca, tolerance)
+    los = bisect(above, tca, tca + half[rows], tolerance)
+    overlap = (los > start) & (aos < end)
+    rows, aos, tca, los, max_el = rows[overlap], aos[overlap], tca[overlap], los[overlap], max_el[overlap]
+
+    azimuth = look(propagator.take(rows), np.stack((aos, tca, los), axis=1))['azimuth']
+    passes = np.zeros(len(rows), dtype=PASS_DTYPE)
+    passes['norad_id'] = norad_ids[rows]
+    passes['aos'] = aos
+    passes['tca'] = tca
+    passes['los'] = los
+    passes['max_elevation'] = max_el
+    passes['aos_azimuth'] = azimuth[:, 0]
+    passes['tca_azimuth'] = azimuth[:, 1]
+    passes['los_azimuth'] = azimuth[:, 2]
+    return passes[np.argsort(passes['aos'], kind='stable')]
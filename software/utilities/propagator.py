@@ -0,0 +1,639 @@
+"""
+Starlink DIY - Vectorized SGP4 Propagator
+
+This module implements the near-Earth SGP4 orbit model (Vallado et al.,
+"Revisiting Spacetrack Report #3", 2006) using NumPy so that a whole
+catalog of satellites can be propagated over many timestamps in a single
+call. It also provides the frame conversions needed to turn TEME state
+vectors into observer-relative azimuth, elevation, range and range rate.
+
+Deep-space objects (orbital period >= 225 minutes) are not supported; their
+results are reported as NaN. Every Starlink shell is well inside the
+near-Earth regime.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Tuple, Union
+import math
+import threading
+
+import numpy as np
+
+# WGS-72 gravity model constants used by SGP4
+EARTH_RADIUS_KM = 6378.135
+EARTH_MU = 398600.8  # km^3/s^2
+XKE = 60.0 / math.sqrt(EARTH_RADIUS_KM ** 3 / EARTH_MU)
+J2 = 0.001082616
+J3 = -0.00000253881
+J4 = -0.00000165597
+J3OJ2 = J3 / J2
+X2O3 = 2.0 / 3.0
+VKM_PER_SEC = EARTH_RADIUS_KM * XKE / 60.0
+
+# WGS-84 ellipsoid used for the observer location
+WGS84_A_KM = 6378.137
+WGS84_F = 1.0 / 298.257223563
+WGS84_E2 = WGS84_F * (2.0 - WGS84_F)
+
+EARTH_ROTATION_RAD_PER_SEC = 7.292115146706979e-5
+TWO_PI = 2.0 * math.pi
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
+MINUTES_PER_DAY = 1440.0
+UNIX_EPOCH_JD = 2440587.5
+DEEP_SPACE_PERIOD_MIN = 225.0
+NEAR_CIRCULAR_EL2 = 1.0e-4  # squared eccentricity below which Kepler's equation is solved by series
+
+# Observer frame rotation cache (see ObserverFrame.rotations)
+ROTATION_CACHE_SIZE = 32     # Time grids kept per observer
+MAX_CACHED_TIMES = 4096      # Larger time arrays are converted without caching
+
+TimeLike = Union[datetime, float, np.ndarray]
+
+
+def to_unix_seconds(timestamps: TimeLike) -> np.ndarray:
+    """
+    Convert timestamps to a float64 array of Unix seconds (UTC).
+
+    Args:
+        timestamps: A datetime, a sequence of datetimes, or Unix seconds.
+            Naive datetimes are interpreted as UTC.
+
+    Returns:
+        1-D float64 array of Unix seconds
+    """
+    if isinstance(timestamps, datetime):
+        timestamps = [timestamps]
+    if isinstance(timestamps, (list, tuple)) and timestamps and isinstance(timestamps[0], datetime):
+        return np.array([
+            (t if t.tzinfo else t.replace(tzinfo=timezone.utc)).timestamp()
+            for t in timestamps
+        ], dtype=np.float64)
+    return np.atleast_1d(np.asarray(timestamps, dtype=np.float64))
+
+
+def gmst(unix_seconds: np.ndarray) -> np.ndarray:
+    """
+    Greenwich mean sidereal time (IAU-82), as used by SGP4.
+
+    Args:
+        unix_seconds: Times as Unix seconds (UT1 approximated by UTC)
+
+    Returns:
+        GMST angle in radians, in the range [0, 2*pi)
+    """
+    tut1 = (np.asarray(unix_seconds, dtype=np.float64) / 86400.0 + UNIX_EPOCH_JD - 2451545.0) / 36525.0
+    theta = (-6.2e-6 * tut1 ** 3 + 0.093104 * tut1 ** 2
+             + (876600.0 * 3600.0 + 8640184.812866) * tut1 + 67310.54841)
+    return np.mod(theta * DEG2RAD / 240.0, TWO_PI)
+
+
+class SGP4Propagator:
+    """
+    Batched near-Earth SGP4 propagator.
+
+    The constructor runs the SGP4 initialization once for every satellite
+    and keeps the resulting coefficients as arrays. ``propagate`` then
+    evaluates the model for all satellites and all requested times with
+    broadcasting, so the cost is a fixed number of NumPy operations
+    regardless of catalog size.
+    """
+
+    def __init__(self, epoch: np.ndarray, bstar: np.ndarray, inclination: np.ndarray,
+                 raan: np.ndarray, eccentricity: np.ndarray, arg_perigee: np.ndarray,
+                 mean_anomaly: np.ndarray, mean_motion: np.ndarray):
+        """
+        Initialize SGP4 coefficients for a set of satellites.
+
+        Args:
+            epoch: Element epochs as Unix seconds
+            bstar: B* drag terms (1/earth radii)
+            inclination: Inclinations in degrees
+            raan: Right ascensions of the ascending node in degrees
+            eccentricity: Eccentricities
+            arg_perigee: Arguments of perigee in degrees
+            mean_anomaly: Mean anomalies in degrees
+            mean_motion: Kozai mean motions in revolutions per day
+        """
+        # Copy: callers may pass views of ElementStore columns, which are
+        # compacted in place when satellites are removed
+        f64 = lambda a: np.atleast_1d(np.array(a, dtype=np.float64))
+        self.epoch = f64(epoch)
+        self.bstar = f64(bstar)
+        self.inclo = f64(inclination) * DEG2RAD
+        self.nodeo = f64(raan) * DEG2RAD
+        self.ecco = f64(eccentricity)
+        self.argpo = f64(arg_perigee) * DEG2RAD
+        self.mo = f64(mean_anomaly) * DEG2RAD
+        self.no_kozai = f64(mean_motion) * TWO_PI / MINUTES_PER_DAY
+        self._initialize()
+
+    def __len__(self) -> int:
+        return self.epoch.shape[0]
+
+    def take(self, indices: np.ndarray) -> 'SGP4Propagator':
+        """
+        Return a propagator restricted to a subset of satellites.
+
+        The coefficients are sliced rather than recomputed, so this is
+        cheap enough to call per query.
+
+        Args:
+            indices: Row indices (or boolean mask) of satellites to keep
+
+        Returns:
+            New SGP4Propagator covering only the selected satellites
+        """
+        subset = SGP4Propagator.__new__(SGP4Propagator)
+        for name, value in self.__dict__.items():
+            subset.__dict__[name] = value[indices]
+        return subset
+
+    def update_rows(self, rows: np.ndarray, replacement: 'SGP4Propagator') -> None:
+        """
+        Overwrite the coefficients of some satellites in place.
+
+        Args:
+            rows: Rows to overwrite
+            replacement: Propagator initialized for just those satellites
+        """
+        for name, value in replacement.__dict__.items():
+            self.__dict__[name][rows] = value
+
+    def append(self, other: 'SGP4Propagator') -> None:
+        """
+        Append the satellites of another propagator to this one.
+
+        Args:
+            other: Propagator initialized for the new satellites
+        """
+        for name, value in other.__dict__.items():
+            self.__dict__[name] = np.concatenate((self.__dict__[name], value))
+
+    def _initialize(self) -> None:
+        """Compute the per-satellite SGP4 coefficients (sgp4init)."""
+        ecco, inclo, argpo, bstar = self.ecco, self.inclo, self.argpo, self.bstar
+
+        # Recover the original (Brouwer) mean motion from the Kozai value
+        eccsq = ecco * ecco
+        omeosq = 1.0 - eccsq
+        rteosq = np.sqrt(omeosq)
+        cosio = np.cos(inclo)
+        cosio2 = cosio * cosio
+        ak = (XKE / self.no_kozai) ** X2O3
+        d1 = 0.75 * J2 * (3.0 * cosio2 - 1.0) / (rteosq * omeosq)
+        delta = d1 / (ak * ak)
+        adel = ak * (1.0 - delta * delta - delta * (1.0 / 3.0 + 134.0 * delta * delta / 81.0))
+        delta = d1 / (adel * adel)
+        no = self.no_kozai / (1.0 + delta)
+        ao = (XKE / no) ** X2O3
+        sinio = np.sin(inclo)
+        po = ao * omeosq
+        con42 = 1.0 - 5.0 * cosio2
+        con41 = -con42 - cosio2 - cosio2
+        posq = po * po
+        rp = ao * (1.0 - ecco)
+
+        # Perigee-dependent atmospheric density parameters
+        ss = 78.0 / EARTH_RADIUS_KM + 1.0
+        qzms2t = ((120.0 - 78.0) / EARTH_RADIUS_KM) ** 4
+        perige = (rp - 1.0) * EARTH_RADIUS_KM
+        sfour = np.where(perige < 156.0, np.where(perige < 98.0, 20.0, perige - 78.0), 0.0)
+        qzms24 = np.where(perige < 156.0, ((120.0 - sfour) / EARTH_RADIUS_KM) ** 4, qzms2t)
+        sfour = np.where(perige < 156.0, sfour / EARTH_RADIUS_KM + 1.0, ss)
+
+        pinvsq = 1.0 / posq
+        tsi = 1.0 / (ao - sfour)
+        eta = ao * ecco * tsi
+        etasq = eta * eta
+        eeta = ecco * eta
+        psisq = np.abs(1.0 - etasq)
+        coef = qzms24 * tsi ** 4
+        coef1 = coef / psisq ** 3.5
+        cc2 = coef1 * no * (ao * (1.0 + 1.5 * etasq + eeta * (4.0 + etasq))
+                            + 0.375 * J2 * tsi / psisq * con41 * (8.0 + 3.0 * etasq * (8.0 + etasq)))
+        cc1 = bstar * cc2
+        eccentric = ecco > 1.0e-4
+        safe_ecco = np.where(eccentric, ecco, 1.0)
+        safe_eeta = np.where(eccentric, eeta, 1.0)
+        cc3 = np.where(eccentric, -2.0 * coef * tsi * J3OJ2 * no * sinio / safe_ecco, 0.0)
+        x1mth2 = 1.0 - cosio2
+        cc4 = 2.0 * no * coef1 * ao * omeosq * (
+            eta * (2.0 + 0.5 * etasq) + ecco * (0.5 + 2.0 * etasq)
+            - J2 * tsi / (ao * psisq) * (
+                -3.0 * con41 * (1.0 - 2.0 * eeta + etasq * (1.5 - 0.5 * eeta))
+                + 0.75 * x1mth2 * (2.0 * etasq - eeta * (1.0 + etasq)) * np.cos(2.0 * argpo)))
+        cc5 = 2.0 * coef1 * ao * omeosq * (1.0 + 2.75 * (etasq + eeta) + eeta * etasq)
+
+        # Secular rates from J2 and J4
+        cosio4 = cosio2 * cosio2
+        temp1 = 1.5 * J2 * pinvsq * no
+        temp2 = 0.5 * temp1 * J2 * pinvsq
+        temp3 = -0.46875 * J4 * pinvsq * pinvsq * no
+        self.mdot = (no + 0.5 * temp1 * rteosq * con41
+                     + 0.0625 * temp2 * rteosq * (13.0 - 78.0 * cosio2 + 137.0 * cosio4))
+        self.argpdot = (-0.5 * temp1 * con42 + 0.0625 * temp2 * (7.0 - 114.0 * cosio2 + 395.0 * cosio4)
+                        + temp3 * (3.0 - 36.0 * cosio2 + 49.0 * cosio4))
+        xhdot1 = -temp1 * cosio
+        self.nodedot = xhdot1 + (0.5 * temp2 * (4.0 - 19.0 * cosio2) + 2.0 * temp3 * (3.0 - 7.0 * cosio2)) * cosio
+        self.omgcof = bstar * cc3 * np.cos(argpo)
+        self.xmcof = np.where(eccentric, -X2O3 * coef * bstar / safe_eeta, 0.0)
+        self.nodecf = 3.5 * omeosq * xhdot1 * cc1
+        self.t2cof = 1.5 * cc1
+        denom = np.where(np.abs(cosio + 1.0) > 1.5e-12, 1.0 + cosio, 1.5e-12)
+        self.xlcof = -0.25 * J3OJ2 * sinio * (3.0 + 5.0 * cosio) / denom
+        self.aycof = -0.5 * J3OJ2 * sinio
+        self.delmo = (1.0 + eta * np.cos(self.mo)) ** 3
+        self.sinmao = np.sin(self.mo)
+        self.x7thm1 = 7.0 * cosio2 - 1.0
+
+        # Higher-order drag terms are dropped for very low perigees
+        self.isimp = rp < (220.0 / EARTH_RADIUS_KM + 1.0)
+        full = ~self.isimp
+        cc1sq = cc1 * cc1
+        d2 = 4.0 * ao * tsi * cc1sq
+        temp = d2 * tsi * cc1 / 3.0
+        d3 = (17.0 * ao + sfour) * temp
+        d4 = 0.5 * temp * ao * tsi * (221.0 * ao + 31.0 * sfour) * cc1
+        self.d2 = np.where(full, d2, 0.0)
+        self.d3 = np.where(full, d3, 0.0)
+        self.d4 = np.where(full, d4, 0.0)
+        self.t3cof = np.where(full, d2 + 2.0 * cc1sq, 0.0)
+        self.t4cof = np.where(full, 0.25 * (3.0 * d3 + cc1 * (12.0 * d2 + 10.0 * cc1sq)), 0.0)
+        self.t5cof = np.where(full, 0.2 * (3.0 * d4 + 12.0 * cc1 * d3 + 6.0 * d2 * d2
+                                           + 15.0 * cc1sq * (2.0 * d2 + cc1sq)), 0.0)
+
+        self.omgcof = np.where(full, self.omgcof, 0.0)
+        self.xmcof = np.where(full, self.xmcof, 0.0)
+        self.no_unkozai = no
+        self.ao = (XKE / no) ** X2O3
+        self.sinio = sinio
+        self.cosio = cosio
+        self.eta = eta
+        self.cc1 = cc1
+        self.cc4 = cc4
+        self.cc5 = np.where(full, cc5, 0.0)
+        self.con41 = con41
+        self.x1mth2 = x1mth2
+        self.deep_space = TWO_PI / no >= DEEP_SPACE_PERIOD_MIN
+
+    def propagate(self, unix_seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Propagate all satellites to the given times.
+
+        Args:
+            unix_seconds: Times as Unix seconds, shape (n_times,) or
+                (n_satellites, n_times) for per-satellite time grids
+
+        Returns:
+            Tuple of (position, velocity) TEME arrays in km and km/s with
+            shape (n_satellites, n_times, 3). Satellites that decayed or
+            are out of the model's range are NaN.
+        """
+        times = np.asarray(unix_seconds, dtype=np.float64)
+        if times.ndim <= 1:
+            times = np.atleast_1d(times)[np.newaxis, :]
+        col = lambda a: a[:, np.newaxis]
+        t = (times - col(self.epoch)) / 60.0  # minutes since epoch
+        t2 = t * t
+        t3 = t2 * t
+        t4 = t3 * t
+
+        # Secular gravity and drag; the drag polynomial coefficients are
+        # zeroed at init for satellites that use the simplified model
+        xmdf = col(self.mo) + col(self.mdot) * t
+        delmtemp = 1.0 + col(self.eta) * np.cos(xmdf)
+        temp = col(self.omgcof) * t + col(self.xmcof) * (delmtemp * delmtemp * delmtemp - col(self.delmo))
+        mm = xmdf + temp
+        argpm = col(self.argpo) + col(self.argpdot) * t - temp
+        nodem = col(self.nodeo) + col(self.nodedot) * t + col(self.nodecf) * t2
+        tempa = 1.0 - col(self.cc1) * t - col(self.d2) * t2 - col(self.d3) * t3 - col(self.d4) * t4
+        tempe = (col(self.bstar * self.cc4) * t
+                 + col(self.bstar * self.cc5) * (np.sin(mm) - col(self.sinmao)))
+        templ = col(self.t2cof) * t2 + col(self.t3cof) * t3 + t4 * (col(self.t4cof) + t * col(self.t5cof))
+
+        am = col(self.ao) * tempa * tempa
+        nm = XKE / (am * np.sqrt(am))
+        em = col(self.ecco) - tempe
+        invalid = (em >= 1.0) | (em < -0.001) | col(self.deep_space)
+        em = np.maximum(em, 1.0e-6)
+        mm = mm + col(self.no_unkozai) * templ
+
+        # Long-period periodics
+        axnl = em * np.cos(argpm)
+        temp = 1.0 / (am * (1.0 - em * em))
+        aynl = em * np.sin(argpm) + temp * col(self.aycof)
+        u = mm + argpm + temp * col(self.xlcof) * axnl
+        el2 = axnl * axnl + aynl * aynl
+
+        # Solve Kepler's equation for the eccentric longitude
+        sin_u = np.sin(u)
+        cos_u = np.cos(u)
+        if el2.size and np.max(el2) < NEAR_CIRCULAR_EL2:
+            # Work with the offset d = E - u, which stays tiny for
+            # near-circular orbits, so no further trig calls are needed
+            d = axnl * sin_u - aynl * cos_u
+            for _ in range(2):
+                sineo1, coseo1 = _rotate_small(sin_u, cos_u, d)
+                d = d + (axnl * sineo1 - aynl * coseo1 - d) / (1.0 - coseo1 * axnl - sineo1 * aynl)
+            sineo1, coseo1 = _rotate_small(sin_u, cos_u, d)
+        else:
+            u = np.fmod(u, TWO_PI)
+            eo1 = u.copy()
+            for _ in range(10):
+                sineo1 = np.sin(eo1)
+                coseo1 = np.cos(eo1)
+                step = (u - aynl * coseo1 + axnl * sineo1 - eo1) / (1.0 - coseo1 * axnl - sineo1 * aynl)
+                step = np.clip(step, -0.95, 0.95)
+                eo1 = eo1 + step
+                if np.all(np.abs(step) < 1.0e-12):
+                    break
+            sineo1 = np.sin(eo1)
+            coseo1 = np.cos(eo1)
+
+        # Short-period preliminary quantities
+        ecose = axnl * coseo1 + aynl * sineo1
+        esine = axnl * sineo1 - aynl * coseo1
+        pl = am * (1.0 - el2)
+        invalid |= pl < 0.0
+        pl = np.abs(pl)
+        rl = am * (1.0 - ecose)
+        rdotl = np.sqrt(am) * esine / rl
+        rvdotl = np.sqrt(pl) / rl
+        betal = np.sqrt(1.0 - el2)
+        temp = esine / (1.0 + betal)
+        am_rl = am / rl
+        sinu = am_rl * (sineo1 - aynl - axnl * temp)
+        cosu = am_rl * (coseo1 - axnl + aynl * temp)
+        sin2u = (cosu + cosu) * sinu
+        cos2u = 1.0 - 2.0 * sinu * sinu
+        temp = 1.0 / pl
+        temp1 = 0.5 * J2 * temp
+        temp2 = temp1 * temp
+
+        # Update for short-period periodics. The corrections to the argument
+        # of latitude, node and inclination are tiny, so their sines and
+        # cosines are obtained by rotating the uncorrected ones.
+        con41 = col(self.con41)
+        x1mth2 = col(self.x1mth2)
+        cosip = col(self.cosio)
+        mrt = rl * (1.0 - 1.5 * temp2 * betal * con41) + 0.5 * temp1 * x1mth2 * cos2u
+        norm = 1.0 / np.sqrt(sinu * sinu + cosu * cosu)
+        sinsu, cossu = _rotate_small(sinu * norm, cosu * norm, -0.25 * temp2 * col(self.x7thm1) * sin2u)
+        snod, cnod = _rotate_small(np.sin(nodem), np.cos(nodem), 1.5 * temp2 * cosip * sin2u)
+        sini, cosi = _rotate_small(col(self.sinio), cosip, 1.5 * temp2 * cosip * col(self.sinio) * cos2u)
+        mvt = rdotl - nm * temp1 * x1mth2 * sin2u / XKE
+        rvdot = rvdotl + nm * temp1 * (x1mth2 * cos2u + 1.5 * con41) / XKE
+        invalid |= mrt < 1.0
+
+        # Orientation vectors
+        xmx = -snod * cosi
+        xmy = cnod * cosi
+        ux = xmx * sinsu + cnod * cossu
+        uy = xmy * sinsu + snod * cossu
+        uz = sini * sinsu
+        vx = xmx * cossu - cnod * sinsu
+        vy = xmy * cossu - snod * sinsu
+        vz = sini * cossu
+
+        position = np.empty(t.shape + (3,))
+        velocity = np.empty(t.shape + (3,))
+        radius = mrt * EARTH_RADIUS_KM
+        mvt *= VKM_PER_SEC
+        rvdot *= VKM_PER_SEC
+        position[..., 0] = ux * radius
+        position[..., 1] = uy * radius
+        position[..., 2] = uz * radius
+        velocity[..., 0] = mvt * ux + rvdot * vx
+        velocity[..., 1] = mvt * uy + rvdot * vy
+        velocity[..., 2] = mvt * uz + rvdot * vz
+        position[invalid] = np.nan
+        velocity[invalid] = np.nan
+        return position, velocity
+
+
+def _rotate_small(sin_a: np.ndarray, cos_a: np.ndarray, d: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute sin(a + d) and cos(a + d) from sin(a), cos(a) for small d.
+
+    Uses truncated Taylor series for sin(d) and cos(d), accurate to double
+    precision for |d| below about 0.01 rad.
+    """
+    d2 = d * d
+    sin_d = d * (1.0 + d2 * (_INV_FACT[3] + d2 * _INV_FACT[5]))
+    cos_d = 1.0 + d2 * (_INV_FACT[2] + d2 * (_INV_FACT[4] + d2 * _INV_FACT[6]))
+    return sin_a * cos_d + cos_a * sin_d, cos_a * cos_d - sin_a * sin_d
+
+
+# Signed Taylor coefficients (-1)^(n/2) / n! used by _rotate_small
+_INV_FACT = {n: (-1.0) ** (n // 2) / math.factorial(n) for n in range(2, 7)}
+
+
+def observer_ecef(latitude: float, longitude: float, altitude_m: float) -> np.ndarray:
+    """
+    Convert a geodetic observer location to WGS-84 ECEF coordinates.
+
+    Args:
+        latitude: Geodetic latitude in degrees
+        longitude: Longitude in degrees
+        altitude_m: Height above the ellipsoid in meters
+
+    Returns:
+        ECEF position in km, shape (3,)
+    """
+    lat = latitude * DEG2RAD
+    lon = longitude * DEG2RAD
+    alt_km = altitude_m / 1000.0
+    sin_lat = math.sin(lat)
+    n = WGS84_A_KM / math.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+    return np.array([
+        (n + alt_km) * math.cos(lat) * math.cos(lon),
+        (n + alt_km) * math.cos(lat) * math.sin(lon),
+        (n * (1.0 - WGS84_E2) + alt_km) * sin_lat,
+    ])
+
+
+class ObserverFrame:
+    """
+    Topocentric frame of a fixed ground observer.
+
+    The observer's ECEF position and ECEF-to-ENU rotation are computed once.
+    For each time grid the frame also caches the combined TEME-to-ENU
+    rotation (and the matching Earth-rotation velocity term) in a small LRU,
+    so repeated conversions on the same timestamps cost only multiply-adds.
+    The cache is shared by the pipeline and scheduler threads and guarded
+    by a lock; rotations are computed outside it.
+    """
+
+    def __init__(self, latitude: float, longitude: float, altitude_m: float,
+                 cache_size: int = ROTATION_CACHE_SIZE):
+        """
+        Build the frame.
+
+        Args:
+            latitude: Observer geodetic latitude in degrees
+            longitude: Observer longitude in degrees
+            altitude_m: Observer altitude in meters
+            cache_size: Number of time grids whose rotations are kept
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude_m = altitude_m
+        self.position = observer_ecef(latitude, longitude, altitude_m)
+
+        lat = latitude * DEG2RAD
+        lon = longitude * DEG2RAD
+        sin_lat, cos_lat = math.sin(lat), math.cos(lat)
+        sin_lon, cos_lon = math.sin(lon), math.cos(lon)
+        # Rows are the east, north and up unit vectors in ECEF
+        self.enu = np.array([
+            [-sin_lon, cos_lon, 0.0],
+            [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+            [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+        ])
+        self.offset = self.enu @ self.position
+        self.cache_size = cache_size
+        self._rotations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def rotations(self, unix_seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        TEME-to-ENU rotation matrices for a set of times.
+
+        Args:
+            unix_seconds: Times as Unix seconds, any shape
+
+        Returns:
+            Tuple (m, w) of arrays shaped (3, 3) + unix_seconds.shape. The
+            ENU position is m @ r_teme - offset and the ENU velocity relative
+            to the observer is m @ v_teme + w @ r_teme.
+        """
+        unix_seconds = np.asarray(unix_seconds, dtype=np.float64)
+        key = None
+        if unix_seconds.size <= MAX_CACHED_TIMES:
+            key = (unix_seconds.shape, unix_seconds.tobytes())
+            with self._lock:
+                cached = self._rotations.get(key)
+                if cached is not None:
+                    self._rotations.move_to_end(key)
+                    return cached
+
+        theta = gmst(unix_seconds)
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        # m = enu @ Rz(theta); w = omega * m @ J, where J is the (transposed)
+        # cross product with the Earth rotation axis. Matrix indices lead so
+        # every element is a contiguous array over time.
+        m = np.empty((3, 3) + unix_seconds.shape)
+        w = np.zeros_like(m)
+        for i, (east_x, east_y, east_z) in enumerate(self.enu):
+            m[i, 0] = east_x * cos_t - east_y * sin_t
+            m[i, 1] = east_x * sin_t + east_y * cos_t
+            m[i, 2] = east_z
+            w[i, 0] = -EARTH_ROTATION_RAD_PER_SEC * m[i, 1]
+            w[i, 1] = EARTH_ROTATION_RAD_PER_SEC * m[i, 0]
+
+        if key is not None:
+            with self._lock:
+                self._rotations[key] = (m, w)
+                if len(self._rotations) > self.cache_size:
+                    self._rotations.popitem(last=False)
+        return m, w
+
+    def look_angles(self, position: np.ndarray, velocity: np.ndarray,
+                    unix_seconds: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute topocentric look angles from TEME state vectors.
+
+        Args:
+            position: TEME positions in km, shape (..., n_times, 3)
+            velocity: TEME velocities in km/s, shape (..., n_times, 3)
+            unix_seconds: Times matching the second-to-last axis
+
+        Returns:
+            Dictionary with azimuth and elevation (degrees), range (km)
+            and range_rate (km/s) arrays
+        """
+        m, w = self.rotations(unix_seconds)
+        x, y, z = position[..., 0], position[..., 1], position[..., 2]
+        vx, vy, vz = velocity[..., 0], velocity[..., 1], velocity[..., 2]
+        enu = []
+        rate = 0.0
+        for i in range(3):
+            rho = m[i, 0] * x + m[i, 1] * y + m[i, 2] * z - self.offset[i]
+            drho = m[i, 0] * vx + m[i, 1] * vy + m[i, 2] * vz + w[i, 0] * x + w[i, 1] * y
+            enu.append(rho)
+            rate = rate + rho * drho
+        east, north, up = enu
+        slant_range = np.sqrt(east * east + north * north + up * up)
+        return {
+            'azimuth': np.mod(np.arctan2(east, north) * RAD2DEG, 360.0),
+            'elevation': np.arcsin(up / slant_range) * RAD2DEG,
+            'range': slant_range,
+            'range_rate': rate / slant_range,
+        }
+
+
+def parse_tle_epoch(epoch_field: str) -> float:
+    """
+    Convert a TLE epoch field (YYDDD.DDDDDDDD) to Unix seconds.
+
+    Args:
+        epoch_field: Columns 19-32 of TLE line 1
+
+    Returns:
+        Epoch as Unix seconds
+    """
+    year = int(epoch_field[:2])
+    year += 2000 if year < 57 else 1900
+    day_of_year = float(epoch_field[2:])
+    start = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()
+    return start + (day_of_year - 1.0) * 86400.0
+
+
+def parse_tle_exponent(field: str) -> float:
+    """
+    Parse a TLE field with an implied decimal point and exponent (e.g. ' 12345-4').
+
+    Args:
+        field: Raw field text
+
+    Returns:
+        Parsed floating point value
+    """
+    field = field.strip()
+    if not field:
+        return 0.0
+    sign = -1.0 if field[0] == '-' else 1.0
+    field = field.lstrip('+-')
+    mantissa, exponent = field[:-2], field[-2:]
+    return sign * float('0.' + mantissa.strip()) * 10.0 ** int(exponent)
+
+
+def parse_tle(line1: str, line2: str) -> Dict[str, float]:
+    """
+    Parse the orbital elements from a two-line element set.
+
+    Args:
+        line1: TLE line 1
+        line2: TLE line 2
+
+    Returns:
+        Dictionary of elements in TLE units (degrees, revolutions per day)
+
+    Raises:
+        ValueError: If the lines are not a valid TLE pair
+    """
+    if not (line1.startswith('1 ') and line2.startswith('2 ')) or len(line1) < 64 or len(line2) < 63:
+        raise ValueError("Invalid TLE line pair")
+    return {
+        'norad_id': int(line1[2:7]),
+        'epoch': parse_tle_epoch(line1[18:32]),
+        'bstar': parse_tle_exponent(line1[53:61]),
+        'inclination': float(line2[8:16]),
+        'raan': float(line2[17:25]),
+        'eccentricity': float('0.' + line2[26:33].strip()),
+        'arg_perigee': float(line2[34:42]),
+        'mean_anomaly': float(line2[43:51]),
+        'mean_motion': float(line2[52:63]),
+    }
@@ -5,14 +5,25 @@ This module provides utilities for tracking satellites using TLE data
 and calculating pointing angles for ground station antennas.
 """
 
-from datetime import datetime
-from typing import Tuple, Dict, Optional
+from datetime import datetime, timezone
+from typing import Tuple, Dict, Optional, Sequence, Union
 import math
 
+import numpy as np
+
+from element_store import ELEMENT_COLUMNS, ElementStore, iter_elements
+from pass_predictor import COARSE_STEP_SEC, find_passes
+from propagator import ObserverFrame, SGP4Propagator, TimeLike, parse_tle, to_unix_seconds
+from visibility_index import VisibilityIndex
+
 # Physical constants
 SPEED_OF_LIGHT_MPS = 299792458.0  # Speed of light in meters per second
 SPEED_OF_LIGHT_KMPS = 299792.458  # Speed of light in kilometers per second
 METERS_PER_KM = 1000  # Meters in a kilometer
+FSPL_SCALE = 4 * math.pi * METERS_PER_KM / SPEED_OF_LIGHT_MPS  # Path loss factor per Hz*km
+
+ArrayLike = Union[float, np.ndarray]
+ARRAY_TYPES = (np.ndarray, list, tuple)  # Inputs that take the vectorized path
 
 
 class SatelliteTracker:
@@ -32,24 +43,210 @@ class SatelliteTracker:
             observer_lon: Observer longitude in degrees (-180 to 180)
             observer_alt: Observer altitude in meters above sea level
         """
-        self.observer_lat = observer_lat
-        self.observer_lon = observer_lon
-        self.observer_alt = observer_alt
-        self.satellites = {}
+        self._frame = ObserverFrame(observer_lat, observer_lon, observer_alt)
+        self.satellites = ElementStore()
+        self.catalog_version = 0
+        self._propagator = None
+        self._visibility_index = None
+        self._visibility_version = None
+
+    @property
+    def observer_lat(self) -> float:
+        """Observer latitude in degrees."""
+        return self._frame.latitude
+
+    @observer_lat.setter
+    def observer_lat(self, value: float) -> None:
+        self.set_observer(value, self.observer_lon, self.observer_alt)
+
+    @property
+    def observer_lon(self) -> float:
+        """Observer longitude in degrees."""
+        return self._frame.longitude
+
+    @observer_lon.setter
+    def observer_lon(self, value: float) -> None:
+        self.set_observer(self.observer_lat, value, self.observer_alt)
+
+    @property
+    def observer_alt(self) -> float:
+        """Observer altitude in meters."""
+        return self._frame.altitude_m
+
+    @observer_alt.setter
+    def observer_alt(self, value: float) -> None:
+        self.set_observer(self.observer_lat, self.observer_lon, value)
+
+    @property
+    def observer_frame(self) -> ObserverFrame:
+        """Cached observer position and rotation matrices."""
+        return self._frame
+
+    def set_observer(self, observer_lat: float, observer_lon: float, observer_alt: float = 0) -> None:
+        """
+        Move the observer, rebuilding the cached frame and visibility index.
+
+        Args:
+            observer_lat: Observer latitude in degrees (-90 to 90)
+            observer_lon: Observer longitude in degrees (-180 to 180)
+            observer_alt: Observer altitude in meters above sea level
+        """
+        self._frame = ObserverFrame(observer_lat, observer_lon, observer_alt)
+        self._visibility_index = None
+
+    def add_satellite(self, satellite_id: str, line1: str, line2: str) -> None:
+        """
+        Add (or replace) a single satellite from a TLE line pair.
+
+        Args:
+            satellite_id: Identifier for the satellite
+            line1: TLE line 1
+            line2: TLE line 2
+        """
+        elements = parse_tle(line1, line2)
+        self.satellites.put(satellite_id, elements['norad_id'],
+                            [elements[name] for name in ELEMENT_COLUMNS])
+        self._propagator = None
+        self.catalog_version += 1
+
+    def _get_propagator(self) -> SGP4Propagator:
+        """Build (once) the batched propagator covering every loaded satellite."""
+        if self._propagator is None:
+            self._propagator = SGP4Propagator(**self.satellites.columns())
+        return self._propagator
+
+    def calculate_positions(self, satellite_ids: Optional[Sequence[str]] = None,
+                            timestamps: TimeLike = None) -> Dict[str, np.ndarray]:
+        """
+        Calculate positions for many satellites at many times in one call.
+
+        Args:
+            satellite_ids: Satellites to propagate (default: all loaded)
+            timestamps: Datetime(s) or Unix seconds (default: now)
+
+        Returns:
+            Dictionary with azimuth, elevation (degrees), range (km) and
+            range_rate (km/s) arrays of shape (n_satellites, n_times)
+
+        Raises:
+            ValueError: If a satellite is not loaded
+        """
+        if timestamps is None:
+            timestamps = datetime.utcnow()
+        times = to_unix_seconds(timestamps)
+        propagator = self._get_propagator()
+        if satellite_ids is not None:
+            propagator = propagator.take(self.satellites.rows_of(satellite_ids))
+        return self._look(propagator, times)
+
+    def _look(self, propagator: SGP4Propagator, times: np.ndarray) -> Dict[str, np.ndarray]:
+        """Propagate and convert to observer look angles (times as Unix seconds)."""
+        position, velocity = propagator.propagate(times)
+        return self._frame.look_angles(position, velocity, times)
+
+    def predict_passes(self, satellite_ids: Optional[Sequence[str]] = None,
+                       start: TimeLike = None, end: TimeLike = None,
+                       min_elevation: float = 10.0,
+                       step: float = COARSE_STEP_SEC) -> np.ndarray:
+        """
+        Predict all passes of many satellites over a time window.
+
+        Args:
+            satellite_ids: Satellites to search (default: all loaded)
+            start: Window start (default: now)
+            end: Window end (default: 24 hours after start)
+            min_elevation: Minimum elevation angle in degrees
+            step: Coarse sweep step in seconds
+
+        Returns:
+            Structured array with PASS_DTYPE fields (norad_id, aos, tca,
+            los, max_elevation, aos/tca/los_azimuth), times as Unix
+            seconds, sorted by AOS
+
+        Raises:
+            ValueError: If a satellite is not loaded
+        """
+        start_s = float(to_unix_seconds(datetime.utcnow() if start is None else start)[0])
+        end_s = start_s + 86400.0 if end is None else float(to_unix_seconds(end)[0])
+        propagator = self._get_propagator()
+        norad_ids = self.satellites.norad_id
+        if satellite_ids is not None:
+            rows = self.satellites.rows_of(satellite_ids)
+            propagator = propagator.take(rows)
+            norad_ids = norad_ids[rows]
+        return find_passes(self._look, propagator, norad_ids, start_s, end_s, min_elevation, step)
         
     def load_tle(self, tle_file: str) -> int:
         """
         Load TLE data from file.
-        
+
+        The file is streamed line by line straight into the columnar
+        element store; CelesTrak TLE (2- or 3-line) and OMM CSV files are
+        both accepted. Satellites already loaded are replaced.
+
         Args:
-            tle_file: Path to TLE file
+            tle_file: Path to TLE or OMM CSV file
             
         Returns:
             Number of satellites loaded
         """
-        # TODO: Implement TLE parsing
-        # This would use a library like pyorbital or skyfield
-        pass
+        with open(tle_file, 'r', encoding='utf-8') as stream:
+            count = self.satellites.extend(iter_elements(stream))
+        self._propagator = None
+        self.catalog_version += 1
+        return count
+
+    def update_tle(self, tle_file: str) -> Dict[str, int]:
+        """
+        Incrementally refresh the catalog from a new TLE or OMM file.
+
+        The fresh catalog is diffed against the loaded one by NORAD ID and
+        epoch. Only satellites with a newer element set are rewritten and
+        re-initialized in the propagator, new satellites are appended, and
+        satellites missing from the fresh catalog (decayed) are dropped.
+        Everything else, including the propagator coefficients of
+        unchanged satellites, is left untouched.
+
+        Args:
+            tle_file: Path to TLE or OMM CSV file
+
+        Returns:
+            Dictionary with counts of added, updated, removed and
+            unchanged satellites
+        """
+        fresh = ElementStore()
+        with open(tle_file, 'r', encoding='utf-8') as stream:
+            fresh.extend(iter_elements(stream))
+        diff = self.satellites.diff(fresh)
+        propagator = self._propagator
+
+        if len(diff.changed_rows):
+            self.satellites.assign_rows(diff.changed_rows, fresh, diff.changed_source_rows)
+            if propagator is not None:
+                propagator.update_rows(diff.changed_rows, self._build_propagator(fresh, diff.changed_source_rows))
+        if len(diff.new_source_rows):
+            self.satellites.append_rows(fresh, diff.new_source_rows)
+            if propagator is not None:
+                propagator.append(self._build_propagator(fresh, diff.new_source_rows))
+        if len(diff.removed_rows):
+            keep = self.satellites.remove_rows(diff.removed_rows)
+            if propagator is not None:
+                self._propagator = propagator.take(keep)
+
+        changed = len(diff.changed_rows) + len(diff.new_source_rows) + len(diff.removed_rows)
+        if changed:
+            self.catalog_version += 1
+        return {
+            'added': len(diff.new_source_rows),
+            'updated': len(diff.changed_rows),
+            'removed': len(diff.removed_rows),
+            'unchanged': len(fresh) - len(diff.new_source_rows) - len(diff.changed_rows),
+        }
+
+    @staticmethod
+    def _build_propagator(store: ElementStore, rows: np.ndarray) -> SGP4Propagator:
+        """Initialize a propagator for selected rows of an element store."""
+        return SGP4Propagator(**{name: col[rows] for name, col in store.columns().items()})
     
     def calculate_position(self, satellite_id: str, timestamp: Optional[datetime] = None) -> Dict[str, float]:
         """
@@ -61,24 +258,29 @@ class SatelliteTracker:
             
         Returns:
             Dictionary with keys: azimuth, elevation, range, range_rate
+
+        Raises:
+            ValueError: If the satellite is not loaded
         """
         if timestamp is None:
             timestamp = datetime.utcnow()
-            
-        # TODO: Implement position calculation using SGP4/SDP4
-        # For now, return placeholder
+
+        result = self.calculate_positions([satellite_id], timestamp)
         return {
-            'azimuth': 0.0,      # degrees
-            'elevation': 0.0,    # degrees
-            'range': 0.0,        # km
-            'range_rate': 0.0,   # km/s
+            'azimuth': float(result['azimuth'][0, 0]),        # degrees
+            'elevation': float(result['elevation'][0, 0]),    # degrees
+            'range': float(result['range'][0, 0]),            # km
+            'range_rate': float(result['range_rate'][0, 0]),  # km/s
             'timestamp': timestamp
         }
     
     def is_visible(self, satellite_id: str, min_elevation: float = 10.0) -> bool:
         """
         Check if satellite is currently visible.
-        
+
+        Satellites ruled out by the visibility index are rejected without
+        being propagated.
+
         Args:
             satellite_id: Identifier for the satellite
             min_elevation: Minimum elevation angle in degrees
@@ -86,54 +288,141 @@ class SatelliteTracker:
         Returns:
             True if satellite is above minimum elevation
         """
-        position = self.calculate_position(satellite_id)
+        now = datetime.utcnow()
+        row = self.satellites.row_of(satellite_id)
+        index = self.get_visibility_index(float(to_unix_seconds(now)[0]), min_elevation)
+        if not np.any(index.candidates == row):
+            return False
+        position = self.calculate_position(satellite_id, now)
         return position['elevation'] >= min_elevation
+
+    def get_visibility_index(self, timestamp: float, min_elevation: float) -> VisibilityIndex:
+        """
+        Get the visibility pre-filter covering a time, rebuilding it if needed.
+
+        The index is reused for every query inside its window (a few
+        minutes) as long as the catalog has not changed and the elevation
+        mask is at least as strict as the one it was built for.
+
+        Args:
+            timestamp: Query time (Unix seconds)
+            min_elevation: Elevation mask in degrees
+
+        Returns:
+            VisibilityIndex whose window contains the timestamp
+        """
+        index = self._visibility_index
+        if (index is None or self._visibility_version != self.catalog_version
+                or not index.covers(timestamp, min_elevation)):
+            index = VisibilityIndex(self._get_propagator(), self._frame.position, min_elevation, timestamp)
+            self._visibility_index = index
+            self._visibility_version = self.catalog_version
+        return index
+
+    def visible_satellites(self, timestamp: TimeLike = None, min_elevation: float = 10.0) -> Dict[str, np.ndarray]:
+        """
+        Find every satellite above the elevation mask at one instant.
+
+        Only satellites that pass the visibility index are propagated.
+
+        Args:
+            timestamp: Time of the query (default: now)
+            min_elevation: Minimum elevation angle in degrees
+
+        Returns:
+            Dictionary with norad_id, azimuth, elevation, range and
+            range_rate arrays for the visible satellites, sorted by
+            descending elevation
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        t = to_unix_seconds(timestamp)[:1]
+        rows = self.get_visibility_index(float(t[0]), min_elevation).candidates
+        angles = {key: value[:, 0] for key, value in self._look(self._get_propagator().take(rows), t).items()}
+        visible = np.flatnonzero(angles['elevation'] >= min_elevation)
+        visible = visible[np.argsort(-angles['elevation'][visible], kind='stable')]
+        result = {key: value[visible] for key, value in angles.items()}
+        result['norad_id'] = self.satellites.norad_id[rows[visible]]
+        return result
     
-    def get_next_pass(self, satellite_id: str, min_elevation: float = 10.0) -> Optional[Dict]:
+    def get_next_pass(self, satellite_id: str, min_elevation: float = 10.0,
+                      start: Optional[datetime] = None, search_hours: float = 24.0) -> Optional[Dict]:
         """
         Calculate next pass of satellite over observer.
-        
+
+        A pass already in progress at the start time is returned as the
+        next pass.
+
         Args:
             satellite_id: Identifier for the satellite
             min_elevation: Minimum elevation angle in degrees
-            
+            start: Time to search from (default: now)
+            search_hours: Length of the search window in hours
+
         Returns:
             Dictionary with pass information or None if no pass found
         """
-        # TODO: Implement pass prediction
-        pass
+        if start is None:
+            start = datetime.utcnow()
+        start_s = float(to_unix_seconds(start)[0])
+        passes = self.predict_passes([satellite_id], start_s, start_s + search_hours * 3600.0, min_elevation)
+        if not len(passes):
+            return None
+        first = passes[0]
+        to_datetime = lambda t: datetime.fromtimestamp(float(t), timezone.utc)
+        return {
+            'aos': to_datetime(first['aos']),
+            'tca': to_datetime(first['tca']),
+            'los': to_datetime(first['los']),
+            'duration': float(first['los'] - first['aos']),      # seconds
+            'max_elevation': float(first['max_elevation']),      # degrees
+            'aos_azimuth': float(first['aos_azimuth']),          # degrees
+            'tca_azimuth': float(first['tca_azimuth']),          # degrees
+            'los_azimuth': float(first['los_azimuth']),          # degrees
+        }
 
 
-def calculate_doppler_shift(frequency: float, range_rate: float) -> float:
+def calculate_doppler_shift(frequency: ArrayLike, range_rate: ArrayLike) -> ArrayLike:
     """
     Calculate Doppler shift for given frequency and range rate.
-    
+
+    Scalars in give a float out. Arrays broadcast against each other, so a
+    frequency column (n, 1) and a range-rate row (1, k) give an (n, k) table.
+
     Args:
         frequency: Signal frequency in Hz
         range_rate: Range rate (velocity) in km/s (positive = moving away)
-        
+
     Returns:
-        Doppler shift in Hz
+        Doppler shift in Hz (float, or array of the broadcast shape)
     """
-    doppler_shift = -(frequency * range_rate) / SPEED_OF_LIGHT_KMPS
-    return doppler_shift
+    if not isinstance(frequency, ARRAY_TYPES) and not isinstance(range_rate, ARRAY_TYPES):
+        doppler_shift = -(frequency * range_rate) / SPEED_OF_LIGHT_KMPS
+        return doppler_shift
+    return np.multiply(frequency, range_rate) * (-1.0 / SPEED_OF_LIGHT_KMPS)
 
 
-def calculate_free_space_loss(frequency: float, distance: float) -> float:
+def calculate_free_space_loss(frequency: ArrayLike, distance: ArrayLike) -> ArrayLike:
     """
     Calculate free space path loss.
-    
+
+    Scalars in give a float out. Arrays broadcast against each other, so a
+    frequency column (n, 1) and a range row (1, k) give an (n, k) table.
+
     Args:
         frequency: Signal frequency in Hz
         distance: Distance in km
-        
+
     Returns:
-        Path loss in dB
+        Path loss in dB (float, or array of the broadcast shape)
     """
-    wavelength = SPEED_OF_LIGHT_MPS / frequency  # wavelength in meters
-    distance_m = distance * METERS_PER_KM  # convert distance to meters
-    loss_db = 20 * math.log10(4 * math.pi * distance_m / wavelength)
-    return loss_db
+    if not isinstance(frequency, ARRAY_TYPES) and not isinstance(distance, ARRAY_TYPES):
+        wavelength = SPEED_OF_LIGHT_MPS / frequency  # wavelength in meters
+        distance_m = distance * METERS_PER_KM  # convert distance to meters
+        loss_db = 20 * math.log10(4 * math.pi * distance_m / wavelength)
+        return loss_db
+    # 4*pi*d/lambda folded into one product: 4*pi*1000/c * f * d
+    return 20.0 * np.log10(np.multiply(frequency, distance) * FSPL_SCALE)
 
 
 def azimuth_to_direction(azimuth: float) -> str:
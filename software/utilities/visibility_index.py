@@ -0,0 +1,100 @@
+"""
+Starlink DIY - Visibility Pre-filter Index
+
+This module narrows a catalog down to the satellites that could possibly be
+above an elevation mask during a short time window, using only the secular
+part of each orbit (node, inclination and argument of latitude advanced by
+their mean rates). Exact SGP4 propagation then only has to run for the
+handful of candidates instead of the whole catalog.
+
+The test is conservative: a satellite is dropped only when, for every
+instant in the window, its sub-satellite point is farther from the observer
+than the satellite's visibility cone allows, after widening the cone by the
+motion of both satellite and observer across the window.
+"""
+
+import math
+
+import numpy as np
+
+from pass_predictor import visibility_half_angle
+from propagator import EARTH_ROTATION_RAD_PER_SEC, SGP4Propagator, gmst
+
+DEFAULT_WINDOW_SEC = 300.0  # How long one index stays valid
+ANGLE_MARGIN_RAD = math.radians(0.5)  # Covers periodic terms and geodetic latitude
+
+
+class VisibilityIndex:
+    """
+    Candidate set of satellites that may be visible during a time window.
+
+    Build one per window (a few minutes) and query it for any time inside
+    that window; ``candidates`` holds the propagator rows that survive the
+    geometric test.
+    """
+
+    def __init__(self, propagator: SGP4Propagator, observer_position: np.ndarray,
+                 min_elevation: float, start: float, window: float = DEFAULT_WINDOW_SEC):
+        """
+        Build the index for a window.
+
+        Args:
+            propagator: Propagator covering the catalog
+            observer_position: Observer ECEF position in km, shape (3,)
+            min_elevation: Elevation mask in degrees the index is valid for
+            start: Window start (Unix seconds)
+            window: Window length in seconds
+        """
+        self.min_elevation = min_elevation
+        self.start = start
+        self.end = start + window
+
+        mid = start + 0.5 * window
+        dt = (mid - propagator.epoch) / 60.0  # minutes since epoch
+
+        # Secular node and argument of latitude at mid-window, including
+        # the along-track drag polynomial that SGP4 applies to mean anomaly
+        node = propagator.nodeo + propagator.nodedot * dt + propagator.nodecf * dt * dt
+        drag = dt * dt * (propagator.t2cof + dt * (propagator.t3cof
+                                                    + dt * (propagator.t4cof + dt * propagator.t5cof)))
+        arg_lat = (propagator.argpo + propagator.mo + (propagator.argpdot + propagator.mdot) * dt
+                   + propagator.no_unkozai * drag)
+        cos_i, sin_i = propagator.cosio, propagator.sinio
+        cos_u, sin_u = np.cos(arg_lat), np.sin(arg_lat)
+        cos_n, sin_n = np.cos(node), np.sin(node)
+        sat = np.stack((
+            cos_n * cos_u - sin_n * sin_u * cos_i,
+            sin_n * cos_u + cos_n * sin_u * cos_i,
+            sin_u * sin_i,
+        ), axis=1)
+
+        # Observer direction in the same (TEME-like) inertial frame
+        obs_radius = float(np.linalg.norm(observer_position))
+        obs_lat = math.asin(observer_position[2] / obs_radius)
+        obs_ra = float(gmst(mid)) + math.atan2(observer_position[1], observer_position[0])
+        obs = np.array([math.cos(obs_lat) * math.cos(obs_ra),
+                        math.cos(obs_lat) * math.sin(obs_ra),
+                        math.sin(obs_lat)])
+
+        # Central angle at mid-window versus the cone widened by half a
+        # window of satellite and Earth motion
+        central = np.arccos(np.clip(sat @ obs, -1.0, 1.0))
+        rate = (np.abs(propagator.mdot + propagator.argpdot) + np.abs(propagator.nodedot)) / 60.0
+        rate = rate + EARTH_ROTATION_RAD_PER_SEC * math.cos(obs_lat)
+        reach = (visibility_half_angle(propagator, min_elevation, obs_radius)
+                 + rate * 0.5 * window + ANGLE_MARGIN_RAD)
+        self.candidates = np.flatnonzero(central <= reach)
+
+    def covers(self, timestamp: float, min_elevation: float) -> bool:
+        """
+        Check whether this index can answer a query.
+
+        Args:
+            timestamp: Query time (Unix seconds)
+            min_elevation: Query elevation mask in degrees
+
+        Returns:
+            True if the time is inside the window and the mask is at least
+            as strict as the one the index was built for
+        """
+        return self.start <= timestamp <= self.end and min_elevation >= self.min_elevation
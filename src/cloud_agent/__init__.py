@@ -5,9 +5,11 @@ This module provides functionality to delegate tasks to a cloud agent
 for processing satellite connectivity operations.
 """
 
-from .client import CloudAgentClient
+from .async_client import AsyncCloudAgentClient
+from .client import CloudAgentClient, EndpointNotSupported
 from .delegation import DelegationService
 from .config import CloudAgentConfig
 
-__all__ = ['CloudAgentClient', 'DelegationService', 'CloudAgentConfig']
+__all__ = ['AsyncCloudAgentClient', 'CloudAgentClient', 'DelegationService', 'CloudAgentConfig',
+           'EndpointNotSupported']
 __version__ = '0.1.0'
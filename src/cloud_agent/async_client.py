@@ -0,0 +1,177 @@
+"""
+Async Cloud Agent Client Module
+
+Provides an asyncio client for communicating with cloud agents, so many
+delegations can be in flight at once from one process.
+"""
+
+import asyncio
+from typing import Dict, Any, Optional
+
+import aiohttp
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Same as the synchronous client's retry strategy
+RETRY_BACKOFF_SEC = 1.0  # Retries wait 0, 2, 4, 8... seconds, like urllib3's backoff_factor=1
+
+
+class AsyncCloudAgentClient:
+    """
+    Asyncio client for interacting with cloud agents via HTTP/HTTPS.
+
+    Same API as CloudAgentClient with coroutines. All requests share one
+    pool of HTTP/1.1 keep-alive connections; at most config.max_in_flight
+    requests run at once and further requests wait for a free slot.
+    """
+
+    def __init__(self, config):
+        """
+        Initialize async cloud agent client.
+
+        Args:
+            config: CloudAgentConfig instance with connection settings
+        """
+        self.config = config
+        self._connected = False
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.max_in_flight_seen = 0
+        self.requests = 0
+        self.retries = 0
+
+    async def __aenter__(self) -> 'AsyncCloudAgentClient':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.disconnect()
+
+    async def connect(self) -> bool:
+        """
+        Open the connection pool and check the cloud agent's health.
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        await self.disconnect()
+        headers = {}
+        if self.config.api_key:
+            headers['Authorization'] = f'Bearer {self.config.api_key}'
+        connector = aiohttp.TCPConnector(limit=self.config.max_in_flight)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+        self._slots = asyncio.Semaphore(self.config.max_in_flight)
+        try:
+            async with self._session.get(f"{self.config.endpoint}/health") as response:
+                self._connected = response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Connection failed, but don't raise - return False
+            self._connected = False
+        return self._connected
+
+    async def disconnect(self) -> None:
+        """Close the connection pool."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        """Check if client is connected to cloud agent."""
+        return self._connected
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """
+        Send one request through the pool, retrying like the synchronous client.
+
+        Args:
+            method: HTTP method
+            path: Path below the endpoint
+            **kwargs: Passed to aiohttp (json, params, ...)
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            aiohttp.ClientError: If the request fails after all retries
+        """
+        async with self._slots:
+            self.in_flight += 1
+            self.max_in_flight_seen = max(self.max_in_flight_seen, self.in_flight)
+            try:
+                for attempt in range(self.config.max_retries + 1):
+                    if attempt:
+                        self.retries += 1
+                        if attempt > 1:
+                            await asyncio.sleep(RETRY_BACKOFF_SEC * 2 ** (attempt - 1))
+                    self.requests += 1
+                    try:
+                        async with self._session.request(
+                                method, f"{self.config.endpoint}{path}", **kwargs) as response:
+                            if response.status in RETRY_STATUSES and attempt < self.config.max_retries:
+                                continue
+                            response.raise_for_status()
+                            return await response.json()
+                    except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                        if attempt == self.config.max_retries:
+                            raise
+            finally:
+                self.in_flight -= 1
+
+    async def send_task(self, task_type: str, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a task to the cloud agent for processing.
+
+        Args:
+            task_type: Type of task to delegate
+            task_data: Task-specific data
+
+        Returns:
+            dict: Response from cloud agent containing task result
+
+        Raises:
+            ConnectionError: If not connected to cloud agent
+            ValueError: If task_type is empty or task_data is not a dict
+            aiohttp.ClientError: If HTTP request fails
+        """
+        if not self._connected or not self._session:
+            raise ConnectionError("Not connected to cloud agent")
+
+        # Validate inputs
+        if not task_type or not isinstance(task_type, str):
+            raise ValueError("task_type must be a non-empty string")
+        if not isinstance(task_data, dict):
+            raise ValueError("task_data must be a dictionary")
+
+        payload = {
+            'task_type': task_type,
+            'task_data': task_data
+        }
+        return await self._request('POST', '/tasks', json=payload)
+
+    async def get_task_status(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get status of a delegated task.
+
+        Args:
+            task_id: ID of the task to check
+
+        Returns:
+            dict: Task status information
+
+        Raises:
+            ConnectionError: If not connected to cloud agent
+            ValueError: If task_id is empty
+            aiohttp.ClientError: If HTTP request fails
+        """
+        if not self._connected or not self._session:
+            raise ConnectionError("Not connected to cloud agent")
+
+        # Validate input
+        if not task_id or not isinstance(task_id, str):
+            raise ValueError("task_id must be a non-empty string")
+
+        return await self._request('GET', f'/tasks/{task_id}')
@@ -4,11 +4,17 @@ Cloud Agent Client Module
 Provides client interface for communicating with cloud agents.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+UNSUPPORTED_STATUSES = (404, 405, 501)  # Endpoint not implemented by the cloud agent
+
+
+class EndpointNotSupported(Exception):
+    """Raised when the cloud agent does not implement an optional endpoint."""
+
 
 class CloudAgentClient:
     """Client for interacting with cloud agents via HTTP/HTTPS."""
@@ -43,7 +49,11 @@ class CloudAgentClient:
                 allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
             )
             
-            adapter = HTTPAdapter(max_retries=retry_strategy)
+            # Keep enough pooled connections for parallel requests from threads
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_maxsize=self.config.max_in_flight
+            )
             self._session.mount("http://", adapter)
             self._session.mount("https://", adapter)
             
@@ -150,3 +160,133 @@ class CloudAgentClient:
         response.raise_for_status()
         
         return response.json()
+    
+    def send_tasks(self, tasks: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several tasks to the cloud agent in one request.
+        
+        Args:
+            tasks: List of (task_type, task_data)
+            
+        Returns:
+            list: One response per task, in input order
+            
+        Raises:
+            ConnectionError: If not connected to cloud agent
+            ValueError: If a task is invalid or the response does not match the request
+            EndpointNotSupported: If the cloud agent has no batch endpoint
+            requests.exceptions.RequestException: If HTTP request fails
+        """
+        if not self._connected or not self._session:
+            raise ConnectionError("Not connected to cloud agent")
+        
+        # Validate inputs
+        for task_type, task_data in tasks:
+            if not task_type or not isinstance(task_type, str):
+                raise ValueError("task_type must be a non-empty string")
+            if not isinstance(task_data, dict):
+                raise ValueError("task_data must be a dictionary")
+        
+        payload = {
+            'tasks': [
+                {'task_type': task_type, 'task_data': task_data}
+                for task_type, task_data in tasks
+            ]
+        }
+        
+        # Send batch to cloud agent
+        response = self._session.post(
+            f"{self.config.endpoint}/tasks/batch",
+            json=payload,
+            timeout=self.config.timeout
+        )
+        if response.status_code in UNSUPPORTED_STATUSES:
+            raise EndpointNotSupported("Cloud agent does not support batch submission")
+        response.raise_for_status()
+        
+        results = response.json().get('tasks')
+        if not isinstance(results, list) or len(results) != len(tasks):
+            raise ValueError("Batch response does not match the submitted tasks")
+        return results
+    
+    def get_task_statuses(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get statuses of several tasks in one request.
+        
+        The IDs are sent in the query string, so callers should keep each
+        request to a few thousand characters of IDs.
+        
+        Args:
+            task_ids: IDs of the tasks to check
+            
+        Returns:
+            list: Status information of the tasks the cloud agent knows
+            
+        Raises:
+            ConnectionError: If not connected to cloud agent
+            ValueError: If a task_id is empty
+            EndpointNotSupported: If the cloud agent has no bulk status endpoint
+            requests.exceptions.RequestException: If HTTP request fails
+        """
+        if not self._connected or not self._session:
+            raise ConnectionError("Not connected to cloud agent")
+        
+        # Validate input
+        for task_id in task_ids:
+            if not task_id or not isinstance(task_id, str):
+                raise ValueError("task_id must be a non-empty string")
+        
+        # Query task statuses
+        response = self._session.get(
+            f"{self.config.endpoint}/tasks",
+            params={'ids': ','.join(task_ids)},
+            timeout=self.config.timeout
+        )
+        if response.status_code in UNSUPPORTED_STATUSES:
+            raise EndpointNotSupported("Cloud agent does not support bulk status queries")
+        response.raise_for_status()
+        
+        results = response.json().get('tasks')
+        if not isinstance(results, list):
+            raise ValueError("Bulk status response has no task list")
+        return results
+    
+    def get_task_events(self, cursor: Optional[str] = None, wait: float = 0.0) -> Dict[str, Any]:
+        """
+        Long-poll the cloud agent for task status changes.
+        
+        The request is held by the cloud agent until a task changes status
+        after the cursor or until wait seconds have passed.
+        
+        Args:
+            cursor: Position returned by the previous call (None for the
+                current position, without events)
+            wait: Maximum seconds for the cloud agent to hold the request
+            
+        Returns:
+            dict: 'events' (list of task status information, oldest first)
+            and 'cursor' (position to pass to the next call)
+            
+        Raises:
+            ConnectionError: If not connected to cloud agent
+            EndpointNotSupported: If the cloud agent has no task event endpoint
+            requests.exceptions.RequestException: If HTTP request fails
+        """
+        if not self._connected or not self._session:
+            raise ConnectionError("Not connected to cloud agent")
+        
+        params = {'wait': wait}
+        if cursor is not None:
+            params['since'] = cursor
+        
+        # Wait for task events
+        response = self._session.get(
+            f"{self.config.endpoint}/tasks/events",
+            params=params,
+            timeout=self.config.timeout + wait
+        )
+        if response.status_code in UNSUPPORTED_STATUSES:
+            raise EndpointNotSupported("Cloud agent does not support task events")
+        response.raise_for_status()
+        
+        return response.json()
@@ -16,6 +16,12 @@ class CloudAgentConfig:
     api_key: Optional[str] = None
     timeout: int = 30
     max_retries: int = 3
+    max_in_flight: int = 100  # Concurrent requests (and pooled connections) per client
+    batch_size: int = 100     # Tasks per POST /tasks/batch request
+    batch_linger: float = 0.05  # Seconds a partial batch waits for more tasks
+    dispatch_workers: int = 8   # Threads submitting queued tasks (concurrency budget)
+    dispatch_rate: float = 0.0  # Max queued task submissions per second (0: unlimited)
+    priority_aging: float = 30.0  # Seconds of queueing worth one priority level
     
     def __post_init__(self):
         """Validate configuration parameters."""
@@ -25,3 +31,15 @@ class CloudAgentConfig:
             raise ValueError("Timeout must be positive")
         if self.max_retries < 0:
             raise ValueError("Max retries cannot be negative")
+        if self.max_in_flight < 1:
+            raise ValueError("Max in flight must be positive")
+        if self.batch_size < 1:
+            raise ValueError("Batch size must be positive")
+        if self.batch_linger < 0:
+            raise ValueError("Batch linger cannot be negative")
+        if self.dispatch_workers < 1:
+            raise ValueError("Dispatch workers must be positive")
+        if self.dispatch_rate < 0:
+            raise ValueError("Dispatch rate cannot be negative")
+        if self.priority_aging <= 0:
+            raise ValueError("Priority aging must be positive")
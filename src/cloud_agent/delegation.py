@@ -4,9 +4,20 @@ Delegation Service Module
 Handles task delegation logic and routing to cloud agents.
 """
 
-from typing import Dict, Any, List, Optional
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 from enum import Enum
 
+from .client import EndpointNotSupported
+from .dispatch import TaskDispatcher
+from .notifications import CompletionWatcher
+from .task_store import FINISHED_STATUSES, TaskStore
+
+STATUS_QUERY_LENGTH = 4000  # Max characters of task IDs per GET /tasks?ids= request
+
 
 class TaskPriority(Enum):
     """Priority levels for delegated tasks."""
@@ -27,7 +38,13 @@ class DelegationService:
             client: CloudAgentClient instance for communication
         """
         self.client = client
-        self.task_queue: List[Dict[str, Any]] = []
+        self.task_queue = TaskStore()
+        self.batch_supported = True  # Cleared when the cloud agent lacks /tasks/batch
+        self.bulk_status_supported = True  # Cleared when the cloud agent lacks GET /tasks?ids=
+        self.batches_sent = 0
+        self._dispatcher: Optional[TaskDispatcher] = None
+        self._watcher: Optional[CompletionWatcher] = None
+        self._lock = threading.Lock()
     
     def delegate_task(
         self, 
@@ -53,31 +70,322 @@ class DelegationService:
         if not self.client.is_connected():
             raise ConnectionError("Client not connected to cloud agent")
         
+        enriched_data = self._prepare_task(task_type, task_data, priority)
+        
+        # Submit task through client
+        response = self.client.send_task(task_type, enriched_data)
+        
+        return self._track_task(task_type, priority, response)
+    
+    def delegate_tasks(self, tasks: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Delegate many tasks using as few requests as possible.
+        
+        Tasks are grouped into micro-batches sent to the cloud agent's
+        POST /tasks/batch endpoint. A batch is sent when it holds
+        config.batch_size tasks or config.batch_linger seconds after its
+        first task arrived, so tasks from a slow generator are not held
+        back waiting for a full batch. If the cloud agent has no batch
+        endpoint, each batch is sent as parallel single POST /tasks
+        requests instead.
+        
+        If a task is invalid or the iterable raises, the tasks before it
+        are still delegated, and the error is re-raised with their IDs in
+        its task_ids attribute.
+        
+        Args:
+            tasks: Iterable of dicts with 'task_type', 'task_data' and
+                optionally 'priority' (default TaskPriority.MEDIUM)
+            
+        Returns:
+            list: Task IDs in input order
+            
+        Raises:
+            ConnectionError: If client not connected
+            ValueError: If a task is invalid (e.task_ids lists the tasks
+                delegated before it)
+            Exception: Whatever the iterable raises, with task_ids set the same way
+        """
+        if not self.client.is_connected():
+            raise ConnectionError("Client not connected to cloud agent")
+        
+        # Pull tasks on a feeder thread so a partial batch can be sent while
+        # the iterable is still producing the next task
+        arrivals: queue.Queue = queue.Queue()
+        stopped = threading.Event()
+        
+        def feed():
+            try:
+                for task in tasks:
+                    if stopped.is_set():
+                        return
+                    arrivals.put((task, None))
+            except Exception as e:
+                arrivals.put((None, e))
+            arrivals.put((None, None))
+        feeder = threading.Thread(target=feed, daemon=True, name="task-feeder")
+        feeder.start()
+        
+        try:
+            return self._delegate_arrivals(arrivals)
+        finally:
+            # Stop pulling tasks after an error (waits for the task being produced)
+            stopped.set()
+            feeder.join()
+    
+    def _delegate_arrivals(self, arrivals: queue.Queue) -> List[str]:
+        """Batch and submit tasks from delegate_tasks()'s feeder queue until it ends."""
+        config = self.client.config
+        task_ids: List[str] = []
+        batch: List[Tuple[str, Dict[str, Any], TaskPriority]] = []
+        deadline = 0.0
+        while True:
+            try:
+                timeout = max(deadline - time.monotonic(), 0.0) if batch else None
+                task, error = arrivals.get(timeout=timeout)
+            except queue.Empty:
+                task_ids += self._submit_batch(batch)
+                batch = []
+                continue
+            if error is None and task is not None:
+                try:
+                    if not isinstance(task, dict):
+                        raise ValueError("Each task must be a dictionary")
+                    task_type = task.get('task_type')
+                    priority = task.get('priority', TaskPriority.MEDIUM)
+                    enriched_data = self._prepare_task(task_type, task.get('task_data'), priority)
+                except ValueError as e:
+                    error = e
+            if error:
+                # Delegate the tasks that arrived before the error
+                if batch:
+                    task_ids += self._submit_batch(batch)
+                error.task_ids = task_ids
+                raise error
+            if task is None:
+                break
+            if not batch:
+                deadline = time.monotonic() + config.batch_linger
+            batch.append((task_type, enriched_data, priority))
+            if len(batch) >= config.batch_size:
+                task_ids += self._submit_batch(batch)
+                batch = []
+        if batch:
+            task_ids += self._submit_batch(batch)
+        return task_ids
+    
+    @property
+    def dispatcher(self) -> TaskDispatcher:
+        """Dispatch queue for submit_task(), created from the client's config on first use."""
+        if self._dispatcher is None:
+            config = self.client.config
+            self._dispatcher = TaskDispatcher(
+                config.dispatch_workers, config.dispatch_rate, config.priority_aging
+            )
+        return self._dispatcher
+    
+    def submit_task(
+        self,
+        task_type: str,
+        task_data: Dict[str, Any],
+        priority: TaskPriority = TaskPriority.MEDIUM
+    ) -> Future:
+        """
+        Queue a task for delegation in priority order.
+        
+        Queued tasks are delegated by the dispatcher's worker threads, at
+        most config.dispatch_workers at once and config.dispatch_rate per
+        second. Higher priorities go first, and a waiting task moves up one
+        priority level every config.priority_aging seconds so LOW tasks are
+        not starved. CRITICAL tasks go ahead of all other queued tasks.
+        
+        Args:
+            task_type: Type of task to delegate
+            task_data: Task-specific data
+            priority: Task priority level
+            
+        Returns:
+            Future: Resolves to the task ID once the task has been delegated
+            
+        Raises:
+            ConnectionError: If client not connected
+            ValueError: If task_type is empty or task_data is not a dict
+        """
+        if not self.client.is_connected():
+            raise ConnectionError("Client not connected to cloud agent")
+        
+        self._prepare_task(task_type, task_data, priority)
+        return self.dispatcher.submit(
+            self.delegate_task,
+            (task_type, task_data, priority),
+            priority.value,
+            urgent=priority is TaskPriority.CRITICAL
+        )
+    
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """
+        Get dispatch queue statistics.
+        
+        Returns:
+            dict: Queue depth (total, per priority name and peak), tasks
+            being delegated, delegated and failed counts, and p50/p95/p99 of
+            recent queue wait times in seconds (None before any dispatch)
+        """
+        stats = self.dispatcher.stats()
+        stats['queued_by_priority'] = {
+            TaskPriority(value).name: count
+            for value, count in sorted(stats['queued_by_priority'].items())
+        }
+        return stats
+    
+    @property
+    def notifications(self) -> CompletionWatcher:
+        """Completion watcher for wait_for_task(), created on first use."""
+        if self._watcher is None:
+            self._watcher = CompletionWatcher(self)
+        return self._watcher
+    
+    def wait_for_task(
+        self,
+        task_id: str,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Future:
+        """
+        Get notified when a task finishes, without polling it.
+        
+        The cloud agent's task events are followed with one long-poll
+        request for all watched tasks (see CompletionWatcher); without an
+        event endpoint the statuses of watched tasks are polled in bulk
+        with adaptive backoff. Task statuses in the queue are updated as
+        changes arrive.
+        
+        Args:
+            task_id: ID of the task to wait for
+            callback: Called with the final status information when the
+                task is completed, failed or cancelled
+            
+        Returns:
+            Future: Resolves to the task's final status information
+            
+        Raises:
+            ConnectionError: If client not connected
+            ValueError: If task_id not found in queue
+        """
+        if not self.client.is_connected():
+            raise ConnectionError("Client not connected to cloud agent")
+        
+        future = self.notifications.watch(task_id)
+        if callback is not None:
+            future.add_done_callback(lambda f: f.cancelled() or callback(f.result()))
+        return future
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the dispatch workers after delegating the tasks already queued,
+        and stop watching for task completions (pending wait_for_task
+        futures are cancelled).
+        
+        Args:
+            wait: Block until queued tasks have been delegated
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait)
+        if self._watcher is not None:
+            self._watcher.stop()
+    
+    def _prepare_task(self, task_type: str, task_data: Dict[str, Any],
+                      priority: TaskPriority) -> Dict[str, Any]:
+        """
+        Validate a task and add its priority to the task data.
+        
+        Raises:
+            ValueError: If task_type is empty, task_data is not a dict or
+                priority is not a TaskPriority
+        """
         # Validate inputs
         if not task_type or not isinstance(task_type, str):
             raise ValueError("task_type must be a non-empty string")
         if not isinstance(task_data, dict):
             raise ValueError("task_data must be a dictionary")
+        if not isinstance(priority, TaskPriority):
+            raise ValueError("priority must be a TaskPriority")
         
         # Add priority to task data
-        enriched_data = {
+        return {
             **task_data,
             'priority': priority.value
         }
+    
+    def _track_task(self, task_type: str, priority: TaskPriority,
+                    response: Dict[str, Any]) -> str:
+        """Add a submitted task to the queue and return its ID."""
+        task_id = response.get('task_id')
+        with self._lock:
+            self.task_queue.add({
+                'task_id': task_id,
+                'task_type': task_type,
+                'priority': priority,
+                'status': response.get('status', 'unknown')
+            })
+        return task_id
+    
+    def _submit_batch(self, batch: List[Tuple[str, Dict[str, Any], TaskPriority]]) -> List[str]:
+        """
+        Submit one micro-batch and track its tasks.
         
-        # Submit task through client
-        response = self.client.send_task(task_type, enriched_data)
+        Falls back to parallel single submissions (at most
+        config.max_in_flight at once) when the cloud agent has no batch
+        endpoint. If some of those fail, the others are still tracked and
+        the first error is raised.
         
-        # Track task in queue
-        task_id = response.get('task_id')
-        self.task_queue.append({
-            'task_id': task_id,
-            'task_type': task_type,
-            'priority': priority,
-            'status': response.get('status', 'unknown')
-        })
+        Returns:
+            list: Task IDs in batch order
+        """
+        responses: List[Optional[Dict[str, Any]]] = []
+        error = None
+        if self.batch_supported:
+            try:
+                responses = self.client.send_tasks([(t, data) for t, data, _ in batch])
+                self.batches_sent += 1
+            except EndpointNotSupported:
+                self.batch_supported = False
+        if not self.batch_supported:
+            responses = self._parallel(self.client.send_task, [(t, data) for t, data, _ in batch])
+            error = next((r for r in responses if isinstance(r, Exception)), None)
+            responses = [None if isinstance(r, Exception) else r for r in responses]
         
-        return task_id
+        task_ids = [
+            self._track_task(task_type, priority, response)
+            for (task_type, _, priority), response in zip(batch, responses)
+            if response is not None
+        ]
+        if error:
+            raise error
+        return task_ids
+    
+    def _parallel(self, function: Callable, calls: List[Tuple]) -> List[Any]:
+        """
+        Run client calls on a thread pool (at most config.max_in_flight at once).
+        
+        Args:
+            function: Client method to call
+            calls: Argument tuples, one per call
+            
+        Returns:
+            list: Result or raised exception of each call, in call order
+        """
+        if not calls:
+            return []
+        results: List[Any] = []
+        workers = min(self.client.config.max_in_flight, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(function, *args) for args in calls]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
     
     def get_queue_status(self) -> List[Dict[str, Any]]:
         """
@@ -106,20 +414,15 @@ class DelegationService:
             raise ConnectionError("Client not connected to cloud agent")
         
         # Find task in queue
-        task_index = None
-        for i, task in enumerate(self.task_queue):
-            if task['task_id'] == task_id:
-                task_index = i
-                break
-        
-        if task_index is None:
+        task = self.task_queue.get(task_id)
+        if task is None:
             raise ValueError(f"Task {task_id} not found in queue")
         
         # Get updated status from cloud agent
         status_response = self.client.get_task_status(task_id)
         
         # Update task in queue
-        self.task_queue[task_index]['status'] = status_response.get('status', 'unknown')
+        task['status'] = status_response.get('status', 'unknown')
         
         return status_response
     
@@ -127,6 +430,12 @@ class DelegationService:
         """
         Refresh status of all tasks in queue from the cloud agent.
         
+        Statuses are fetched in bulk with GET /tasks?ids=..., the IDs split
+        into chunks of at most STATUS_QUERY_LENGTH characters that are
+        requested in parallel. If the cloud agent has no bulk endpoint,
+        each task is requested with GET /tasks/{task_id} in parallel
+        instead. Tasks that fail to refresh keep their previous status.
+        
         Returns:
             list: List of updated task status information
             
@@ -136,18 +445,67 @@ class DelegationService:
         if not self.client.is_connected():
             raise ConnectionError("Client not connected to cloud agent")
         
-        updated_statuses = []
-        for task in self.task_queue:
-            try:
-                status = self.refresh_task_status(task['task_id'])
-                updated_statuses.append(status)
-            except (ConnectionError, ValueError, Exception) as e:
-                # Skip tasks that fail to refresh due to connection, validation, or HTTP errors
-                # Log error but continue processing other tasks
-                continue
-        
+        task_ids = [
+            task['task_id'] for task in self.task_queue
+            if task['task_id'] and isinstance(task['task_id'], str)
+        ]
+        updated_statuses, _ = self._apply_statuses(self._fetch_statuses(task_ids))
         return updated_statuses
     
+    def _fetch_statuses(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch statuses in bulk (see refresh_all_statuses) without applying them.
+        
+        Returns:
+            list: Status information of the tasks that could be fetched
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        responses = []
+        if self.bulk_status_supported:
+            results = self._parallel(self.client.get_task_statuses, [(c,) for c in self._chunks(task_ids)])
+            if any(isinstance(r, EndpointNotSupported) for r in results):
+                self.bulk_status_supported = False
+            else:
+                # Skip chunks that fail due to connection or HTTP errors
+                responses = [s for r in results if isinstance(r, list) for s in r]
+        if not self.bulk_status_supported:
+            results = self._parallel(self.client.get_task_status, [(task_id,) for task_id in task_ids])
+            responses = [r for r in results if isinstance(r, dict)]
+        return responses
+    
+    def _apply_statuses(self, statuses: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Update queued tasks from status information.
+        
+        Returns:
+            (statuses of tasks in the queue, number of tasks whose status changed)
+        """
+        updated_statuses = []
+        changed = 0
+        with self._lock:
+            for status in statuses:
+                task = self.task_queue.get(status.get('task_id'))
+                if task is not None:
+                    new_status = status.get('status', 'unknown')
+                    if task['status'] != new_status:
+                        task['status'] = new_status
+                        changed += 1
+                    updated_statuses.append(status)
+        return updated_statuses, changed
+    
+    @staticmethod
+    def _chunks(task_ids: List[str]) -> List[List[str]]:
+        """Split task IDs into bulk status queries of at most STATUS_QUERY_LENGTH characters."""
+        chunks: List[List[str]] = []
+        length = STATUS_QUERY_LENGTH
+        for task_id in task_ids:
+            if length + len(task_id) + 1 > STATUS_QUERY_LENGTH:
+                chunks.append([])
+                length = 0
+            chunks[-1].append(task_id)
+            length += len(task_id) + 1
+        return chunks
+    
     def clear_completed_tasks(self) -> int:
         """
         Remove completed, failed, and cancelled tasks from queue.
@@ -158,9 +516,7 @@ class DelegationService:
         Returns:
             int: Number of tasks removed
         """
-        initial_count = len(self.task_queue)
-        self.task_queue = [
-            task for task in self.task_queue 
-            if task['status'] not in ('completed', 'failed', 'cancelled')
-        ]
-        return initial_count - len(self.task_queue)
+        finished = self.task_queue.with_status(*FINISHED_STATUSES)
+        for task in finished:
+            self.task_queue.remove(task)
+        return len(finished)
@@ -0,0 +1,192 @@
+"""
+Task Dispatch Module
+
+Local priority queue and worker pool that submits delegated tasks under a
+request rate and concurrency budget.
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+WAIT_SAMPLES = 1000  # Recent queue wait times kept for percentiles
+
+
+class TaskDispatcher:
+    """
+    Priority queue drained by a pool of worker threads.
+
+    Queued calls run in order of priority, then submission time. A waiting
+    call gains one priority level every `aging` seconds, so low priority
+    work is delayed by newer higher priority work but never starved. Urgent
+    calls (CRITICAL tasks) go ahead of every queued non-urgent call however
+    long it has waited. At most `rate` calls start per second and at most
+    `workers` run at once.
+    """
+
+    def __init__(self, workers: int, rate: float = 0.0, aging: float = 30.0):
+        """
+        Initialize the dispatcher; worker threads start on the first submit.
+
+        Args:
+            workers: Number of worker threads (concurrency budget)
+            rate: Maximum calls started per second (0 for no limit)
+            aging: Seconds of waiting worth one priority level
+
+        Raises:
+            ValueError: If workers < 1, rate < 0 or aging <= 0
+        """
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if rate < 0:
+            raise ValueError("rate cannot be negative")
+        if aging <= 0:
+            raise ValueError("aging must be positive")
+        self.workers = workers
+        self.rate = rate
+        self.aging = aging
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._next_start = 0.0
+        self._closed = False
+        self._queued: Dict[int, int] = {}
+        self._waits: deque = deque(maxlen=WAIT_SAMPLES)
+        self.in_flight = 0
+        self.max_depth = 0
+        self.dispatched = 0
+        self.failed = 0
+
+    def submit(self, function: Callable, args: Sequence = (), priority: int = 0,
+               urgent: bool = False) -> Future:
+        """
+        Queue a call.
+
+        Args:
+            function: Callable run on a worker thread
+            args: Positional arguments for the call
+            priority: Priority level (higher runs first)
+            urgent: Run before all non-urgent calls regardless of their age
+
+        Returns:
+            Future: Resolves to the call's result or exception
+
+        Raises:
+            RuntimeError: If the dispatcher has been shut down
+        """
+        future: Future = Future()
+        now = time.monotonic()
+        key = (not urgent, now - priority * self.aging, next(self._sequence))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Dispatcher has been shut down")
+            heapq.heappush(self._heap, (key, now, priority, function, args, future))
+            self._queued[priority] = self._queued.get(priority, 0) + 1
+            self.max_depth = max(self.max_depth, len(self._heap))
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, daemon=True,
+                                          name=f"task-dispatch-{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+        return future
+
+    def shutdown(self, wait: bool = True, cancel: bool = False) -> None:
+        """
+        Stop accepting calls; workers exit once the queue is empty.
+
+        Args:
+            wait: Block until queued and running calls have finished
+            cancel: Cancel queued calls instead of running them
+        """
+        with self._condition:
+            self._closed = True
+            if cancel:
+                for entry in self._heap:
+                    entry[-1].cancel()
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _work(self) -> None:
+        """Worker loop: take the most urgent call when the rate budget allows."""
+        while True:
+            with self._condition:
+                while True:
+                    while self._heap and self._heap[0][-1].cancelled():
+                        self._dequeue()
+                    if not self._heap:
+                        if self._closed:
+                            return
+                        self._condition.wait()
+                        continue
+                    now = time.monotonic()
+                    delay = self._next_start - now
+                    if delay <= 0:
+                        break
+                    # Re-check after waiting: a more urgent call may have arrived
+                    self._condition.wait(delay)
+                if self.rate:
+                    self._next_start = max(self._next_start, now) + 1.0 / self.rate
+                queued_at, function, args, future = self._dequeue()
+                self._waits.append(now - queued_at)
+                self.in_flight += 1
+            succeeded = None
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(function(*args))
+                    succeeded = True
+                except Exception as e:
+                    future.set_exception(e)
+                    succeeded = False
+            with self._condition:
+                self.in_flight -= 1
+                if succeeded is not None:
+                    self.dispatched += succeeded
+                    self.failed += not succeeded
+
+    def _dequeue(self) -> tuple:
+        """Pop the head of the queue (caller holds the lock)."""
+        _, queued_at, priority, function, args, future = heapq.heappop(self._heap)
+        self._queued[priority] -= 1
+        if not self._queued[priority]:
+            del self._queued[priority]
+        return queued_at, function, args, future
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with queue depth (total, per priority and peak), calls
+            running, finished and failed, and p50/p95/p99 of recent queue
+            wait times in seconds
+        """
+        with self._condition:
+            waits = sorted(self._waits)
+            stats = {
+                'queued': len(self._heap),
+                'queued_by_priority': dict(self._queued),
+                'max_depth': self.max_depth,
+                'in_flight': self.in_flight,
+                'dispatched': self.dispatched,
+                'failed': self.failed,
+            }
+        for q in (50, 95, 99):
+            stats[f'wait_p{q}'] = _percentile(waits, q)
+        return stats
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values (None if empty)."""
+    if not values:
+        return None
+    rank = max(math.ceil(q / 100.0 * len(values)) - 1, 0)
+    return values[rank]
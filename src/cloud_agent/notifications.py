@@ -0,0 +1,189 @@
+"""
+Completion Notification Module
+
+Resolves futures when delegated tasks finish, from the cloud agent's task
+event stream (long polling) or, where that is not available, by polling
+task statuses with adaptive backoff.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from .client import EndpointNotSupported
+from .task_store import FINISHED_STATUSES
+
+LONG_POLL_SEC = 25.0  # Longest the cloud agent holds a GET /tasks/events request
+POLL_MIN_SEC = 0.5    # Fallback poll interval after a status change
+POLL_MAX_SEC = 30.0   # Fallback poll interval ceiling while nothing changes
+
+
+class CompletionWatcher:
+    """
+    Background thread resolving per-task futures as tasks finish.
+
+    While any future is pending, the watcher long-polls GET /tasks/events
+    and applies each status change to the delegation service's queue, so
+    one open request covers every outstanding task. On start it fetches the
+    statuses of unfinished queued tasks once, to catch completions from
+    before its first event. If the cloud agent has no event endpoint, the
+    watcher polls the statuses of watched tasks in bulk instead, every
+    poll_min seconds after a change and backing off (doubling) to poll_max
+    while nothing changes.
+    """
+
+    def __init__(self, service, long_poll: float = LONG_POLL_SEC,
+                 poll_min: float = POLL_MIN_SEC, poll_max: float = POLL_MAX_SEC):
+        """
+        Initialize the watcher; its thread starts with the first watch().
+
+        Args:
+            service: DelegationService whose tasks are watched
+            long_poll: Seconds the cloud agent may hold each event request
+            poll_min: Shortest fallback poll interval in seconds
+            poll_max: Longest fallback poll interval in seconds
+        """
+        self.service = service
+        self.long_poll = long_poll
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.interval = poll_min
+        self.events_supported = True  # Cleared when the cloud agent lacks /tasks/events
+        self.requests = 0
+        self._futures: Dict[str, Future] = {}
+        self._cursor: Optional[str] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._registered = False
+
+    def watch(self, task_id: str) -> Future:
+        """
+        Get a future for a task's completion.
+
+        Args:
+            task_id: ID of a task in the service's queue
+
+        Returns:
+            Future: Resolves to the task's final status information once
+            its status is completed, failed or cancelled
+
+        Raises:
+            ValueError: If task_id not found in queue
+            RuntimeError: If the watcher has been stopped
+        """
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("Completion watcher has been stopped")
+            task = self.service.task_queue.get(task_id)
+            if task is None:
+                raise ValueError(f"Task {task_id} not found in queue")
+            if task['status'] in FINISHED_STATUSES and self._cursor is not None:
+                # The queue is current while events are being followed
+                future: Future = Future()
+                future.set_result({'task_id': task_id, 'status': task['status']})
+                return future
+            future = self._futures.get(task_id)
+            if future is None:
+                future = self._futures[task_id] = Future()
+            self._registered = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="task-completion")
+                self._thread.start()
+            self._condition.notify_all()
+        return future
+
+    def stop(self) -> None:
+        """Stop watching and cancel pending futures (an open long poll finishes in the background)."""
+        with self._condition:
+            self._stopped = True
+            futures, self._futures = list(self._futures.values()), {}
+            self._condition.notify_all()
+        for future in futures:
+            future.cancel()
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks being watched."""
+        return len(self._futures)
+
+    def _run(self) -> None:
+        """Watcher loop."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._futures or self._stopped)
+                if self._stopped:
+                    return
+            if self.events_supported:
+                try:
+                    self._listen()
+                    continue
+                except EndpointNotSupported:
+                    self.events_supported = False
+                except Exception:
+                    # Connection or HTTP error: re-sync after the backoff interval
+                    self._cursor = None
+                    self._sleep(self.interval)
+                    self.interval = min(self.interval * 2, self.poll_max)
+                    continue
+            self._poll()
+
+    def _listen(self) -> None:
+        """Wait for the next task events and apply them."""
+        client = self.service.client
+        if self._cursor is None:
+            self.requests += 1
+            cursor = client.get_task_events(None, 0.0).get('cursor')
+            unfinished = [
+                task['task_id'] for task in self.service.task_queue
+                if task['status'] not in FINISHED_STATUSES and isinstance(task['task_id'], str)
+            ]
+            self._apply(self.service._fetch_statuses(unfinished))
+            with self._condition:
+                self._cursor = cursor
+            # Watched tasks that finished before the cursor were resolved above
+            self._apply([
+                {'task_id': task['task_id'], 'status': task['status']}
+                for task in self.service.task_queue if task['task_id'] in self._futures
+            ])
+        self.requests += 1
+        response = client.get_task_events(self._cursor, self.long_poll)
+        self._apply(response.get('events', []))
+        self._cursor = response.get('cursor', self._cursor)
+        self.interval = self.poll_min
+
+    def _poll(self) -> None:
+        """Poll the statuses of watched tasks once, then wait the backoff interval."""
+        with self._condition:
+            task_ids = list(self._futures)
+        self.requests += 1
+        changed = self._apply(self.service._fetch_statuses(task_ids))
+        self.interval = self.poll_min if changed else min(self.interval * 2, self.poll_max)
+        self._sleep(self.interval)
+
+    def _sleep(self, seconds: float) -> None:
+        """Wait, waking early when stopped or when new tasks are watched."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._stopped or self._registered, timeout=seconds)
+            if self._registered:
+                self.interval = self.poll_min
+                self._registered = False
+
+    def _apply(self, statuses: List[Dict[str, Any]]) -> int:
+        """
+        Apply status information to the queue and resolve finished tasks' futures.
+
+        Returns:
+            Number of queued tasks whose status changed
+        """
+        with self._condition:
+            _, changed = self.service._apply_statuses(statuses)
+            finished = [
+                (self._futures.pop(status['task_id']), status) for status in statuses
+                if status.get('status') in FINISHED_STATUSES and status.get('task_id') in self._futures
+            ]
+        for future, status in finished:
+            # Skip futures cancelled by the caller
+            if future.set_running_or_notify_cancel():
+                future.set_result(status)
+        return changed + len(finished)
@@ -0,0 +1,197 @@
+"""
+Task Store Module
+
+Indexed storage for the delegation service's task queue.
+"""
+
+from typing import Any, Dict, Hashable, Iterator, List, Optional
+
+INDEXED_FIELDS = ('status', 'priority')  # Fields with secondary indexes
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')  # Statuses that no longer change
+
+
+class TaskRecord(dict):
+    """
+    Task dictionary that keeps its store's indexes current.
+
+    Setting 'status' or 'priority' (e.g. task_queue[0]['status'] = 'completed')
+    moves the record between index buckets; deleting either field moves the
+    record to the None bucket.
+    """
+
+    def __init__(self, store: 'TaskStore', key: int, fields: Dict[str, Any]):
+        super().__init__(fields)
+        self._store = store
+        self._key = key
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field in INDEXED_FIELDS and self._store is not None:
+            self._store._reindex(self, field, value)
+        super().__setitem__(field, value)
+
+    def __delitem__(self, field: str) -> None:
+        if field in INDEXED_FIELDS and field in self and self._store is not None:
+            self._store._reindex(self, field, None)
+        super().__delitem__(field)
+
+    def update(self, *args, **kwargs) -> None:
+        for field, value in dict(*args, **kwargs).items():
+            self[field] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, field: str, default: Any = None) -> Any:
+        if field not in self:
+            self[field] = default
+        return self[field]
+
+    def pop(self, field: str, *default):
+        if field in self:
+            value = self[field]
+            del self[field]
+            return value
+        return super().pop(field, *default)
+
+    def popitem(self):
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+        field = next(reversed(self))
+        return field, self.pop(field)
+
+    def clear(self) -> None:
+        for field in INDEXED_FIELDS:
+            self.pop(field, None)
+        super().clear()
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class TaskStore:
+    """
+    Insertion-ordered task records indexed by task ID, status and priority.
+
+    Behaves like the list of task dicts it replaces (len(), iteration,
+    store[i], copy()), with O(1) lookup by task ID and O(1) access to the
+    tasks in a given status or priority. If the cloud agent returns the same
+    task ID twice, both records are kept and lookup returns the newest.
+
+    Records live in a list; remove() leaves a hole that is compacted away
+    once holes make up half the list, or on the next positional access.
+    Iteration walks the list without copying it, and sees records added
+    while it runs.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._rows: List[Optional[TaskRecord]] = []
+        self._size = 0
+        self._by_id: Dict[Any, int] = {}
+        self._indexes: Dict[str, Dict[Hashable, Dict[int, None]]] = {field: {} for field in INDEXED_FIELDS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[TaskRecord]:
+        return (record for record in self._rows if record is not None)
+
+    def __getitem__(self, index):
+        if self._size != len(self._rows):
+            self._compact()
+        return self._rows[index]
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._by_id
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def copy(self) -> List[TaskRecord]:
+        """Records in insertion order, as a list."""
+        return list(self)
+
+    def add(self, task: Dict[str, Any]) -> TaskRecord:
+        """
+        Add a task.
+
+        Args:
+            task: Task dict with at least 'task_id', 'status' and 'priority'
+
+        Returns:
+            TaskRecord: The stored record
+        """
+        key = len(self._rows)
+        record = TaskRecord(self, key, task)
+        self._rows.append(record)
+        self._size += 1
+        self._by_id[record.get('task_id')] = key
+        for field in INDEXED_FIELDS:
+            self._indexes[field].setdefault(record.get(field), {})[key] = None
+        return record
+
+    def get(self, task_id: str) -> Optional[TaskRecord]:
+        """Record for a task ID, or None."""
+        key = self._by_id.get(task_id)
+        return None if key is None else self._rows[key]
+
+    def remove(self, record: TaskRecord) -> None:
+        """Remove a record returned by add(), get() or iteration."""
+        if record._store is not self:
+            return
+        key = record._key
+        self._rows[key] = None
+        self._size -= 1
+        if self._by_id.get(record.get('task_id')) == key:
+            del self._by_id[record.get('task_id')]
+        for field in INDEXED_FIELDS:
+            bucket = self._indexes[field][record.get(field)]
+            del bucket[key]
+            if not bucket:
+                del self._indexes[field][record.get(field)]
+        record._store = None
+        if self._size * 2 < len(self._rows):
+            self._compact()
+
+    def with_status(self, *statuses: str) -> List[TaskRecord]:
+        """Records in any of the given statuses, in insertion order within each status."""
+        return self._lookup('status', statuses)
+
+    def with_priority(self, *priorities: Hashable) -> List[TaskRecord]:
+        """Records with any of the given priorities, in insertion order within each priority."""
+        return self._lookup('priority', priorities)
+
+    def count_by(self, field: str) -> Dict[Hashable, int]:
+        """Number of records per value of an indexed field."""
+        return {value: len(keys) for value, keys in self._indexes[field].items()}
+
+    def _lookup(self, field: str, values) -> List[TaskRecord]:
+        index = self._indexes[field]
+        return [self._rows[key] for value in values for key in index.get(value, ())]
+
+    def _compact(self) -> None:
+        """Close the holes left by remove() and renumber the record keys."""
+        rows = [record for record in self._rows if record is not None]
+        keys = {record._key: key for key, record in enumerate(rows)}
+        for key, record in enumerate(rows):
+            record._key = key
+        self._by_id = {task_id: keys[key] for task_id, key in self._by_id.items()}
+        for field, index in self._indexes.items():
+            self._indexes[field] = {
+                value: {keys[key]: None for key in bucket} for value, bucket in index.items()
+            }
+        # Swap in a new list so running iterations finish over the old one
+        self._rows = rows
+
+    def _reindex(self, record: TaskRecord, field: str, value: Any) -> None:
+        """Move a record to another bucket of an index before its field changes."""
+        old = record.get(field)
+        if old == value or record._store is not self:
+            return
+        index = self._indexes[field]
+        bucket = index[old]
+        del bucket[record._key]
+        if not bucket:
+            del index[old]
+        index.setdefault(value, {})[record._key] = None
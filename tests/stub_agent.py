@@ -0,0 +1,154 @@
+"""
+In-process stub cloud agent for client and delegation tests
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler delegating to the server's StubCloudAgent."""
+
+    protocol_version = 'HTTP/1.1'  # Keep connections alive
+
+    def setup(self):
+        super().setup()
+        self.server.agent.connected()
+
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, method):
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        status, payload = self.server.agent.handle(method, url.path, parse_qs(url.query), body, self.headers)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def do_POST(self):
+        self.respond('POST')
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+
+class StubCloudAgent:
+    """
+    In-process cloud agent speaking the client's REST API.
+
+    Tasks are kept in memory; counters record connections, requests per
+    route and the peak number of requests being handled at once.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Start the server on a free local port.
+
+        Args:
+            delay: Seconds each task request is held before answering
+        """
+        self.delay = delay
+        self.tasks = {}
+        self.failures = 0  # Answer this many upcoming requests with 503
+        self.connections = 0
+        self.requests = Counter()
+        self.active = 0
+        self.max_active = 0
+        self.headers = None
+        self.batch = True  # Serve POST /tasks/batch
+        self.bulk = True   # Serve GET /tasks?ids=
+        self.streaming = True  # Serve GET /tasks/events
+        self.events = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self.server = StubServer(('127.0.0.1', 0), StubHandler)
+        self.server.agent = self
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def connected(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def handle(self, method, path, query, body, headers):
+        """Route one request; returns (status, JSON payload)."""
+        route = f"{method} {path if path in ('/health', '/tasks', '/tasks/batch', '/tasks/events') else path.rsplit('/', 1)[0] + '/{id}'}"
+        with self._lock:
+            self.requests[route] += 1
+            self.headers = headers
+            if self.failures:
+                self.failures -= 1
+                return 503, {'error': 'unavailable'}
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay and path != '/health':
+                time.sleep(self.delay)
+            return self.route(method, path, query, body)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def set_status(self, task_id, status):
+        """Change a task's status and publish the change as an event."""
+        with self._changed:
+            self.tasks[task_id]['status'] = status
+            self.events.append({'task_id': task_id, 'status': status})
+            self._changed.notify_all()
+
+    def create(self, task):
+        task_id = f"task-{next(self._ids)}"
+        with self._lock:
+            self.tasks[task_id] = {'task_id': task_id, 'status': 'submitted', **task}
+        return {'task_id': task_id, 'status': 'submitted'}
+
+    def route(self, method, path, query, body):
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if method == 'POST' and path == '/tasks':
+            return 200, self.create(body)
+        if method == 'POST' and path == '/tasks/batch' and self.batch:
+            return 200, {'tasks': [self.create(task) for task in body['tasks']]}
+        if method == 'GET' and path == '/tasks' and self.bulk:
+            ids = query.get('ids', [''])[0].split(',')
+            return 200, {'tasks': [
+                {'task_id': task_id, 'status': self.tasks[task_id]['status']}
+                for task_id in ids if task_id in self.tasks
+            ]}
+        if method == 'GET' and path == '/tasks/events' and self.streaming:
+            if 'since' not in query:
+                return 200, {'events': [], 'cursor': str(len(self.events))}
+            since = int(query['since'][0])
+            with self._changed:
+                self._changed.wait_for(lambda: len(self.events) > since, timeout=float(query['wait'][0]))
+                return 200, {'events': self.events[since:], 'cursor': str(len(self.events))}
+        if method == 'GET' and path.startswith('/tasks/') and path != '/tasks/events':
+            task = self.tasks.get(path[len('/tasks/'):])
+            if task is None:
+                return 404, {'error': 'not found'}
+            return 200, {'task_id': task['task_id'], 'status': task['status']}
+        return 404, {'error': 'not found'}
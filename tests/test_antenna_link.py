@@ -0,0 +1,223 @@
+"""
+Tests for the antenna controller serial link
+"""
+
+import os
+import sys
+import threading
+import time
+import tty
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'ground-station'))
+
+from antenna_link import AntennaLink, CommandQueue  # noqa: E402
+from protocol import (FRAME_GOTO, FRAME_SIZE, FRAME_STOP, FrameDecoder,  # noqa: E402
+                      FrameEncoder, decode_command, decode_position)
+from trajectory import TrajectorySegment  # noqa: E402
+
+
+class FakeController:
+    """Fake firmware on the master side of a pty: records lines, sends reports."""
+
+    def __init__(self):
+        self.master, slave = os.openpty()
+        tty.setraw(slave)
+        self.port = os.ttyname(slave)
+        self._slave = slave
+        self.lines = []
+        self.raw = b''
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        buffer = b''
+        while self._running:
+            try:
+                data = os.read(self.master, 1024)
+            except OSError:
+                break
+            self.raw += data
+            buffer += data
+            *lines, buffer = buffer.split(b'\n')
+            self.lines.extend(line.decode('ascii', 'replace') for line in lines)
+
+    def report(self, data):
+        os.write(self.master, data.encode() if isinstance(data, str) else bytes(data))
+
+    def wait_for(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while len(self.lines) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.lines
+
+    def close(self):
+        self._running = False
+        os.close(self._slave)
+        os.close(self.master)
+
+
+class TestCommandQueue(unittest.TestCase):
+    """Test cases for the coalescing command queue."""
+
+    def test_new_target_replaces_pending(self):
+        """Test that only the latest unsent target is sent."""
+        queue = CommandQueue()
+        for azimuth in range(10):
+            queue.put_target(float(azimuth), 45.0)
+        queue.put_command("HOME")
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.coalesced, 9)
+        self.assertEqual(queue.take(0), ("HOME",))
+        self.assertEqual(queue.take(0), ("GOTO", 9.0, 45.0))
+        self.assertIsNone(queue.take(0))
+
+    def test_urgent_command_jumps_queue(self):
+        """Test that an emergency stop goes first and cancels the target."""
+        queue = CommandQueue()
+        queue.put_command("HOME")
+        queue.put_target(10.0, 20.0)
+        queue.put_command("STOP", urgent=True)
+        self.assertEqual(queue.take(0), ("STOP",))
+        self.assertEqual(queue.take(0), ("HOME",))
+        self.assertIsNone(queue.take(0))
+
+
+class TestAntennaLink(unittest.TestCase):
+    """Test cases for the serial link against a pty fake controller."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.controller = FakeController()
+        self.positions = []
+        self.link = AntennaLink(self.controller.port, on_position=lambda az, el: self.positions.append((az, el)))
+        self.link.open()
+        self.addCleanup(self.controller.close)
+        self.addCleanup(self.link.close)
+
+    def test_sends_commands(self):
+        """Test that targets and control commands reach the controller."""
+        self.link.set_target(123.4567, 45.0)
+        self.controller.wait_for(1)
+        self.link.stop()
+        lines = self.controller.wait_for(2)
+        self.assertEqual(lines, ["GOTO 123.457 45.000", "STOP"])
+
+    def test_parses_reports_without_blocking(self):
+        """Test that split and garbage lines are handled by the reader thread."""
+        start = time.monotonic()
+        self.link.set_target(1.0, 2.0)
+        self.assertLess(time.monotonic() - start, 0.01)
+
+        self.controller.report("Position: Az=12.50 El=")
+        self.controller.report("30.25\r\nnoise\nERROR: 2\nPosition: Az=13.00 El=31.00\n")
+        deadline = time.monotonic() + 2.0
+        while self.link.reports < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.positions, [(12.5, 30.25), (13.0, 31.0)])
+        self.assertEqual(self.link.position, (13.0, 31.0))
+        self.assertEqual(self.link.last_error, 2)
+        self.assertEqual(self.link.stats()['discarded'], 1)
+
+    def test_open_failure(self):
+        """Test that a missing port raises ConnectionError."""
+        with self.assertRaises(ConnectionError):
+            AntennaLink('/dev/does-not-exist').open()
+
+
+class TestBinaryProtocol(unittest.TestCase):
+    """Test cases for binary frame encoding and decoding."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.encoder = FrameEncoder()
+        self.frames = []
+        self.decoder = FrameDecoder(lambda t, seq, payload: self.frames.append((t, seq, bytes(payload))))
+
+    def test_round_trip_byte_by_byte(self):
+        """Test that frames split across reads decode with sequence numbers."""
+        stream = bytes(self.encoder.goto(123.5, 45.25, 0.5)) + bytes(self.encoder.control(FRAME_STOP))
+        self.assertEqual(len(stream), 2 * FRAME_SIZE)
+        for i in range(len(stream)):
+            self.decoder.feed(stream[i:i + 1])
+        self.assertEqual([(t, seq) for t, seq, _ in self.frames], [(FRAME_GOTO, 0), (FRAME_STOP, 1)])
+        self.assertEqual(decode_command(self.frames[0][2]), (123.5, 45.25, 0.5))
+
+    def test_resync_after_noise_and_corruption(self):
+        """Test that garbage and bad CRCs are skipped."""
+        good = bytes(self.encoder.position(10.0, 20.0, 1234))
+        corrupt = bytearray(self.encoder.position(11.0, 21.0, 1235))
+        corrupt[6] ^= 0xFF
+        later = bytes(self.encoder.position(12.0, 22.0, 1236))
+        self.decoder.feed(b'\xa5noise' + good + bytes(corrupt) + later)
+        self.assertEqual([decode_position(payload) for _, _, payload in self.frames],
+                         [(10.0, 20.0, 1234), (12.0, 22.0, 1236)])
+        self.assertEqual(self.decoder.crc_errors, 1)
+        self.assertEqual(self.decoder.sequence_gaps, 1)
+
+    def test_encoder_reuses_buffer(self):
+        """Test that encoding does not allocate a new frame buffer."""
+        first = self.encoder.goto(1.0, 2.0)
+        second = self.encoder.goto(3.0, 4.0)
+        self.assertIs(first.obj, second.obj)
+        self.assertEqual(decode_command(second[4:16])[:2], (3.0, 4.0))
+
+
+class TestBinaryAntennaLink(unittest.TestCase):
+    """Test cases for the serial link in binary mode."""
+
+    def test_binary_session(self):
+        """Test mode switch, framed commands and framed position reports."""
+        controller = FakeController()
+        self.addCleanup(controller.close)
+        link = AntennaLink(controller.port, protocol='binary')
+        link.open()
+        self.addCleanup(link.close)
+        link.set_target(200.0, 30.0)
+        deadline = time.monotonic() + 2.0
+        while len(controller.raw) < 7 + FRAME_SIZE and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(controller.raw.startswith(b'BINARY\n'))
+        received = []
+        FrameDecoder(lambda t, seq, payload: received.append((t, decode_command(payload)))).feed(controller.raw[7:])
+        self.assertEqual(received, [(FRAME_GOTO, (200.0, 30.0, 1.0))])
+
+        controller.report(FrameEncoder().position(199.5, 29.5, 42))
+        while link.reports < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(link.position, (199.5, 29.5))
+        self.assertEqual(link.stats()['crc_errors'], 0)
+
+    def test_unencodable_command_is_dropped(self):
+        """Test that a command that fails to encode does not stop the writer."""
+        controller = FakeController()
+        self.addCleanup(controller.close)
+        link = AntennaLink(controller.port, protocol='binary')
+        link.open()
+        self.addCleanup(link.close)
+        # Rates beyond the int16 millidegree range cannot be packed
+        link.clock_sync.observe(time.time(), 1000)
+        knots, rates = np.zeros(2, dtype=np.float32), np.full(2, 100.0)
+        link.upload_trajectory(TrajectorySegment(0, time.time(), 1.0, knots, knots, rates, rates))
+        link.set_target(200.0, 30.0)
+        deadline = time.monotonic() + 2.0
+        while len(controller.raw) < 7 + FRAME_SIZE and time.monotonic() < deadline:
+            time.sleep(0.01)
+        received = []
+        FrameDecoder(lambda t, seq, payload: received.append(t)).feed(controller.raw[7:])
+        self.assertEqual(received, [FRAME_GOTO])
+        self.assertEqual(link.stats()['encode_errors'], 1)
+        self.assertTrue(all(thread.is_alive() for thread in link._threads))
+
+    def test_unknown_protocol(self):
+        """Test that an unknown protocol name is rejected."""
+        with self.assertRaises(ValueError):
+            AntennaLink('/dev/null', protocol='morse')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the asyncio Cloud Agent client against a local stub server
+"""
+
+import asyncio
+import unittest
+
+import aiohttp
+
+from src.cloud_agent import AsyncCloudAgentClient, CloudAgentConfig
+from tests.stub_agent import StubCloudAgent
+
+
+class TestAsyncCloudAgentClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncCloudAgentClient."""
+
+    def setUp(self):
+        """Start a stub cloud agent."""
+        self.agent = StubCloudAgent()
+        self.addCleanup(self.agent.stop)
+
+    def client(self, **options) -> AsyncCloudAgentClient:
+        return AsyncCloudAgentClient(CloudAgentConfig(endpoint=self.agent.endpoint, **options))
+
+    async def test_round_trip(self):
+        """Test connect, send_task, get_task_status and validation."""
+        client = self.client(api_key='test-key')
+        with self.assertRaises(ConnectionError):
+            await client.send_task('test_task', {})
+        self.assertTrue(await client.connect())
+        try:
+            self.assertEqual(self.agent.headers['Authorization'], 'Bearer test-key')
+            response = await client.send_task('test_task', {'data': 'test'})
+            self.assertEqual(response['status'], 'submitted')
+            self.agent.tasks[response['task_id']]['status'] = 'completed'
+            status = await client.get_task_status(response['task_id'])
+            self.assertEqual(status['status'], 'completed')
+            with self.assertRaises(ValueError):
+                await client.send_task('', {})
+            with self.assertRaises(ValueError):
+                await client.get_task_status('')
+            with self.assertRaises(aiohttp.ClientResponseError):
+                await client.get_task_status('missing')
+        finally:
+            await client.disconnect()
+        self.assertFalse(client.is_connected())
+
+        refused = AsyncCloudAgentClient(CloudAgentConfig(endpoint='http://127.0.0.1:9', timeout=2))
+        self.assertFalse(await refused.connect())
+        await refused.disconnect()
+
+    async def test_pooled_concurrency(self):
+        """Test that many tasks share a bounded set of keep-alive connections."""
+        self.agent.delay = 0.02
+        async with self.client(max_in_flight=16) as client:
+            responses = await asyncio.gather(*(client.send_task('test_task', {'n': i}) for i in range(200)))
+        self.assertEqual(len({r['task_id'] for r in responses}), 200)
+        self.assertEqual(client.max_in_flight_seen, 16)
+        self.assertLessEqual(self.agent.max_active, 16)
+        self.assertGreater(self.agent.max_active, 1)
+        self.assertLessEqual(self.agent.connections, 17)  # 16 plus the health check's
+
+    async def test_retry_on_server_error(self):
+        """Test that 5xx responses are retried up to max_retries."""
+        async with self.client(max_retries=1) as client:
+            self.agent.failures = 1
+            response = await client.send_task('test_task', {})
+            self.assertEqual(response['status'], 'submitted')
+            self.assertEqual(client.retries, 1)
+            self.agent.failures = 2
+            with self.assertRaises(aiohttp.ClientResponseError):
+                await client.send_task('test_task', {})
+
+
+if __name__ == '__main__':
+    unittest.main()
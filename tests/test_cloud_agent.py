@@ -2,10 +2,12 @@
 Tests for Cloud Agent Delegation Module
 """
 
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import requests
-from src.cloud_agent import CloudAgentClient, DelegationService, CloudAgentConfig
+from src.cloud_agent import CloudAgentClient, DelegationService, CloudAgentConfig, EndpointNotSupported
 from src.cloud_agent.delegation import TaskPriority
 
 
@@ -366,6 +368,90 @@ class TestDelegationService(unittest.TestCase):
         self.assertEqual(removed, 1)
         self.assertEqual(len(self.service.task_queue), 0)
 
+    
+    def test_delegate_tasks_batches(self):
+        """Test that delegate_tasks sends size-bounded batches and keeps input order."""
+        self.client.config.batch_size = 3
+        self.client._connected = True
+        self.client._session = Mock()
+        self.client.send_tasks = Mock(side_effect=lambda tasks: [
+            {'task_id': data['id'], 'status': 'submitted'} for _, data in tasks
+        ])
+        
+        tasks = [
+            {'task_type': 'signal_analysis', 'task_data': {'id': f'id{i}'}, 'priority': TaskPriority.HIGH}
+            for i in range(7)
+        ]
+        task_ids = self.service.delegate_tasks(tasks)
+        
+        self.assertEqual(task_ids, [f'id{i}' for i in range(7)])
+        self.assertEqual([len(c[0][0]) for c in self.client.send_tasks.call_args_list], [3, 3, 1])
+        self.assertEqual(self.client.send_tasks.call_args[0][0][0][1]['priority'], TaskPriority.HIGH.value)
+        self.assertEqual(len(self.service.task_queue), 7)
+        
+        # A slow producer flushes partial batches after the linger window
+        def slow_tasks():
+            for i in range(2):
+                time.sleep(0.03)
+                yield {'task_type': 'signal_analysis', 'task_data': {'id': f'slow{i}'}}
+        self.client.config.batch_linger = 0.01
+        self.assertEqual(self.service.delegate_tasks(slow_tasks()), ['slow0', 'slow1'])
+        self.assertEqual(self.client.send_tasks.call_count, 5)
+        
+        with self.assertRaises(ValueError):
+            self.service.delegate_tasks([{'task_type': '', 'task_data': {}}])
+        
+        # Tasks before an invalid one are still delegated
+        self.client.config.batch_linger = 10.0
+        calls = self.client.send_tasks.call_count
+        tasks = [{'task_type': 'signal_analysis', 'task_data': {'id': f'ok{i}'}} for i in range(2)]
+        with self.assertRaises(ValueError) as raised:
+            self.service.delegate_tasks(tasks + [{'task_type': 'signal_analysis', 'task_data': None}])
+        self.assertEqual(raised.exception.task_ids, ['ok0', 'ok1'])
+        self.assertEqual(self.client.send_tasks.call_count, calls + 1)
+        self.assertIsNotNone(self.service.task_queue.get('ok1'))
+        
+        # ...and so are those before an error from the iterable
+        def failing_tasks():
+            yield {'task_type': 'signal_analysis', 'task_data': {'id': 'ok2'}}
+            raise RuntimeError("producer failed")
+        with self.assertRaises(RuntimeError) as raised:
+            self.service.delegate_tasks(failing_tasks())
+        self.assertEqual(raised.exception.task_ids, ['ok2'])
+        self.assertIsNotNone(self.service.task_queue.get('ok2'))
+        
+        # An invalid task stops the feeder before it drains the producer
+        pulled = []
+        def endless_tasks():
+            yield 'not a task'
+            while True:
+                time.sleep(0.01)
+                pulled.append(len(pulled))
+                yield {'task_type': 'signal_analysis', 'task_data': {'id': 'never'}}
+        with self.assertRaises(ValueError):
+            self.service.delegate_tasks(endless_tasks())
+        count = len(pulled)
+        time.sleep(0.05)
+        self.assertEqual(len(pulled), count)
+        self.assertFalse(any(t.name == 'task-feeder' for t in threading.enumerate()))
+    
+    def test_delegate_tasks_fallback(self):
+        """Test parallel single submissions when the cloud agent lacks batch support."""
+        self.client._connected = True
+        self.client._session = Mock()
+        self.client.send_tasks = Mock(side_effect=EndpointNotSupported)
+        self.client.send_task = Mock(side_effect=lambda task_type, data: {
+            'task_id': data['id'], 'status': 'submitted'
+        })
+        
+        tasks = [{'task_type': 'satellite_tracking', 'task_data': {'id': f'id{i}'}} for i in range(5)]
+        self.assertEqual(self.service.delegate_tasks(tasks), [f'id{i}' for i in range(5)])
+        self.assertEqual(self.service.delegate_tasks(tasks[:2]), ['id0', 'id1'])
+        self.assertFalse(self.service.batch_supported)
+        self.client.send_tasks.assert_called_once()
+        self.assertEqual(self.client.send_task.call_count, 7)
+        self.assertEqual(len(self.service.task_queue), 7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for priority dispatch of delegated tasks
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from src.cloud_agent import CloudAgentClient, CloudAgentConfig, DelegationService
+from src.cloud_agent.delegation import TaskPriority
+from src.cloud_agent.dispatch import TaskDispatcher
+
+
+class TestTaskDispatcher(unittest.TestCase):
+    """Test cases for TaskDispatcher."""
+
+    def run_order(self, dispatcher, submissions):
+        """Queue calls behind a blocked worker and return the order they ran in."""
+        gate = threading.Event()
+        order = []
+        dispatcher.submit(gate.wait)
+        time.sleep(0.05)
+        for name, priority, urgent in submissions:
+            dispatcher.submit(order.append, (name,), priority, urgent)
+            time.sleep(0.01)
+        gate.set()
+        dispatcher.shutdown()
+        return order
+
+    def test_priority_order(self):
+        """Test priority, then submission order, with CRITICAL ahead of everything."""
+        order = self.run_order(TaskDispatcher(workers=1), [
+            ('low1', 1, False), ('medium', 2, False), ('low2', 1, False),
+            ('high', 3, False), ('critical', 4, True),
+        ])
+        self.assertEqual(order, ['critical', 'high', 'medium', 'low1', 'low2'])
+
+    def test_aging(self):
+        """Test that waiting LOW tasks overtake newer higher priority tasks."""
+        order = self.run_order(TaskDispatcher(workers=1, aging=0.005), [
+            ('low', 1, False), ('medium', 2, False), ('high', 3, False),
+            ('high2', 3, False), ('critical', 4, True),
+        ])
+        self.assertEqual(order, ['critical', 'low', 'medium', 'high', 'high2'])
+
+    def test_rate_and_concurrency_budget(self):
+        """Test that calls start no faster than the rate with bounded concurrency."""
+        dispatcher = TaskDispatcher(workers=3, rate=100.0)
+        starts = []
+        running = [0, 0]
+        lock = threading.Lock()
+
+        def call(n):
+            with lock:
+                starts.append(time.monotonic())
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.04)
+            with lock:
+                running[0] -= 1
+            if n == 5:
+                raise RuntimeError("task failed")
+            return n
+
+        futures = [dispatcher.submit(call, (n,)) for n in range(20)]
+        self.assertEqual([f.result() for f in futures if f.exception() is None], [n for n in range(20) if n != 5])
+        dispatcher.shutdown()
+        starts.sort()
+        self.assertGreaterEqual(starts[-1] - starts[0], 19 / 100.0 * 0.9)
+        self.assertLessEqual(running[1], 3)
+
+        stats = dispatcher.stats()
+        self.assertEqual((stats['queued'], stats['dispatched'], stats['failed']), (0, 19, 1))
+        self.assertGreater(stats['max_depth'], 10)
+        self.assertLessEqual(stats['wait_p50'], stats['wait_p99'])
+        with self.assertRaises(RuntimeError):
+            dispatcher.submit(call, (0,))
+
+
+class TestDelegationDispatch(unittest.TestCase):
+    """Test DelegationService.submit_task."""
+
+    def test_submit_task(self):
+        """Test that queued tasks are delegated and tracked."""
+        client = CloudAgentClient(CloudAgentConfig(endpoint="https://test.example.com", dispatch_workers=2))
+        service = DelegationService(client)
+        with self.assertRaises(ConnectionError):
+            service.submit_task("test_task", {})
+
+        client._connected = True
+        client._session = Mock()
+        client.send_task = Mock(side_effect=lambda task_type, data: {
+            'task_id': f"id{data['n']}", 'status': 'submitted'
+        })
+        with self.assertRaises(ValueError):
+            service.submit_task("", {})
+
+        futures = [service.submit_task("test_task", {'n': n}, TaskPriority.LOW) for n in range(10)]
+        self.assertEqual([f.result(timeout=5) for f in futures], [f'id{n}' for n in range(10)])
+        self.assertEqual(client.send_task.call_args[0][1]['priority'], TaskPriority.LOW.value)
+        service.shutdown()
+
+        stats = service.get_dispatch_stats()
+        self.assertEqual(stats['dispatched'], 10)
+        self.assertEqual(stats['queued_by_priority'], {})
+        self.assertEqual(len(service.task_queue), 10)
+        self.assertIsNotNone(stats['wait_p99'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,522 @@
+"""
+Tests for the Ground Station application
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'ground-station'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'utilities'))
+
+from handover import HandoverScheduler  # noqa: E402
+from main import GroundStation  # noqa: E402
+from pipeline import TrackingPipeline  # noqa: E402
+from protocol import FrameDecoder, FrameEncoder  # noqa: E402
+from satellite_tracker import SatelliteTracker  # noqa: E402
+from scheduler import RateScheduler  # noqa: E402
+from slew import MotionLimits, SlewPlanner, move_time  # noqa: E402
+from trajectory import (MAX_SEGMENTS, ClockSync, TrajectoryInterpolator, encode_segment,  # noqa: E402
+                        plan_trajectory)
+from tests.test_satellite_tracker import make_tle, write_catalog  # noqa: E402
+
+MAIN = Path(__file__).resolve().parent.parent / 'software' / 'ground-station' / 'main.py'
+
+ISS_LINE1 = "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9005"
+ISS_LINE2 = "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49560532 12345"
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep just moves time forward."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRateScheduler(unittest.TestCase):
+    """Test cases for the deadline-based stage scheduler."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.scheduler = RateScheduler(clock=self.clock, sleep=self.clock.sleep)
+        self.calls = []
+
+    def run_for(self, seconds):
+        end = self.clock.now + seconds
+        self.scheduler.run(lambda: self.clock.now >= end - 1e-9)
+
+    def test_stages_run_at_their_rates(self):
+        """Test that each stage runs on its own deadline grid without drift."""
+        self.scheduler.add_stage('tracking', 5.0, lambda: self.calls.append(('tracking', self.clock.now)))
+        self.scheduler.add_stage('doppler', 10.0, lambda: self.calls.append(('doppler', self.clock.now)))
+        self.scheduler.add_stage('telemetry', 1.0, lambda: self.calls.append(('telemetry', self.clock.now)))
+        self.run_for(10.0)
+        stats = self.scheduler.stats()
+        self.assertEqual(stats['tracking']['runs'], 50)
+        self.assertEqual(stats['doppler']['runs'], 100)
+        self.assertEqual(stats['telemetry']['runs'], 10)
+        tracking = [t for name, t in self.calls if name == 'tracking']
+        self.assertAlmostEqual(tracking[-1] - tracking[0], 49 * 0.2, places=6)
+        self.assertEqual(stats['tracking']['overruns'], 0)
+
+    def test_slow_stage_skips_stale_ticks(self):
+        """Test that a stage running long skips missed ticks and reports overruns."""
+        durations = iter([0.05, 0.65, 0.05, 0.05, 0.05, 0.05, 0.05])
+
+        def slow():
+            self.calls.append(self.clock.now)
+            self.clock.now += next(durations, 0.05)
+
+        self.scheduler.add_stage('tracking', 5.0, slow)
+        self.run_for(1.5)
+        stats = self.scheduler.stats()['tracking']
+        self.assertEqual(stats['overruns'], 1)
+        self.assertEqual(stats['skipped'], 2)
+        self.assertAlmostEqual(stats['duration_max'], 0.65)
+        # After the long run the stage resumes on the original 0.2 s grid
+        self.assertAlmostEqual(self.calls[2], 100.85, places=6)
+        self.assertAlmostEqual(self.calls[3], 101.0, places=6)
+        self.assertAlmostEqual(stats['jitter_max'], 0.05, places=6)
+
+    def test_invalid_rate(self):
+        """Test that non-positive rates and duplicate names are rejected."""
+        with self.assertRaises(ValueError):
+            self.scheduler.add_stage('tracking', 0.0, lambda: None)
+        self.scheduler.add_stage('tracking', 5.0, lambda: None)
+        with self.assertRaises(ValueError):
+            self.scheduler.add_stage('tracking', 5.0, lambda: None)
+
+
+class FakeTracker:
+    """Tracker stand-in whose azimuth equals the timestamp modulo 360."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def calculate_positions(self, satellite_ids, timestamps):
+        if satellite_ids != ['SAT-1']:
+            raise ValueError(f"Satellite {satellite_ids[0]} not loaded")
+        self.calls += 1
+        return {
+            'azimuth': [[t % 360.0 for t in timestamps]],
+            'elevation': [[45.0 for _ in timestamps]],
+            'range_rate': [[0.0 for _ in timestamps]],
+        }
+
+
+class TestTrackingPipeline(unittest.TestCase):
+    """Test cases for the threaded tracking pipeline."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sent = []
+        self.records = []
+        self.tracker = FakeTracker()
+
+    def make_pipeline(self, record_telemetry, **kwargs):
+        pipeline = TrackingPipeline(self.tracker, lambda az, el: self.sent.append((time.time(), az)),
+                                    record_telemetry, rate_hz=50.0, lookahead=0.2, **kwargs)
+        self.addCleanup(pipeline.stop)
+        return pipeline
+
+    def test_commands_sent_on_time_despite_slow_telemetry(self):
+        """Test that a blocking telemetry sink does not delay commands."""
+        release = threading.Event()
+
+        def slow_sink(record):
+            release.wait(5.0)
+            self.records.append(record)
+
+        pipeline = self.make_pipeline(slow_sink, latency_target=0.05)
+        pipeline.set_target('SAT-1')
+        pipeline.start()
+        time.sleep(0.5)
+        stats = pipeline.stats()
+        release.set()
+        pipeline.stop()
+
+        self.assertGreater(stats['sent'], 15)
+        self.assertLess(stats['latency_p50'], 0.05)
+        self.assertLessEqual(stats['command_queue'], 10)
+        # Each command was sent no earlier than the time it points for
+        for sent_at, azimuth in self.sent:
+            self.assertGreaterEqual(sent_at % 360.0 + 1e-3, azimuth)
+        self.assertGreater(len(self.records), 0)
+        self.assertIn('latency', self.records[0])
+
+    def test_unknown_target_idles_with_error(self):
+        """Test that a propagation failure stops tracking and is reported."""
+        pipeline = self.make_pipeline(None)
+        pipeline.set_target('UNKNOWN')
+        pipeline.start()
+        time.sleep(0.2)
+        self.assertIsNone(pipeline.target)
+        self.assertIsInstance(pipeline.last_error, ValueError)
+        self.assertEqual(pipeline.stats()['sent'], 0)
+
+    def test_no_tracker_idles_until_loaded(self):
+        """Test that the pipeline skips ticks without a catalog and resumes once one is set."""
+        pipeline = TrackingPipeline(None, lambda az, el: self.sent.append((time.time(), az)),
+                                    rate_hz=50.0, lookahead=0.2)
+        self.addCleanup(pipeline.stop)
+        pipeline.set_target('SAT-1')
+        self.assertEqual(pipeline.run_pending(), 0)
+        pipeline.start()
+        time.sleep(0.2)
+        self.assertEqual(pipeline.stats()['sent'], 0)
+        self.assertIsNone(pipeline.last_error)
+        self.assertEqual(pipeline.target, 'SAT-1')
+
+        pipeline.set_tracker(self.tracker)
+        time.sleep(0.3)
+        self.assertGreater(pipeline.stats()['sent'], 5)
+
+
+class TestTrajectory(unittest.TestCase):
+    """Test cases for trajectory upload and the firmware interpolator model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a tracker and a high-elevation ISS pass."""
+        cls.tracker = SatelliteTracker(observer_lat=45.0, observer_lon=-93.0, observer_alt=300.0)
+        cls.tracker.add_satellite('ISS', ISS_LINE1, ISS_LINE2)
+        passes = cls.tracker.predict_passes(['ISS'], 1704110400.0, 1704110400.0 + 86400, 10.0)
+        cls.aos, cls.los = float(passes['aos'][0]), float(passes['los'][0])
+
+    def upload(self, segments, clock):
+        """Send segments through the frame codec into a simulated controller."""
+        controller = TrajectoryInterpolator()
+        decoder = FrameDecoder(controller.handle_frame)
+        encoder = FrameEncoder()
+        frames = 0
+        for segment in segments:
+            for frame in encode_segment(encoder, segment, clock.to_controller_ms(segment.start)):
+                decoder.feed(bytes(frame))
+                frames += 1
+        return controller, frames
+
+    def test_interpolated_track_matches_propagation(self):
+        """Test that the controller follows the pass closely from a few frames."""
+        segments = plan_trajectory(self.tracker, 'ISS', self.aos, self.los, max_knots=1000)
+        clock = ClockSync()
+        clock.observe(self.aos - 30.0, 12345)
+        controller, frames = self.upload(segments, clock)
+
+        times = np.arange(self.aos, self.los, 0.2)
+        truth = self.tracker.calculate_positions(['ISS'], times)
+        track = np.array([controller.position(clock.to_controller_ms(t)) for t in times])
+        az_error = np.abs((track[:, 0] - truth['azimuth'][0] + 180.0) % 360.0 - 180.0)
+        self.assertLess(np.max(az_error), 0.1)
+        self.assertLess(np.max(np.abs(track[:, 1] - truth['elevation'][0])), 0.1)
+        # Far fewer frames than one command per 5 Hz tick
+        self.assertLess(frames * 10, len(times))
+
+    def test_segments_chain_without_host(self):
+        """Test that consecutive segments hand over with no gap."""
+        segments = plan_trajectory(self.tracker, 'ISS', self.aos, self.los, max_knots=8)
+        self.assertGreater(len(segments), 2)
+        for previous, segment in zip(segments, segments[1:]):
+            self.assertAlmostEqual(previous.end, segment.start)
+        clock = ClockSync()
+        clock.observe(self.aos, 1000)
+        controller = TrajectoryInterpolator()
+        decoder = FrameDecoder(controller.handle_frame)
+        encoder = FrameEncoder()
+        # Upload the first two segments, then let the host stall
+        for segment in segments[:2]:
+            for frame in encode_segment(encoder, segment, clock.to_controller_ms(segment.start)):
+                decoder.feed(bytes(frame))
+        covered = [controller.position(clock.to_controller_ms(t)) is not None
+                   for t in np.arange(self.aos, segments[1].end, 0.5)]
+        self.assertTrue(all(covered))
+        self.assertIsNone(controller.position(clock.to_controller_ms(segments[1].end + 1.0)))
+
+    def test_station_uploads_within_segment_buffers(self):
+        """Test that a long trajectory is fed to the controller as buffers free up."""
+        clock = ClockSync()
+        clock.observe(self.aos - 600.0, 1000)
+        controller = TrajectoryInterpolator()
+        decoder = FrameDecoder(controller.handle_frame)
+        encoder = FrameEncoder()
+        antenna = Mock(position=None)
+        antenna.upload_trajectory.side_effect = lambda segment: [
+            decoder.feed(bytes(frame)) for frame in encode_segment(encoder, segment, clock.to_controller_ms(segment.start))
+        ]
+        with contextlib.redirect_stdout(io.StringIO()):
+            station = GroundStation(os.devnull, simulate=True)
+        station.tracker, station.antenna = self.tracker, antenna
+        now = [self.aos - 600.0]
+        station.clock = lambda: now[0]
+
+        planned = station.upload_trajectory('ISS', now[0], self.los + 600.0)
+        self.assertGreater(planned, MAX_SEGMENTS)
+        self.assertEqual(antenna.upload_trajectory.call_count, MAX_SEGMENTS)
+        for t in np.arange(now[0], self.los + 600.0, 1.0):
+            now[0] = t
+            self.assertIsNotNone(controller.position(clock.to_controller_ms(t)))
+            station.feed_trajectory()
+        self.assertEqual(antenna.upload_trajectory.call_count, planned)
+        self.assertEqual(controller.rejected, 0)
+
+    def test_invalid_window(self):
+        """Test that an empty window is rejected."""
+        with self.assertRaises(ValueError):
+            plan_trajectory(self.tracker, 'ISS', self.los, self.aos)
+
+
+class TestSlewPlanner(unittest.TestCase):
+    """Test cases for motion-profile-aware slews and handover."""
+
+    def setUp(self):
+        """Set up planners for a 0-360 mount and a mount with cable wrap."""
+        self.planner = SlewPlanner(MotionLimits.from_motor(100, 1000, 500))
+        self.wrap = SlewPlanner(MotionLimits(azimuth_min=-180.0, azimuth_max=540.0))
+
+    def test_trapezoidal_move_time(self):
+        """Test short (triangular) and long (cruising) moves at 10 deg/s and 5 deg/s^2."""
+        self.assertEqual(self.planner.limits.max_speed, 10.0)
+        np.testing.assert_allclose(move_time([5.0, -5.0, 100.0], 10.0, 5.0), [2.0, 2.0, 12.0])
+
+    def test_wrap_direction(self):
+        """Test that crossing north goes the long way only when the mount must."""
+        duration, azimuth = self.planner.slew(350.0, 45.0, 10.0, 45.0)
+        self.assertEqual(azimuth, 10.0)
+        self.assertAlmostEqual(duration, 36.0)
+        duration, azimuth = self.wrap.slew(350.0, 45.0, 10.0, 45.0)
+        self.assertEqual(azimuth, 370.0)
+        self.assertAlmostEqual(duration, 4.0)
+        with self.assertRaises(ValueError):
+            self.planner.slew(0.0, 45.0, 10.0, 5.0)
+
+    def test_pass_feasibility(self):
+        """Test wrap and keyhole (near-zenith) pass checks."""
+        times = np.arange(0.0, 61.0)
+        north = np.mod(340.0 + np.linspace(0.0, 40.0, len(times)), 360.0)
+        elevation = np.full(len(times), 40.0)
+        self.assertFalse(self.planner.check_pass(times, north, elevation).reachable)
+        check = self.wrap.check_pass(times, north, elevation, from_azimuth=300.0)
+        self.assertTrue(check.reachable)
+        self.assertEqual(check.azimuth_offset, 0.0)
+
+        zenith = np.linspace(90.0, 270.0, len(times[:11]))
+        check = self.planner.check_pass(times[:11], zenith, np.full(11, 89.0))
+        self.assertFalse(check.reachable)
+        self.assertAlmostEqual(check.max_azimuth_rate, 18.0)
+        self.assertIn('deg/s', check.reason)
+
+    def test_choose_handover_minimizes_dead_time(self):
+        """Test that the nearest reachable satellite wins over a higher one far away."""
+        times = 1000.0 + np.arange(0.0, 121.0)
+        rising = np.linspace(20.0, 60.0, len(times))
+        candidates = {
+            'far': (times, np.full(len(times), 250.0), rising),
+            'near': (times, np.full(len(times), 100.0), rising - 5.0),
+            'keyhole': (times, np.mod(95.0 + 20.0 * (times - 1000.0), 360.0), np.full(len(times), 88.0)),
+        }
+        choice = self.planner.choose_handover(90.0, 30.0, 1000.0, candidates)
+        self.assertEqual(choice.satellite_id, 'near')
+        self.assertAlmostEqual(choice.dead_time, 4.0)
+        self.assertEqual(choice.mechanical_azimuth, 100.0)
+        self.assertIsNone(self.planner.choose_handover(90.0, 30.0, 1000.0, {'keyhole': candidates['keyhole']}))
+
+
+class TestHandoverScheduler(unittest.TestCase):
+    """Test cases for the rolling-horizon handover scheduler."""
+
+    START = 1704110400.0
+
+    def setUp(self):
+        """Set up a tracker with a synthetic constellation and a plan."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.catalog = Path(self.tmp.name) / 'catalog.tle'
+        write_catalog(self.catalog, 1000)
+        self.tracker = SatelliteTracker(observer_lat=45.0, observer_lon=-93.0, observer_alt=300.0)
+        self.tracker.load_tle(str(self.catalog))
+        self.planner = SlewPlanner(MotionLimits.from_motor(100, 1000, 500))
+        self.handover = HandoverScheduler(self.tracker, self.planner, max_satellites=10,
+                                          min_elevation=25.0, horizon=1800.0)
+        self.schedule = self.handover.plan(self.START)
+
+    def test_plan_respects_mask_and_slew(self):
+        """Test that assignments stay above the mask and switches fit in a slot."""
+        self.assertGreater(len(self.schedule), 1)
+        for assignment in self.schedule:
+            self.assertGreaterEqual(assignment.min_elevation, 25.0)
+        for previous, current in zip(self.schedule, self.schedule[1:]):
+            self.assertLessEqual(previous.end, current.start)
+            if previous.end == current.start:
+                angles = self.tracker.calculate_positions([previous.norad_id, current.norad_id], current.start)
+                dead = self.planner.slew_times(angles['azimuth'][0, 0], angles['elevation'][0, 0],
+                                               angles['azimuth'][1, 0], angles['elevation'][1, 0])
+                self.assertLessEqual(float(dead), self.handover.slot)
+        first = self.schedule[0]
+        self.assertEqual(self.handover.target(first.start + 1.0), first.norad_id)
+
+    def test_rolling_horizon_only_plans_new_slots(self):
+        """Test that advancing computes only the slots added at the end."""
+        slots = self.handover.slots
+        self.assertEqual(self.handover.advance(self.START + 5.0), self.schedule)
+        self.assertEqual(self.handover.start, self.START)
+        self.handover.advance(self.START + 700.0)
+        self.assertEqual(self.handover.start, self.START + 700.0)
+        self.assertEqual(self.handover.slots, slots)
+        self.assertLess(self.handover.last_replan['slots'], slots // 2)
+
+    def test_incremental_refresh(self):
+        """Test that a TLE update re-plans only from the first affected slot."""
+        self.assertEqual(self.handover.refresh(), 0)
+        # Move the planned satellite whose pass starts last
+        visible = self.handover._el >= 25.0
+        row = int(np.argmax(np.where(np.any(visible, axis=1), np.argmax(visible, axis=1), -1)))
+        norad_id = int(self.handover._ids[row])
+        i = norad_id - 10000
+        lines = self.catalog.read_text().splitlines()
+        line1, line2 = make_tle(norad_id, raan=(i % 72) * 5.0, mean_anomaly=(i // 72) * 360.0 / 140 % 360.0,
+                                day=1.51)
+        lines[3 * i + 1:3 * i + 3] = [line1, line2]
+        self.catalog.write_text('\n'.join(lines) + '\n')
+        self.assertEqual(self.tracker.update_tle(str(self.catalog))['updated'], 1)
+
+        replanned = self.handover.refresh()
+        self.assertGreater(replanned, 0)
+        self.assertLess(replanned, self.handover.slots)
+        self.assertEqual(self.handover.last_replan['slots'], replanned)
+        fresh = HandoverScheduler(self.tracker, self.planner, max_satellites=10, min_elevation=25.0,
+                                  horizon=1800.0).plan(self.START)
+        self.assertEqual(self.handover.schedule(), fresh)
+
+
+    def test_refresh_drops_removed_satellites(self):
+        """Test that satellites dropped from the catalog leave the plan."""
+        dropped = {a.norad_id for a in self.schedule[:2]}
+        lines = self.catalog.read_text().splitlines()
+        kept = [lines[i:i + 3] for i in range(0, len(lines), 3) if int(lines[i + 1][2:7]) not in dropped]
+        self.catalog.write_text('\n'.join(line for entry in kept for line in entry) + '\n')
+        self.assertEqual(self.tracker.update_tle(str(self.catalog))['removed'], len(dropped))
+
+        self.assertGreater(self.handover.refresh(), 0)
+        self.assertFalse(np.isin(self.handover._ids, list(dropped)).any())
+        fresh = HandoverScheduler(self.tracker, self.planner, max_satellites=10, min_elevation=25.0,
+                                  horizon=1800.0).plan(self.START)
+        self.assertEqual(self.handover.schedule(), fresh)
+        # Extending the horizon re-samples the planned satellites
+        schedule = self.handover.advance(self.START + 700.0)
+        self.assertFalse({a.norad_id for a in schedule} & dropped)
+
+class TestCatalogRefresh(unittest.TestCase):
+    """Test cases for loading the catalog from tracking.tle_source in hardware mode."""
+
+    def setUp(self):
+        """Set up a hardware-mode station whose TLE source is a local catalog."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.catalog = Path(directory.name) / 'starlink.tle'
+        write_catalog(self.catalog, 30)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.station = GroundStation(os.devnull)
+        config = self.station.config
+        self.station.config = replace(config, tracking=replace(config.tracking, tle_source=str(self.catalog)))
+        self.station.scheduler = RateScheduler(FakeClock())
+        self.station.scheduler.add_stage('tle_refresh', 1.0 / config.tracking.tle_update_interval,
+                                         self.station.refresh_catalog)
+        self.station.pipeline = TrackingPipeline(None, lambda az, el: None)
+
+    def refresh(self):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.station.refresh_catalog()
+
+    def test_first_refresh_loads_catalog(self):
+        """Test that the catalog is loaded and handed to the idle pipeline."""
+        self.refresh()
+        self.assertEqual(len(self.station.tracker.satellites), 30)
+        self.assertIs(self.station.pipeline.tracker, self.station.tracker)
+        self.assertIsNotNone(self.station.doppler)
+
+    def test_later_refresh_updates_in_place(self):
+        """Test that later refreshes update the loaded catalog incrementally."""
+        self.refresh()
+        tracker = self.station.tracker
+        write_catalog(self.catalog, 25)
+        self.refresh()
+        self.assertIs(self.station.tracker, tracker)
+        self.assertEqual(len(tracker.satellites), 25)
+
+    def test_url_source(self):
+        """Test that a URL source is downloaded and the download removed."""
+        config = self.station.config
+        self.station.config = replace(config, tracking=replace(config.tracking, tle_source=self.catalog.as_uri()))
+        self.refresh()
+        self.assertEqual(len(self.station.tracker.satellites), 30)
+        self.assertEqual(list(self.catalog.parent.iterdir()), [self.catalog])
+
+    def test_failed_download_retries_sooner(self):
+        """Test that a failed first load keeps the pipeline idle and retries sooner."""
+        scheduler = self.station.scheduler
+        stage = scheduler.stages[0]
+        self.catalog.unlink()
+        with contextlib.redirect_stderr(io.StringIO()):
+            scheduler.run_pending()
+        self.assertIsNone(self.station.tracker)
+        self.assertIsNone(self.station.pipeline.tracker)
+        self.assertEqual(stage.period, GroundStation.TLE_RETRY_SEC)
+
+        write_catalog(self.catalog, 30)
+        scheduler.clock.now += GroundStation.TLE_RETRY_SEC
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler.run_pending()
+        self.assertEqual(len(self.station.tracker.satellites), 30)
+        self.assertEqual(stage.period, self.station.config.tracking.tle_update_interval)
+
+
+class TestStartup(unittest.TestCase):
+    """Test that cheap CLI modes do not load the heavy subsystems."""
+
+    PROBE = """
+import os, runpy, sys
+sys.argv = [{main!r}, '--status', '--config', os.devnull + '.yaml'] + {mode!r}
+sys.path.insert(0, os.path.dirname({main!r}))
+try:
+    runpy.run_path({main!r}, run_name='__main__')
+except SystemExit:
+    pass
+print('LOADED', sorted(set(sys.modules) & {heavy!r}))
+"""
+
+    def test_status_imports(self):
+        """Test that --status imports neither NumPy, pyserial, YAML nor tracking modules."""
+        heavy = {'numpy', 'scipy', 'serial', 'yaml', 'antenna_link', 'telemetry', 'handover', 'slew'}
+        for mode in (['--simulate'], []):
+            with self.subTest(mode=mode):
+                start = time.perf_counter()
+                probe = self.PROBE.format(main=str(MAIN), mode=mode, heavy=heavy)
+                with tempfile.TemporaryDirectory() as cache:
+                    env = dict(os.environ, STARLINK_DIY_CACHE_DIR=cache)
+                    result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                                            timeout=30, env=env)
+                elapsed = time.perf_counter() - start
+                self.assertIn('Ground Station Status', result.stdout)
+                self.assertIn('LOADED []', result.stdout)
+                self.assertLess(elapsed, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
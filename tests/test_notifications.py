@@ -0,0 +1,83 @@
+"""
+Tests for task completion notifications against a stub cloud agent
+"""
+
+import threading
+import time
+import unittest
+
+from src.cloud_agent import CloudAgentClient, CloudAgentConfig, DelegationService
+from tests.stub_agent import StubCloudAgent
+
+
+class TestCompletionNotifications(unittest.TestCase):
+    """Test DelegationService.wait_for_task."""
+
+    def setUp(self):
+        """Start a stub cloud agent and delegate some tasks to it."""
+        self.agent = StubCloudAgent()
+        self.addCleanup(self.agent.stop)
+        self.client = CloudAgentClient(CloudAgentConfig(endpoint=self.agent.endpoint))
+        self.assertTrue(self.client.connect())
+        self.addCleanup(self.client.disconnect)
+        self.service = DelegationService(self.client)
+        self.addCleanup(self.service.shutdown)
+        self.task_ids = self.service.delegate_tasks(
+            {'task_type': 'signal_analysis', 'task_data': {'n': i}} for i in range(40)
+        )
+
+    def finish_later(self, task_ids, status='completed', delay=0.05):
+        """Finish tasks on the stub from another thread, one at a time."""
+        def run():
+            for task_id in task_ids:
+                time.sleep(delay / len(task_ids))
+                self.agent.set_status(task_id, status)
+        threading.Thread(target=run, daemon=True).start()
+
+    def test_long_poll(self):
+        """Test that one event stream resolves all futures, including earlier completions."""
+        self.service.notifications.long_poll = 1.0
+        self.agent.set_status(self.task_ids[0], 'failed')
+        results = []
+        futures = [self.service.wait_for_task(task_id) for task_id in self.task_ids[:-1]]
+        futures.append(self.service.wait_for_task(self.task_ids[-1], callback=results.append))
+        self.assertEqual(futures[0].result(timeout=5)['status'], 'failed')
+
+        self.finish_later(self.task_ids[1:])
+        for future in futures:
+            self.assertIn(future.result(timeout=5)['status'], ('completed', 'failed'))
+        self.assertEqual(results, [{'task_id': self.task_ids[-1], 'status': 'completed'}])
+        self.assertEqual(self.service.task_queue.count_by('status'), {'failed': 1, 'completed': 39})
+        self.assertEqual(self.agent.requests['GET /tasks/{id}'], 0)
+        self.assertLess(self.agent.requests['GET /tasks/events'], 40)
+
+        # Finished tasks resolve immediately from the queue
+        self.assertTrue(self.service.wait_for_task(self.task_ids[5]).done())
+        with self.assertRaises(ValueError):
+            self.service.wait_for_task('missing')
+
+    def test_backoff_poller(self):
+        """Test the polling fallback backs off while nothing changes."""
+        self.agent.streaming = False
+        watcher = self.service.notifications
+        watcher.poll_min, watcher.poll_max = 0.02, 0.16
+        futures = [self.service.wait_for_task(task_id) for task_id in self.task_ids]
+        time.sleep(0.4)
+        self.assertFalse(watcher.events_supported)
+        self.assertEqual(watcher.interval, 0.16)
+        polls = self.agent.requests['GET /tasks']
+        self.assertLessEqual(polls, 6)
+
+        self.finish_later(self.task_ids)
+        for future in futures:
+            self.assertEqual(future.result(timeout=5)['status'], 'completed')
+        self.assertEqual(self.agent.requests['GET /tasks/{id}'], 0)
+        self.assertLess(self.agent.requests['GET /tasks'] - polls, 10)
+
+        pending = self.service.wait_for_task(self.service.delegate_task('diagnostics', {}))
+        self.service.shutdown()
+        self.assertTrue(pending.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
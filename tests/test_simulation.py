@@ -0,0 +1,134 @@
+"""
+Tests for the ground station simulation backend
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'ground-station'))
+
+from antenna_link import AntennaLink  # noqa: E402
+from main import GroundStation  # noqa: E402
+from simulation import SIMULATION_EPOCH, SignalModel, SimulatedAntenna, VirtualClock, synthetic_catalog  # noqa: E402
+from slew import MotionLimits, move_time  # noqa: E402
+from telemetry import TelemetryReader  # noqa: E402
+
+
+class TestSimulatedHardware(unittest.TestCase):
+    """Test cases for the virtual clock, antenna and signal model."""
+
+    def test_antenna_motion_limits(self):
+        """Test that slews follow the trapezoidal profile and limits."""
+        clock = VirtualClock()
+        limits = MotionLimits(max_speed=10.0, acceleration=5.0)
+        antenna = SimulatedAntenna(limits, clock, position=(0.0, 45.0))
+        antenna.set_target(90.0, 45.0)
+        duration = float(move_time(90.0, 10.0, 5.0))
+        clock.sleep(duration - 0.5)
+        self.assertLess(antenna.position[0], 90.0)
+        self.assertTrue(antenna.moving)
+        clock.sleep(0.6)
+        self.assertEqual(antenna.position, (90.0, 45.0))
+        self.assertFalse(antenna.moving)
+
+        # Crossing north with 0-360 limits goes the long way around
+        antenna.set_target(-10.0, 5.0)
+        clock.sleep(100.0)
+        self.assertEqual(antenna.position, (350.0, limits.elevation_min))
+        self.assertEqual(antenna.stats()['limited'], 1)
+
+    def test_antenna_matches_link_interface(self):
+        """Test that the simulated antenna answers like AntennaLink."""
+        antenna = SimulatedAntenna(MotionLimits(), VirtualClock())
+        self.assertIs(antenna.is_open(), True)
+        link = AntennaLink('/dev/null')
+        self.assertEqual(set(antenna.stats()) - {'limited'}, set(link.stats()))
+
+    def test_signal_model(self):
+        """Test that the synthetic receiver is seeded and follows the beam."""
+        draws = [SignalModel(12.5e9, 0.9, 35.0, noise_level=0.1, seed=7) for _ in range(2)]
+        first = [draws[0].signal_strength(0.2) for _ in range(5)]
+        self.assertEqual(first, [draws[1].signal_strength(0.2) for _ in range(5)])
+
+        model = SignalModel(12.5e9, 0.9, 35.0, noise_level=0.0)
+        self.assertAlmostEqual(model.signal_strength(0.0), 35.0)
+        self.assertAlmostEqual(model.signal_strength(model.beamwidth / 2.0), 32.0)
+        self.assertAlmostEqual(model.doppler_shift(-7.0), 12.5e9 * 7000.0 / 299792458.0)
+        self.assertEqual(len(synthetic_catalog(3, seed=1)[0][1]), 69)
+
+
+class TestSimulationRun(unittest.TestCase):
+    """Test that a simulated run is fast and reproducible."""
+
+    def setUp(self):
+        """Set up a configuration with many satellites and a private telemetry log."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        self.sent = {}  # Antenna commands per run
+
+    def run_station(self, name: str, duration: float, extra: str = '') -> GroundStation:
+        config = self.root / f'{name}.yaml'
+        config.write_text(extra + "tracking:\n  min_elevation: 15\n"
+                          f"logging:\n  telemetry:\n    file: {self.root / name / 'telemetry.bin'}\n"
+                          "simulation:\n  simulated_satellites: 40\n  seed: 3\n")
+        station = GroundStation(str(config), simulate=True)
+        station.config_cache = self.root / 'cache'
+        with contextlib.redirect_stdout(io.StringIO()):
+            station.load_configuration()
+            station.initialize_hardware()
+            station.start_tracking(duration)
+            self.sent[name] = station.antenna.stats()['sent']
+            station.shutdown()
+        return station
+
+    def test_deterministic(self):
+        """Test that two runs with the same seed write identical telemetry."""
+        stations = [self.run_station(name, 3600.0) for name in ('a', 'b')]
+        self.assertEqual(stations[0].clock(), SIMULATION_EPOCH + 3600.0)
+        stats = stations[0].pipeline.stats()
+        self.assertGreater(stats['sent'], 1000)
+        self.assertEqual(stats['latency_misses'], 0)
+        self.assertEqual((self.root / 'a' / 'telemetry.bin').read_bytes(),
+                         (self.root / 'b' / 'telemetry.bin').read_bytes())
+
+        records = TelemetryReader(self.root / 'a' / 'telemetry.bin').slice()
+        self.assertTrue(np.all(np.diff(records['timestamp']) > 0))
+        self.assertTrue(np.all(records['elevation'] >= 15.0 - 1.0))
+        self.assertTrue(np.all(np.isfinite(records['signal_strength'])))
+        self.assertLess(np.median(records['pointing_error']), 1.0)
+
+    def test_doppler_tables_follow_plan(self):
+        """Test that planned passes get Doppler tables that are dropped after LOS."""
+        station = self.run_station('doppler', 1200.0)
+        now = station.clock()
+        table = station.doppler.table_for(station.target, now)
+        self.assertIsNotNone(table)
+        self.assertAlmostEqual(station.doppler_shift, table.shift(now), delta=1000.0)
+
+        station.clock.sleep(3000.0)
+        station.check_handover()
+        self.assertNotIn(table, station.doppler.tables.get(table.satellite_id, []))
+        self.assertTrue(all(t.end >= station.clock() for tables in station.doppler.tables.values() for t in tables))
+
+    def test_trajectory_mode_cuts_commands(self):
+        """Test that uploading planned passes sends far fewer commands than pointing every tick."""
+        self.run_station('text', 1400.0)
+        self.run_station('binary', 1400.0, "hardware:\n  protocol: binary\n")
+        self.assertGreater(self.sent['text'], 1000)
+        self.assertLess(self.sent['binary'] * 10, self.sent['text'])
+
+        records = TelemetryReader(self.root / 'binary' / 'telemetry.bin').slice()
+        tracked = records['elevation'] >= 15.0
+        self.assertGreater(np.count_nonzero(tracked), 1000)
+        self.assertLess(np.median(records['pointing_error'][tracked]), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Tests for ground station configuration loading
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'ground-station'))
+
+import station_config  # noqa: E402
+from main import GroundStation  # noqa: E402
+from scheduler import RateScheduler  # noqa: E402
+from station_config import ConfigWatcher, GroundStationConfig, load_config, parse_config  # noqa: E402
+
+EXAMPLE = Path(__file__).resolve().parent.parent / 'software' / 'config.example.yaml'
+
+
+class TestStationConfig(unittest.TestCase):
+    """Test cases for parsing, validation and caching."""
+
+    def setUp(self):
+        """Set up a configuration file and cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / 'config.yaml'
+        self.path.write_text(EXAMPLE.read_text())
+        self.cache = Path(self.tmp.name) / 'cache'
+
+    def test_example_matches_defaults(self):
+        """Test that the example file parses to the built-in defaults."""
+        config = parse_config(EXAMPLE.read_text())
+        self.assertEqual(config, GroundStationConfig())
+        self.assertEqual(config.signal.center_frequency, 12.5e9)
+        self.assertEqual(config.hardware.motor.max_speed, 1000.0)
+        self.assertEqual(parse_config("station:\n  latitude: -33.9\n").station.latitude, -33.9)
+
+    def test_validation(self):
+        """Test that invalid values and unknown keys are rejected."""
+        for text in ("station:\n  latitude: 95\n",
+                     "tracking:\n  update_rate: 0\n",
+                     "tracking:\n  max_satellites: 2.5\n",
+                     "signal:\n  enable_doppler_correction: 1\n",
+                     "hardware:\n  motor:\n    max_sped: 100\n",
+                     "antenna:\n  type: dish\n",
+                     "tracking: [1, 2]\n"):
+            with self.assertRaises(ValueError, msg=text):
+                parse_config(text)
+        with self.assertRaises(Exception):
+            GroundStationConfig().tracking.update_rate = 1.0
+
+    def test_cache(self):
+        """Test that unchanged or touched files skip parsing."""
+        config, cached = load_config(self.path, self.cache)
+        self.assertFalse(cached)
+        with mock.patch.object(station_config, 'parse_config', side_effect=AssertionError('parsed')):
+            self.assertEqual(load_config(self.path, self.cache), (config, True))
+            os.utime(self.path, ns=(0, 10 ** 9))
+            self.assertEqual(load_config(self.path, self.cache), (config, True))
+            self.assertEqual(load_config(self.path, self.cache), (config, True))
+
+        self.path.write_text(EXAMPLE.read_text().replace('update_rate: 5 ', 'update_rate: 20 '))
+        config, cached = load_config(self.path, self.cache)
+        self.assertFalse(cached)
+        self.assertEqual(config.tracking.update_rate, 20.0)
+
+    def test_cache_is_validated_data(self):
+        """Test that the cache holds plain JSON that is validated again on load."""
+        config, _ = load_config(self.path, self.cache)
+        cache, = self.cache.iterdir()
+        entry = json.loads(cache.read_text())
+        self.assertEqual(entry['config']['station']['latitude'], 45.0)
+
+        # A cached value the current validation rejects is not trusted
+        entry['config']['station']['latitude'] = 145.0
+        cache.write_text(json.dumps(entry))
+        self.assertEqual(load_config(self.path, self.cache), (config, False))
+
+    def test_cache_dir_setting(self):
+        """Test that the station's cache directory follows the environment."""
+        with mock.patch.dict(os.environ, {station_config.CACHE_DIR_ENV: str(self.cache)}):
+            station = GroundStation(str(self.path), simulate=True)
+            station.load_configuration()
+        self.assertEqual(len(list(self.cache.iterdir())), 1)
+        with mock.patch.dict(os.environ, {station_config.CACHE_DIR_ENV: ''}):
+            self.assertIsNone(station_config.default_cache_dir())
+
+    def test_empty_file_not_cached(self):
+        """Test that a file giving just the defaults leaves no cache entry."""
+        self.path.write_text('')
+        self.assertEqual(load_config(self.path, self.cache), (GroundStationConfig(), False))
+        self.assertFalse(self.cache.exists())
+
+    def test_hot_reload(self):
+        """Test that only changed sections are swapped into a running station."""
+        with mock.patch.dict(os.environ, {station_config.CACHE_DIR_ENV: str(self.cache)}):
+            station = GroundStation(str(self.path), simulate=True)
+        station.load_configuration()
+        station.scheduler = RateScheduler()
+        station.scheduler.add_stage('doppler', station.config.signal.doppler_update_rate, lambda: None)
+        station.pipeline = mock.Mock()
+        slew = station.slew
+
+        text = EXAMPLE.read_text().replace('update_rate: 5 ', 'update_rate: 20 ')
+        text = text.replace('doppler_update_rate: 10', 'doppler_update_rate: 4')
+        self.path.write_text(text)
+        os.utime(self.path, ns=(0, 2 * 10 ** 9))
+        self.assertEqual(station.config_watcher.poll(), ['tracking', 'signal'])
+        self.assertEqual(station.config_watcher.poll(), [])
+        station.pipeline.set_rate.assert_called_once_with(20.0)
+        self.assertAlmostEqual(station.scheduler.stages[0].period, 0.25)
+        self.assertIs(station.slew, slew)
+
+        # An invalid edit keeps the running configuration
+        self.path.write_text(text.replace('latitude: 45.0', 'latitude: 145.0'))
+        os.utime(self.path, ns=(0, 3 * 10 ** 9))
+        self.assertEqual(station.config_watcher.poll(), [])
+        self.assertIsInstance(station.config_watcher.last_error, ValueError)
+        self.assertEqual(station.config.station.latitude, 45.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Tests for the indexed task store and bulk delegation against a stub cloud agent
+"""
+
+import unittest
+
+from src.cloud_agent import CloudAgentClient, CloudAgentConfig, DelegationService, EndpointNotSupported
+from src.cloud_agent.delegation import TaskPriority
+from src.cloud_agent.task_store import TaskStore
+from tests.stub_agent import StubCloudAgent
+
+
+class TestTaskStore(unittest.TestCase):
+    """Test cases for TaskStore."""
+
+    def test_indexes_follow_updates(self):
+        """Test that lookups and indexes stay consistent as records change."""
+        store = TaskStore()
+        for i in range(6):
+            store.add({'task_id': f'id{i}', 'task_type': 'scan',
+                       'priority': TaskPriority.HIGH if i % 2 else TaskPriority.LOW, 'status': 'submitted'})
+        self.assertEqual(len(store), 6)
+        self.assertEqual(store[0]['task_id'], 'id0')
+        self.assertIs(store.get('id4'), store[4])
+        self.assertIsNone(store.get('missing'))
+
+        store[0]['status'] = 'completed'
+        store.get('id3').update(status='failed', priority=TaskPriority.CRITICAL)
+        self.assertEqual([t['task_id'] for t in store.with_status('completed', 'failed')], ['id0', 'id3'])
+        self.assertEqual(store.count_by('status'), {'submitted': 4, 'completed': 1, 'failed': 1})
+        self.assertEqual([t['task_id'] for t in store.with_priority(TaskPriority.HIGH)], ['id1', 'id5'])
+
+        store.remove(store.get('id0'))
+        self.assertNotIn('id0', store)
+        self.assertEqual(store.with_status('completed'), [])
+        self.assertEqual([t['task_id'] for t in store], ['id1', 'id2', 'id3', 'id4', 'id5'])
+
+    def test_dict_methods_keep_indexes(self):
+        """Test that every way of changing an indexed field updates the indexes."""
+        store = TaskStore()
+        records = [store.add({'task_id': f'id{i}', 'priority': 1, 'status': 'submitted'}) for i in range(5)]
+        self.assertEqual(records[0].pop('status'), 'submitted')
+        del records[1]['priority']
+        self.assertEqual(records[1].setdefault('priority', 3), 3)
+        self.assertEqual(records[2].setdefault('status', 'completed'), 'submitted')
+        records[3] |= {'status': 'failed'}
+        records[4].clear()
+        self.assertEqual(store.count_by('status'), {None: 2, 'submitted': 2, 'failed': 1})
+        self.assertEqual(store.count_by('priority'), {1: 3, 3: 1, None: 1})
+        self.assertEqual(store.with_status(None), [records[0], records[4]])
+
+    def test_removal_compacts(self):
+        """Test that lookups and positions stay right as removals are compacted."""
+        store = TaskStore()
+        for i in range(100):
+            store.add({'task_id': f'id{i}', 'priority': i % 3, 'status': 'submitted'})
+        seen = []
+        for record in store:
+            if int(record['task_id'][2:]) % 4:
+                store.remove(record)
+            seen.append(record['task_id'])
+        self.assertEqual(len(seen), 100)
+        self.assertEqual(len(store), 25)
+        self.assertEqual(store[1]['task_id'], 'id4')
+        self.assertIs(store.get('id96'), store[-1])
+        store[-1]['status'] = 'completed'
+        self.assertEqual(store.with_status('completed'), [store.get('id96')])
+        self.assertEqual(store.count_by('priority'), {0: 9, 1: 8, 2: 8})
+
+
+class TestBulkDelegation(unittest.TestCase):
+    """Test batch submission and bulk status refresh over HTTP."""
+
+    def setUp(self):
+        """Start a stub cloud agent and connect a delegation service to it."""
+        self.agent = StubCloudAgent()
+        self.addCleanup(self.agent.stop)
+        self.client = CloudAgentClient(CloudAgentConfig(endpoint=self.agent.endpoint, batch_size=1000))
+        self.assertTrue(self.client.connect())
+        self.addCleanup(self.client.disconnect)
+        self.service = DelegationService(self.client)
+
+    def test_refresh_many_tasks(self):
+        """Test that 10k tasks are submitted and refreshed in a few round trips."""
+        tasks = [{'task_type': 'satellite_tracking', 'task_data': {'n': i}} for i in range(10000)]
+        task_ids = self.service.delegate_tasks(tasks)
+        self.assertEqual(task_ids, [f'task-{i + 1}' for i in range(10000)])
+        self.assertEqual(self.agent.requests['POST /tasks/batch'], 10)
+
+        for task_id in task_ids[::2]:
+            self.agent.tasks[task_id]['status'] = 'completed'
+        statuses = self.service.refresh_all_statuses()
+        self.assertEqual(len(statuses), 10000)
+        self.assertLessEqual(self.agent.requests['GET /tasks'], 40)
+        self.assertEqual(self.agent.requests['GET /tasks/{id}'], 0)
+        self.assertEqual(self.service.task_queue.count_by('status'), {'submitted': 5000, 'completed': 5000})
+        self.assertEqual(self.service.clear_completed_tasks(), 5000)
+        self.assertEqual(len(self.service.task_queue), 5000)
+
+    def test_fallback_without_bulk_endpoints(self):
+        """Test parallel single requests when the cloud agent lacks batch endpoints."""
+        self.agent.batch = False
+        self.agent.bulk = False
+        task_ids = self.service.delegate_tasks(
+            {'task_type': 'signal_analysis', 'task_data': {'n': i}} for i in range(50)
+        )
+        self.assertEqual(len(set(task_ids)), 50)
+        self.assertEqual(self.agent.requests['POST /tasks'], 50)
+
+        self.agent.tasks[task_ids[7]]['status'] = 'completed'
+        statuses = self.service.refresh_all_statuses()
+        self.assertEqual(len(statuses), 50)
+        self.assertFalse(self.service.bulk_status_supported)
+        self.assertEqual(self.agent.requests['GET /tasks/{id}'], 50)
+        self.assertEqual(self.service.task_queue.get(task_ids[7])['status'], 'completed')
+        with self.assertRaises(EndpointNotSupported):
+            self.client.get_task_statuses(task_ids[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
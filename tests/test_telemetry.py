@@ -0,0 +1,155 @@
+"""
+Tests for ground station telemetry storage
+"""
+
+import math
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'software' / 'ground-station'))
+
+from telemetry import HEADER, TELEMETRY_DTYPE, TelemetryReader, TelemetryWriter, backup_path  # noqa: E402
+
+MAIN = Path(__file__).resolve().parent.parent / 'software' / 'ground-station' / 'main.py'
+
+
+def read_records(path):
+    """Read a telemetry file back with plain NumPy."""
+    return np.fromfile(path, dtype=TELEMETRY_DTYPE, offset=HEADER.size)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTelemetryWriter(unittest.TestCase):
+    """Test cases for the buffered, rotating telemetry writer."""
+
+    def setUp(self):
+        """Set up a temporary log directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / 'logs' / 'telemetry.bin'
+
+    def test_batches_writes(self):
+        """Test that records reach the file only in batches or on the interval."""
+        clock = FakeClock()
+        writer = TelemetryWriter(self.path, batch_size=4, flush_interval=1.0, clock=clock)
+        for i in range(3):
+            writer.append(100.0 + i, norad_id=44713, azimuth=float(i), elevation=45.0)
+        self.assertEqual(len(read_records(self.path)), 0)
+        writer.append(103.0)
+        self.assertEqual(len(read_records(self.path)), 4)
+        writer.append(104.0)
+        clock.now = 1.5
+        writer.append_record({'timestamp': 105.0, 'satellite_id': '25544', 'azimuth': 1.0,
+                              'elevation': 2.0, 'range_rate': -3.5, 'generation': 7, 'latency': 0.01})
+        writer.close()
+
+        records = read_records(self.path)
+        np.testing.assert_array_equal(records['timestamp'], 100.0 + np.arange(6))
+        self.assertEqual(records['norad_id'][0], 44713)
+        self.assertEqual(records['norad_id'][3], -1)
+        self.assertTrue(math.isnan(records['signal_strength'][0]))
+        self.assertEqual(records['norad_id'][5], 25544)
+        self.assertAlmostEqual(float(records['range_rate'][5]), -3.5)
+        self.assertEqual(writer.stats()['flushes'], 2)
+
+    def test_rotation(self):
+        """Test that files rotate at max_size, keep backup_count and never split records."""
+        size = HEADER.size + 10 * TELEMETRY_DTYPE.itemsize
+        records = np.zeros(95, dtype=TELEMETRY_DTYPE)
+        records['timestamp'] = np.arange(95)
+        with TelemetryWriter(self.path, max_size=size, backup_count=2, batch_size=5) as writer:
+            writer.extend(records)
+        self.assertEqual(writer.rotations, 9)
+        self.assertFalse(backup_path(self.path, 3).exists())
+        kept = [read_records(backup_path(self.path, i))['timestamp'] for i in (2, 1, 0)]
+        np.testing.assert_array_equal(np.concatenate(kept), np.arange(70, 95))
+        for i in (1, 2):
+            self.assertLessEqual(backup_path(self.path, i).stat().st_size, size)
+
+    def test_reopen_appends(self):
+        """Test that a restarted writer continues the file and rejects foreign files."""
+        with TelemetryWriter(self.path) as writer:
+            writer.append(1.0)
+        with TelemetryWriter(self.path) as writer:
+            writer.append(2.0)
+        np.testing.assert_array_equal(read_records(self.path)['timestamp'], [1.0, 2.0])
+        other = self.path.with_name('other.bin')
+        other.write_bytes(b'timestamp,azimuth\n' * 2)
+        with self.assertRaises(ValueError):
+            TelemetryWriter(other)
+
+
+class TestTelemetryReader(unittest.TestCase):
+    """Test cases for memory-mapped telemetry queries."""
+
+    def setUp(self):
+        """Write 1 Hz records across several rotated files."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / 'telemetry.bin'
+        self.records = np.zeros(1000, dtype=TELEMETRY_DTYPE)
+        self.records['timestamp'] = 1704067200.0 + np.arange(1000)
+        self.records['pointing_error'] = np.arange(1000) % 7
+        self.records['signal_strength'] = np.nan
+        self.records['signal_strength'][::2] = -60.0 - np.arange(500) % 5
+        size = HEADER.size + 300 * TELEMETRY_DTYPE.itemsize
+        with TelemetryWriter(self.path, max_size=size, backup_count=5, batch_size=100) as writer:
+            writer.extend(self.records)
+        self.reader = TelemetryReader(self.path)
+
+    def test_slices_are_views(self):
+        """Test time-range slicing inside one file and across a rotation."""
+        self.assertEqual(len(self.reader.files), 4)
+        self.assertEqual(len(self.reader), 1000)
+        self.assertEqual(self.reader.start, 1704067200.0)
+        inside = self.reader.slice(1704067210.0, 1704067250.5)
+        self.assertIsInstance(inside, np.memmap)
+        np.testing.assert_array_equal(inside['timestamp'], self.records['timestamp'][10:51])
+        across = self.reader.slice(1704067490.0, 1704067510.0)
+        np.testing.assert_array_equal(across['timestamp'], self.records['timestamp'][290:310])
+        self.assertEqual(len(self.reader.slice(0.0, 1.0)), 0)
+
+    def test_downsample_matches_numpy(self):
+        """Test per-bucket min/max/mean across files, ignoring NaN."""
+        result = self.reader.downsample(['pointing_error', 'signal_strength'], 60.0)
+        self.assertEqual(len(result['time']), 17)
+        self.assertEqual(result['count'].sum(), 1000)
+        bucket = 5  # 300-359: spans the first rotation boundary
+        expected = self.records[300:360]
+        self.assertEqual(result['count'][bucket], 60)
+        self.assertEqual(result['pointing_error_max'][bucket], expected['pointing_error'].max())
+        self.assertAlmostEqual(result['pointing_error_mean'][bucket], expected['pointing_error'].mean())
+        self.assertAlmostEqual(result['signal_strength_mean'][bucket], np.nanmean(expected['signal_strength']))
+        self.assertEqual(result['signal_strength_min'][bucket], np.nanmin(expected['signal_strength']))
+
+        window = self.reader.downsample(['pointing_error'], 3600.0, 1704067500.0, 1704067600.0)
+        self.assertEqual(window['count'].tolist(), [100])
+        with self.assertRaises(ValueError):
+            self.reader.downsample(['no_such_field'], 60.0)
+
+    def test_replay_cli(self):
+        """Test that main.py --replay summarizes a log without hardware."""
+        result = subprocess.run([sys.executable, str(MAIN), '--replay', str(self.path), '--bucket', '600',
+                                 '--start', '2024-01-01T00:00:00'],
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('2024-01-01 00:10:00      400', result.stdout)
+        self.assertIn('1000 records in 4 file(s)', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()